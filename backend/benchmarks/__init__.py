@@ -0,0 +1,5 @@
+"""
+Offline benchmarks for the scanner, API and export pipeline.
+
+Run from the backend directory: ``python -m benchmarks.run --help``
+"""
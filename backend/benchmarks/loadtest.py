@@ -0,0 +1,252 @@
+"""
+Export Load Test
+
+Ramps up concurrent exports through the real API to find where one export
+node saturates. The local stub viewer stands in for the frontend (synthetic
+Spectacle-like pages with adjustable slide count, asset weight and render
+delay) and exports are rendered by Chromium in this process, as in
+``EXPORT_QUEUE=inline`` mode. Each concurrency step reports:
+
+- throughput of whole exports (enqueue, render, download of the PDF)
+- p50/p95/p99 export latency
+- peak RSS of this process and its descendants (Playwright driver, Chromium)
+- peak browser process count, and the count left when the step ends
+
+The page cache, diagnostic captures and admission limits are off unless
+asked for, so every export renders at full speed and saturation shows as
+latency, not as 429s.
+
+Usage (from the backend directory; needs ``playwright install chromium``):
+    python -m benchmarks.loadtest --steps 1 2 4 8 --jobs-per-worker 4
+    python -m benchmarks.loadtest --slides 30 --asset-kb 2048 --render-delay-ms 500
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from benchmarks.processes import ProcessMonitor
+from benchmarks.results import build_results, metric, save_results
+from benchmarks.run import EXPORT_TIMEOUT, RESULTS_DIR, configure_app, export_pdf, wait_until_ready
+from benchmarks.stats import run_load
+from benchmarks.stub_viewer import StubViewer
+from benchmarks.synthetic import generate_decks
+
+
+async def run_step(
+    client: httpx.AsyncClient,
+    ids: list[str],
+    concurrency: int,
+    jobs: int,
+    sample_interval: float,
+    timeout: float = EXPORT_TIMEOUT,
+) -> dict[str, Any]:
+    """
+    Run exports from ``concurrency`` closed-loop clients and measure the node.
+
+    Args:
+        client: Client bound to the application
+        ids: Presentation ids to export (cycled)
+        concurrency: Exports in flight at once
+        jobs: Exports in this step
+        sample_interval: Seconds between process samples
+        timeout: Seconds an export may take before it counts as failed
+
+    Returns:
+        Step report: counts, throughput, latency percentiles, memory and processes
+    """
+    errors: list[str] = []
+
+    async def export(n: int) -> bool:
+        error = await export_pdf(client, ids[n % len(ids)], timeout=timeout)
+        if error is not None:
+            errors.append(error)
+        return error is None
+
+    async with ProcessMonitor(sample_interval) as monitor:
+        result = await run_load(export, jobs, concurrency)
+
+    summary = result.summary()
+    return {
+        "concurrency": concurrency,
+        "jobs": jobs,
+        "ok": summary["requests"],
+        "errors": summary["errors"],
+        "rejected": sum(1 for error in errors if error == "enqueue returned 429"),
+        "first_error": errors[0] if errors else None,
+        "jobs_per_s": summary["rps"],
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+        "p99_ms": summary["p99_ms"],
+        "peak_rss_mb": _mb(monitor.peak_rss_bytes),
+        "browser_processes": monitor.peak_browser_processes,
+        "browser_processes_after": monitor.last.browser_processes if monitor.last else None,
+    }
+
+
+async def run_ramp(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """Start the stub viewer and the application, then run every concurrency step."""
+    root = workdir / "presentations"
+    generate_decks(root, files=args.presentations, slides=args.slides)
+
+    viewer = StubViewer(
+        slides=args.slides,
+        asset_kb=args.asset_kb,
+        render_delay_ms=args.render_delay_ms,
+    ).start()
+    steps = []
+    try:
+        app = configure_app(workdir, viewer.url)
+        _configure_exports(args)
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                await wait_until_ready(client)
+                listing = await client.get("/api/presentations", params={"limit": 200, "fields": "id"})
+                ids = [p["id"] for p in listing.json()["presentations"]]
+
+                for concurrency in args.steps:
+                    step = await run_step(
+                        client, ids, concurrency, concurrency * args.jobs_per_worker,
+                        args.sample_interval, args.export_timeout
+                    )
+                    steps.append(step)
+                    print(_describe(step))
+                    if step["ok"] == 0:
+                        print(f"stopping: no export succeeded ({step['first_error']})")
+                        break
+    finally:
+        viewer.stop()
+    return steps
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export load test against a local stub viewer")
+    parser.add_argument("--steps", nargs="+", type=int, default=[1, 2, 4, 8], help="Concurrency steps")
+    parser.add_argument("--jobs-per-worker", type=int, default=3, help="Exports per concurrent client per step")
+    parser.add_argument("--presentations", type=int, default=8, help="Distinct presentations exported")
+    parser.add_argument("--slides", type=int, default=10, help="Slides per presentation")
+    parser.add_argument("--asset-kb", type=int, default=256, help="Stub viewer bundle size, KiB")
+    parser.add_argument("--render-delay-ms", type=int, default=100, help="Stub viewer render delay")
+    parser.add_argument("--sample-interval", type=float, default=0.25, help="Seconds between RSS/process samples")
+    parser.add_argument("--export-timeout", type=float, default=EXPORT_TIMEOUT, help="Seconds per export before it fails")
+    parser.add_argument("--page-cache", action="store_true", help="Keep the page cache (repeat exports skip rendering)")
+    parser.add_argument(
+        "--admission", action="store_true",
+        help="Keep the EXPORT_MAX_QUEUED / EXPORT_MAX_ACTIVE limits (rejections are counted)"
+    )
+    parser.add_argument(
+        "--diagnostics", action="store_true",
+        help="Capture trace/HAR of every export (measures the EXPORT_DIAGNOSTICS overhead)"
+    )
+    parser.add_argument("--workdir", type=Path, help="Working directory (default: temporary)")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/loadtest-<timestamp>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the ramp, print a table of the steps and write the results.
+
+    Returns:
+        Exit code: 1 if no export succeeded at any step, otherwise 0
+    """
+    args = parse_args(argv)
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        steps = asyncio.run(run_ramp(args, args.workdir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="vedunya-loadtest-") as tmp:
+            steps = asyncio.run(run_ramp(args, Path(tmp)))
+
+    print(format_steps(steps))
+
+    parameters = {key: value for key, value in vars(args).items() if key not in ("workdir", "output")}
+    results = build_results(step_metrics(steps), parameters)
+    results["steps"] = steps
+    output = args.output or RESULTS_DIR / f"loadtest-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    save_results(results, output)
+    print(f"Results written to {output}")
+    return 0 if any(step["ok"] for step in steps) else 1
+
+
+def step_metrics(steps: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Convert step reports into metric records (``loadtest.c<concurrency>.<name>``).
+
+    Args:
+        steps: Reports returned by run_step()
+
+    Returns:
+        Metrics keyed by name
+    """
+    metrics = {}
+    for step in steps:
+        prefix = f"loadtest.c{step['concurrency']}"
+        metrics[f"{prefix}.per_s"] = metric(step["jobs_per_s"], "per_s")
+        for name in ("p50_ms", "p95_ms", "p99_ms"):
+            metrics[f"{prefix}.{name}"] = metric(step[name], "ms")
+        metrics[f"{prefix}.errors"] = metric(step["errors"], "count")
+        if step["peak_rss_mb"] is not None:
+            metrics[f"{prefix}.peak_rss_mb"] = metric(step["peak_rss_mb"], "mb")
+            metrics[f"{prefix}.browser_processes"] = metric(step["browser_processes"], "count")
+    return metrics
+
+
+def format_steps(steps: list[dict[str, Any]]) -> str:
+    """Render step reports as a fixed-width table."""
+    header = (
+        f"{'conc':>5} {'ok':>5} {'err':>5} {'429':>5} {'jobs/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'RSS MB':>8} {'browsers':>9}"
+    )
+    lines = [header]
+    for step in steps:
+        browsers = "n/a" if step["browser_processes"] is None else (
+            f"{step['browser_processes']}/{step['browser_processes_after']}"
+        )
+        rss = "n/a" if step["peak_rss_mb"] is None else f"{step['peak_rss_mb']:.0f}"
+        lines.append(
+            f"{step['concurrency']:>5} {step['ok']:>5} {step['errors']:>5} {step['rejected']:>5} "
+            f"{step['jobs_per_s']:>8.2f} {step['p50_ms']:>9.0f} {step['p95_ms']:>9.0f} {step['p99_ms']:>9.0f} "
+            f"{rss:>8} {browsers:>9}"
+        )
+    return "\n".join(lines)
+
+
+def _configure_exports(args: argparse.Namespace) -> None:
+    """Apply the page cache, diagnostics and admission settings (before the lifespan runs)."""
+    import config
+
+    if args.diagnostics:
+        config.EXPORT_DIAGNOSTICS = True
+        config.EXPORT_DIAGNOSTICS_SAMPLE_RATE = 1.0
+    if not args.page_cache:
+        config.PAGE_CACHE_MAX_PAGES = 0
+    if not args.admission:
+        config.EXPORT_MAX_QUEUED = sys.maxsize
+        config.EXPORT_MAX_ACTIVE = sys.maxsize
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else round(value / (1024 * 1024), 1)
+
+
+def _describe(step: dict[str, Any]) -> str:
+    """One-line summary of a step."""
+    rss = "n/a" if step["peak_rss_mb"] is None else f"{step['peak_rss_mb']} MB"
+    return (
+        f"concurrency {step['concurrency']}: {step['ok']}/{step['jobs']} ok, {step['rejected']} rejected, "
+        f"{step['jobs_per_s']} jobs/s, p50 {step['p50_ms']} ms, p95 {step['p95_ms']} ms, "
+        f"p99 {step['p99_ms']} ms, peak RSS {rss}, browser processes {step['browser_processes']}"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
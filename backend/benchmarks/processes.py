@@ -0,0 +1,126 @@
+"""
+Process Sampling
+
+Resident memory and process counts of the benchmark process and its
+descendants (the Playwright driver and Chromium's browser, GPU, utility
+and renderer processes), read from ``/proc``. Only available on Linux,
+which is what export nodes run.
+"""
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+PROC = Path("/proc")
+
+# Process names (comm) of Chromium builds Playwright launches
+BROWSER_NAMES = ("chrome", "chromium", "headless_shell")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class ProcessSample:
+    """Resource usage of a process tree at one instant."""
+
+    # Sum of resident set sizes (shared pages are counted once per process)
+    rss_bytes: int
+    processes: int
+    browser_processes: int
+
+
+def sample_tree(root_pid: Optional[int] = None) -> Optional[ProcessSample]:
+    """
+    Measure a process and all of its descendants.
+
+    Args:
+        root_pid: Root of the tree (default: this process)
+
+    Returns:
+        ProcessSample, or None where /proc is not available
+    """
+    if not PROC.is_dir():
+        return None
+    root_pid = os.getpid() if root_pid is None else root_pid
+
+    children: dict[int, list[int]] = {}
+    names: dict[int, str] = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ...": comm may contain spaces and parentheses
+        head, _, rest = stat.rpartition(")")
+        pid = int(entry.name)
+        names[pid] = head.partition("(")[2]
+        children.setdefault(int(rest.split()[1]), []).append(pid)
+
+    tree = [root_pid]
+    pending = [root_pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            tree.append(child)
+            pending.append(child)
+
+    rss_bytes = 0
+    browser_processes = 0
+    for pid in tree:
+        try:
+            rss_bytes += int((PROC / str(pid) / "statm").read_text().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            # Exited since the scan
+            continue
+        if any(name in names.get(pid, "").lower() for name in BROWSER_NAMES):
+            browser_processes += 1
+    return ProcessSample(rss_bytes, len(tree), browser_processes)
+
+
+class ProcessMonitor:
+    """Samples this process tree in the background while a load step runs, keeping the peaks."""
+
+    def __init__(self, interval: float = 0.25):
+        """
+        Initialize process monitor.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self.peak_rss_bytes: Optional[int] = None
+        self.peak_browser_processes: Optional[int] = None
+        self.last: Optional[ProcessSample] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "ProcessMonitor":
+        await self._sample()
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await self._sample()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._sample()
+
+    async def _sample(self) -> None:
+        # Scanning /proc takes milliseconds: keep it off the event loop
+        sample = await asyncio.to_thread(sample_tree)
+        if sample is None:
+            return
+        self.samples += 1
+        self.last = sample
+        self.peak_rss_bytes = max(self.peak_rss_bytes or 0, sample.rss_bytes)
+        self.peak_browser_processes = max(self.peak_browser_processes or 0, sample.browser_processes)
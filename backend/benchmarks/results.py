@@ -0,0 +1,156 @@
+"""
+Benchmark Results
+
+JSON result files and release-to-release comparison.
+
+A result file is ``{"format", "meta", "metrics"}`` where every metric is
+``{"value", "unit", "better"}`` and ``better`` is ``"lower"`` (latency,
+duration) or ``"higher"`` (throughput).
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+
+RESULTS_FORMAT = 1
+
+# Metric suffixes where a larger value is an improvement
+HIGHER_IS_BETTER = ("rps", "per_s")
+
+
+def metric(value: float, unit: str, better: Optional[str] = None) -> dict[str, Any]:
+    """
+    Build a metric record.
+
+    Args:
+        value: Measured value
+        unit: Unit label (ms, s, rps, ...)
+        better: "lower" or "higher"; inferred from the unit when omitted
+
+    Returns:
+        Metric dictionary
+    """
+    if better is None:
+        better = "higher" if unit.endswith(HIGHER_IS_BETTER) else "lower"
+    return {"value": round(float(value), 3), "unit": unit, "better": better}
+
+
+def build_results(metrics: dict[str, dict[str, Any]], parameters: dict[str, Any]) -> dict[str, Any]:
+    """
+    Wrap metrics with environment metadata.
+
+    Args:
+        metrics: Metric records keyed by dotted name (e.g. ``api.list.p95_ms``)
+        parameters: Benchmark parameters (sizes, concurrency, ...)
+
+    Returns:
+        Result document ready for :func:`save_results`
+    """
+    return {
+        "format": RESULTS_FORMAT,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "parameters": parameters,
+        },
+        "metrics": metrics,
+    }
+
+
+def save_results(results: dict[str, Any], path: Path) -> None:
+    """Write a result document as indented JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """
+    Read a result document.
+
+    Raises:
+        ValueError: If the file is not a compatible result document
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("format") != RESULTS_FORMAT or "metrics" not in data:
+        raise ValueError(f"{path} is not a benchmark result file (format {RESULTS_FORMAT})")
+    return data
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = 0.15,
+) -> list[dict[str, Any]]:
+    """
+    Compare metrics present in both result documents.
+
+    Args:
+        baseline: Earlier result document
+        current: New result document
+        tolerance: Relative change treated as noise (0.15 = 15%)
+
+    Returns:
+        One row per shared metric with baseline, current, relative change
+        and ``regression`` set when the metric got worse beyond tolerance
+    """
+    rows = []
+    for name, new in current["metrics"].items():
+        old = baseline["metrics"].get(name)
+        if old is None:
+            continue
+
+        before, after = old["value"], new["value"]
+        if before:
+            change = (after - before) / before
+        else:
+            # Growth from zero (e.g. errors) counts as a full step
+            change = 0.0 if after == before else (1.0 if after > before else -1.0)
+        worse = change > tolerance if new["better"] == "lower" else change < -tolerance
+        rows.append({
+            "metric": name,
+            "unit": new["unit"],
+            "baseline": before,
+            "current": after,
+            "change": round(change, 4),
+            "regression": worse,
+        })
+    return rows
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    """Render comparison rows as an aligned text table."""
+    if not rows:
+        return "No shared metrics to compare"
+
+    width = max(len(row["metric"]) for row in rows)
+    lines = []
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['metric']:<{width}}  {row['baseline']:>12.3f} -> {row['current']:>12.3f} "
+            f"{row['unit']:<4} {row['change']:+8.1%}  {flag}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def _git_revision() -> Optional[str]:
+    """Short git revision of the working tree, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
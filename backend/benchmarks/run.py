@@ -0,0 +1,429 @@
+"""
+Benchmark Runner
+
+Runs the offline benchmark suites and records the results as JSON:
+
+- ``scanner``: cold scan, index reconcile (cold, warm, incremental),
+  snapshot load and search index build over a synthetic tree
+- ``api``: in-process ASGI load against /api/presentations, /api/search
+  and /api/exports status
+- ``export``: end-to-end exports through the API, rendered by Chromium
+  from the local stub viewer (needs ``playwright install chromium``)
+
+Usage (from the backend directory):
+    python -m benchmarks.run --files 500 --slides 12
+    python -m benchmarks.run --suite api --compare benchmarks/results/baseline.json
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+
+from benchmarks.results import (
+    build_results,
+    compare_results,
+    format_comparison,
+    load_results,
+    metric,
+    save_results,
+)
+from benchmarks.stats import LoadResult, run_load
+from benchmarks.stub_viewer import StubViewer
+from benchmarks.synthetic import WORDS, generate_decks, touch_sources
+
+
+SUITES = ("scanner", "api", "export")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Interval between export status polls
+POLL_INTERVAL = 0.05
+# Seconds an export may take before it is counted as failed
+EXPORT_TIMEOUT = 300.0
+
+
+async def bench_scanner(root: Path, data_dir: Path, sources: list[Path]) -> dict[str, dict[str, Any]]:
+    """
+    Time discovery, parsing, index persistence and search indexing.
+
+    Args:
+        root: Synthetic presentations directory
+        data_dir: Directory for the index snapshot
+        sources: Generated sources (used for the incremental reconcile)
+
+    Returns:
+        Metrics keyed by name
+    """
+    from services.presentation_index import PresentationIndex
+    from services.presentation_scanner import PresentationScanner
+    from services.search_index import SearchIndex
+
+    scanner = PresentationScanner(str(root))
+    snapshot = data_dir / "presentation-index.json"
+    snapshot.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    presentations = await scanner.scan_all()
+    scan_s = time.perf_counter() - started
+
+    index = PresentationIndex(scanner, snapshot_path=str(snapshot), reconcile_interval=0)
+    cold_ms = await _timed_ms(index.reconcile())
+    warm_ms = await _timed_ms(index.reconcile())
+
+    touched = touch_sources(sources, max(1, len(sources) // 100))
+    incremental_ms = await _timed_ms(index.reconcile())
+
+    reloaded = PresentationIndex(scanner, snapshot_path=str(snapshot), reconcile_interval=0)
+    started = time.perf_counter()
+    reloaded.load()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    search_index = SearchIndex()
+    search_ms = await _timed_ms(search_index.sync(index))
+
+    print(f"scanner: {len(presentations)} presentations, {len(touched)} touched for incremental reconcile")
+    return {
+        "scanner.scan_all_ms": metric(scan_s * 1000, "ms"),
+        "scanner.files_per_s": metric(len(presentations) / scan_s if scan_s else 0.0, "per_s"),
+        "index.reconcile_cold_ms": metric(cold_ms, "ms"),
+        "index.reconcile_warm_ms": metric(warm_ms, "ms"),
+        "index.reconcile_incremental_ms": metric(incremental_ms, "ms"),
+        "index.snapshot_load_ms": metric(load_ms, "ms"),
+        "search.build_ms": metric(search_ms, "ms"),
+    }
+
+
+async def bench_api(client: httpx.AsyncClient, requests: int, concurrency: int) -> dict[str, dict[str, Any]]:
+    """
+    Load the read endpoints of the API in process.
+
+    Args:
+        client: Client bound to the application
+        requests: Requests per scenario
+        concurrency: Concurrent workers per scenario
+
+    Returns:
+        Metrics keyed by name
+    """
+    from models.schemas import ExportJobStatus
+    from routes.exports import get_export_service
+    from services.job_history import JobRecord
+
+    first = await client.get("/api/presentations", params={"limit": 200, "fields": "id"})
+    first.raise_for_status()
+    ids = [item["id"] for item in first.json()["presentations"]]
+    etag = (await client.get("/api/presentations", params={"limit": 50})).headers.get("etag", "")
+
+    # Finished jobs to poll, as the status endpoint sees them after real exports
+    service = get_export_service()
+    job_ids = []
+    for number in range(50):
+        job = JobRecord(
+            job_id=f"export_bench{number:07d}",
+            presentation_id=ids[number % len(ids)] if ids else "bench",
+            created_at=time.time(),
+            status=ExportJobStatus.COMPLETED,
+            progress=100,
+        )
+        service.jobs.add(job)
+        job_ids.append(job.job_id)
+
+    rng = random.Random(0)
+    scenarios: dict[str, Callable[[int], Any]] = {
+        "list": lambda n: client.get("/api/presentations", params={"limit": 50}),
+        "list_gzip": lambda n: client.get(
+            "/api/presentations", params={"limit": 50}, headers={"Accept-Encoding": "gzip"}
+        ),
+        "list_revalidate": lambda n: client.get(
+            "/api/presentations", params={"limit": 50}, headers={"If-None-Match": etag}
+        ),
+        "list_filtered": lambda n: client.get(
+            "/api/presentations", params={"limit": 20, "sort": "title", "title": f"deck {n % 10}"}
+        ),
+        "detail": lambda n: client.get(f"/api/presentations/{ids[n % len(ids)]}"),
+        "search": lambda n: client.get("/api/search", params={"q": " ".join(rng.sample(WORDS, 2))}),
+        "export_status": lambda n: client.get(f"/api/exports/{job_ids[n % len(job_ids)]}/status"),
+    }
+    expected = {"list_revalidate": 304}
+
+    metrics = {}
+    for name, make_request in scenarios.items():
+        if name == "detail" and not ids:
+            continue
+
+        async def request(n: int, make_request=make_request, code=expected.get(name, 200)) -> bool:
+            return (await make_request(n)).status_code == code
+
+        result = await run_load(request, requests, concurrency)
+        print(f"api.{name}: {_describe(result)}")
+        metrics.update(_load_metrics(f"api.{name}", result))
+
+    for job_id in job_ids:
+        service.jobs.remove(job_id)
+    return metrics
+
+
+async def bench_export(client: httpx.AsyncClient, ids: list[str], jobs: int, concurrency: int) -> dict[str, dict[str, Any]]:
+    """
+    Run exports end to end: enqueue, poll status, download the PDF.
+
+    Args:
+        client: Client bound to the application
+        ids: Presentation ids to export (cycled)
+        jobs: Number of exports
+        concurrency: Exports in flight at once
+
+    Returns:
+        Metrics keyed by name
+    """
+    enqueue_ms: list[float] = []
+    errors: list[str] = []
+
+    async def export(n: int) -> bool:
+        error = await export_pdf(client, ids[n % len(ids)], enqueue_ms)
+        if error is not None:
+            errors.append(error)
+        return error is None
+
+    result = await run_load(export, jobs, concurrency)
+    print(f"export: {_describe(result)}")
+    if errors:
+        print(f"export: first error: {errors[0]}")
+
+    metrics = _load_metrics("export.job", result, throughput_unit="per_s")
+    enqueue = LoadResult(latencies_ms=enqueue_ms, elapsed_s=result.elapsed_s)
+    metrics["export.enqueue.p95_ms"] = metric(enqueue.summary()["p95_ms"], "ms")
+    return metrics
+
+
+async def export_pdf(
+    client: httpx.AsyncClient,
+    presentation_id: str,
+    enqueue_ms: Optional[list[float]] = None,
+    timeout: float = EXPORT_TIMEOUT,
+) -> Optional[str]:
+    """
+    Export one presentation through the API: enqueue, poll status, download the PDF.
+
+    Args:
+        client: Client bound to the application
+        presentation_id: Presentation to export
+        enqueue_ms: Receives the latency of the enqueue request
+        timeout: Seconds to wait for the job to finish (a stuck job, or no
+            worker consuming the queue, must not hang the run)
+
+    Returns:
+        None on success, otherwise a description of the failure
+    """
+    started = time.perf_counter()
+    response = await client.post(f"/api/exports/{presentation_id}/export")
+    if enqueue_ms is not None:
+        enqueue_ms.append((time.perf_counter() - started) * 1000)
+    if response.status_code != 201:
+        return f"enqueue returned {response.status_code}"
+
+    job_id = response.json()["jobId"]
+    deadline = started + timeout
+    while True:
+        await asyncio.sleep(POLL_INTERVAL)
+        job = (await client.get(f"/api/exports/{job_id}/status")).json()["job"]
+        if job["status"] in ("completed", "failed"):
+            break
+        if time.perf_counter() > deadline:
+            return f"timed out after {timeout:g} s ({job['status']})"
+
+    if job["status"] == "failed":
+        return job.get("error") or "failed"
+
+    download = await client.get(f"/api/exports/{job_id}/download")
+    if download.status_code != 200 or not download.content.startswith(b"%PDF"):
+        return f"download returned {download.status_code}"
+    return None
+
+
+async def run_suites(args: argparse.Namespace, workdir: Path) -> dict[str, dict[str, Any]]:
+    """Generate the synthetic tree and run the selected suites."""
+    root = workdir / "presentations"
+    data_dir = workdir / "data"
+    sources = generate_decks(
+        root,
+        files=args.files,
+        slides=args.slides,
+        subdirs=args.subdirs,
+        html_decks=args.html_decks,
+    )
+
+    metrics: dict[str, dict[str, Any]] = {}
+    if "scanner" in args.suite:
+        metrics.update(await bench_scanner(root, data_dir, sources))
+
+    if "api" not in args.suite and "export" not in args.suite:
+        return metrics
+
+    viewer = StubViewer(
+        slides=args.slides,
+        asset_kb=args.asset_kb,
+        render_delay_ms=args.render_delay_ms,
+    ).start()
+    try:
+        app = configure_app(workdir, viewer.url)
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                await wait_until_ready(client)
+                if "api" in args.suite:
+                    metrics.update(await bench_api(client, args.requests, args.concurrency))
+                if "export" in args.suite:
+                    listing = await client.get("/api/presentations", params={"limit": 200, "fields": "id,deckType"})
+                    ids = [p["id"] for p in listing.json()["presentations"] if p["deckType"] == "spectacle"]
+                    metrics.update(await bench_export(client, ids, args.export_jobs, args.export_concurrency))
+    finally:
+        viewer.stop()
+
+    return metrics
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    """Wait for startup warm-up, so cold start is not measured as load."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        report = (await client.get("/api/ready")).json()
+        if report["status"] != "starting":
+            if report["status"] == "failed":
+                print(f"warm-up failed: {report['components']}")
+            return
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+def configure_app(workdir: Path, frontend_url: str):
+    """
+    Point the application at the synthetic tree and the stub viewer.
+
+    The settings are config module constants read by the lifespan, so they are
+    overridden before the lifespan runs. Exports render in process
+    (inline queue) without diagnostic captures, whatever the environment
+    says, so the numbers measure rendering alone. Every request comes
+    from one client, so the per-client export rate limit is disabled, and
+    the per-request access log is silenced.
+
+    Args:
+        workdir: Benchmark working directory
+        frontend_url: Stub viewer base URL
+
+    Returns:
+        The FastAPI application
+    """
+    import config
+    import main
+
+    static_dir = workdir / "static-decks"
+    static_dir.mkdir(parents=True, exist_ok=True)
+
+    config.PRESENTATIONS_DIR = workdir / "presentations"
+    config.STATIC_DECKS_DIR = str(static_dir)
+    config.DATA_DIR = workdir / "app-data"
+    config.EXPORTS_DIR = workdir / "exports"
+    config.PAGE_CACHE_DIR = config.EXPORTS_DIR / "page-cache"
+    config.DIAGNOSTICS_DIR = config.EXPORTS_DIR / "diagnostics"
+    config.JOB_STORE_PATH = config.EXPORTS_DIR / "jobs.sqlite3"
+    config.FRONTEND_URL = frontend_url
+    config.INDEX_RECONCILE_INTERVAL = 0
+    config.EXPORT_QUEUE = "inline"
+    config.EXPORT_DIAGNOSTICS = False
+    config.EXPORT_RATE_LIMIT_PER_MINUTE = 0
+    logging.getLogger("services.telemetry").setLevel(logging.WARNING)
+    return main.app
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the presentation backend")
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES), help="Suites to run")
+    parser.add_argument("--files", type=int, default=200, help="Synthetic presentation files")
+    parser.add_argument("--slides", type=int, default=10, help="Slides per presentation")
+    parser.add_argument("--subdirs", type=int, default=4, help="Subdirectories to spread files over")
+    parser.add_argument("--html-decks", type=int, default=2, help="Static HTML decks")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per API scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent API clients")
+    parser.add_argument("--export-jobs", type=int, default=6, help="Exports in the export suite")
+    parser.add_argument("--export-concurrency", type=int, default=2, help="Exports in flight at once")
+    parser.add_argument("--asset-kb", type=int, default=256, help="Stub viewer bundle size, KiB")
+    parser.add_argument("--render-delay-ms", type=int, default=100, help="Stub viewer render delay")
+    parser.add_argument("--workdir", type=Path, help="Working directory (default: temporary)")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="Baseline result file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Relative change treated as noise")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run benchmarks, write results and optionally compare with a baseline.
+
+    Returns:
+        Exit code: 1 if the comparison found regressions, otherwise 0
+    """
+    args = parse_args(argv)
+    baseline = load_results(args.compare) if args.compare else None
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        metrics = asyncio.run(run_suites(args, args.workdir))
+    else:
+        with tempfile.TemporaryDirectory(prefix="vedunya-bench-") as tmp:
+            metrics = asyncio.run(run_suites(args, Path(tmp)))
+
+    parameters = {
+        key: value for key, value in vars(args).items()
+        if key not in ("workdir", "output", "compare", "tolerance")
+    }
+    results = build_results(metrics, parameters)
+    output = args.output or RESULTS_DIR / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    save_results(results, output)
+    print(f"Results written to {output}")
+
+    if baseline is None:
+        return 0
+
+    rows = compare_results(baseline, results, tolerance=args.tolerance)
+    print(format_comparison(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+async def _timed_ms(awaitable) -> float:
+    """Await and return the elapsed time in milliseconds."""
+    started = time.perf_counter()
+    await awaitable
+    return (time.perf_counter() - started) * 1000
+
+
+def _load_metrics(prefix: str, result: LoadResult, throughput_unit: str = "rps") -> dict[str, dict[str, Any]]:
+    """Convert a load run into throughput, latency and error metrics."""
+    summary = result.summary()
+    return {
+        f"{prefix}.{throughput_unit}": metric(summary["rps"], throughput_unit),
+        f"{prefix}.p50_ms": metric(summary["p50_ms"], "ms"),
+        f"{prefix}.p95_ms": metric(summary["p95_ms"], "ms"),
+        f"{prefix}.p99_ms": metric(summary["p99_ms"], "ms"),
+        f"{prefix}.errors": metric(summary["errors"], "count"),
+    }
+
+
+def _describe(result: LoadResult) -> str:
+    """One-line summary of a load run."""
+    summary = result.summary()
+    return (
+        f"{summary['requests']} ok, {summary['errors']} errors, {summary['rps']} req/s, "
+        f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark Statistics
+
+Latency percentiles and a closed-loop load runner for in-process
+ASGI requests.
+"""
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one load run."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return len(self.latencies_ms) / self.elapsed_s if self.elapsed_s else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Throughput, error count and latency percentiles."""
+        return {
+            "requests": len(self.latencies_ms),
+            "errors": self.errors,
+            "rps": round(self.throughput, 2),
+            **summarize(self.latencies_ms),
+        }
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples (need not be sorted)
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        Percentile value (0.0 for no samples)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms: list[float]) -> dict[str, float]:
+    """
+    Summarize latency samples.
+
+    Args:
+        latencies_ms: Latencies in milliseconds
+
+    Returns:
+        Dictionary with mean_ms, p50_ms, p95_ms, p99_ms and max_ms
+    """
+    if not latencies_ms:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {
+        "mean_ms": round(sum(latencies_ms) / len(latencies_ms), 3),
+        "p50_ms": round(percentile(latencies_ms, 0.50), 3),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 3),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 3),
+        "max_ms": round(max(latencies_ms), 3),
+    }
+
+
+async def run_load(
+    request: Callable[[int], Awaitable[bool]],
+    total: int,
+    concurrency: int,
+) -> LoadResult:
+    """
+    Issue ``total`` requests from ``concurrency`` closed-loop workers.
+
+    Args:
+        request: Coroutine factory taking the request number and returning
+            True on success
+        total: Number of requests to issue
+        concurrency: Number of concurrent workers
+
+    Returns:
+        LoadResult with per-request latencies of successful requests
+    """
+    result = LoadResult()
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        for number in counter:
+            started = time.perf_counter()
+            try:
+                ok = await request(number)
+            except Exception:
+                ok = False
+            if ok:
+                result.latencies_ms.append((time.perf_counter() - started) * 1000)
+            else:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    result.elapsed_s = time.perf_counter() - started
+    return result
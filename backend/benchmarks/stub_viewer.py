@@ -0,0 +1,160 @@
+"""
+Stub Viewer
+
+Local stand-in for the Vite frontend. Serves ``/view/{id}?print=true``
+pages that render Spectacle-like ``.spectacle-v7-slide`` markup, so
+ExportService can be exercised end to end without Node or network.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+
+VIEW_PAGE = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  html, body {{ margin: 0; background: #050505; }}
+  .spectacle-v7-slide {{
+    width: 1920px; height: 1080px; box-sizing: border-box; padding: 80px;
+    background: #050505; color: #fff; font: 48px sans-serif;
+    page-break-after: always; break-after: page;
+  }}
+  .spectacle-v7-slide h1 {{ color: #00FF9D; font-size: 96px; }}
+</style>
+<script src="/assets/bundle.js"></script>
+</head>
+<body>
+<div id="root"></div>
+<script>
+  // Mimics the SPA: slides appear only after the bundle has "rendered"
+  setTimeout(function () {{
+    var root = document.getElementById("root");
+    for (var n = 1; n <= {slides}; n++) {{
+      var slide = document.createElement("div");
+      slide.className = "spectacle-v7-slide";
+      slide.innerHTML = "<h1>{title} " + n + "</h1><p>Synthetic slide " + n + " of {slides}</p>";
+      root.appendChild(slide);
+    }}
+  }}, {delay_ms});
+</script>
+</body>
+</html>
+"""
+
+
+class StubViewer:
+    """Threaded HTTP server serving synthetic presentation viewer pages."""
+
+    def __init__(
+        self,
+        slides: int = 5,
+        asset_kb: int = 0,
+        render_delay_ms: int = 0,
+        slides_for: Optional[dict[str, int]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize stub viewer.
+
+        Args:
+            slides: Slide count of presentations not listed in slides_for
+            asset_kb: Size of the JS bundle every page loads, in KiB
+            render_delay_ms: Delay before slides are inserted into the page
+            slides_for: Per-presentation slide counts
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.slides = slides
+        self.asset_kb = asset_kb
+        self.render_delay_ms = render_delay_ms
+        self.slides_for = slides_for or {}
+        self.requests = 0
+
+        handler = type("Handler", (_Handler,), {"viewer": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to ExportService as frontend_url."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubViewer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-viewer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubViewer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def render_page(self, presentation_id: str) -> bytes:
+        """
+        Build the viewer page for a presentation.
+
+        Args:
+            presentation_id: Presentation identifier from the URL
+
+        Returns:
+            UTF-8 encoded HTML document
+        """
+        slides = self.slides_for.get(presentation_id, self.slides)
+        title = presentation_id.replace("<", "").replace('"', "")
+        return VIEW_PAGE.format(title=title, slides=slides, delay_ms=self.render_delay_ms).encode("utf-8")
+
+    def asset_body(self) -> bytes:
+        """Build the synthetic JS bundle of asset_kb KiB."""
+        line = b"/* synthetic bundle padding */\n"
+        size = self.asset_kb * 1024
+        return (line * (size // len(line) + 1))[:size]
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler bound to a StubViewer via the ``viewer`` attribute."""
+
+    viewer: StubViewer
+
+    def do_GET(self) -> None:
+        self.viewer._count_request()
+        path = urlsplit(self.path).path
+
+        if path.startswith("/view/"):
+            self._send(200, "text/html; charset=utf-8", self.viewer.render_page(unquote(path[len("/view/"):])))
+        elif path == "/assets/bundle.js":
+            self._send(200, "application/javascript", self.viewer.asset_body())
+        else:
+            self._send(404, "text/plain", b"Not found")
+
+    def _send(self, code: int, content_type: str, body: bytes) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep benchmark output readable
+        pass
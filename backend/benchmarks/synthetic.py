@@ -0,0 +1,145 @@
+"""
+Synthetic Decks
+
+Generates presentation trees of a given size for benchmarking the
+scanner and index: Spectacle TSX modules shaped like the real ones
+(theme constants, styled components, text-heavy slides) and optional
+static HTML decks.
+"""
+import random
+from pathlib import Path
+
+
+WORDS = (
+    "презентация продукт рынок клиент выручка рост команда стратегия платформа "
+    "данные аналитика сервис интеграция roadmap pricing launch metrics revenue "
+    "growth pipeline insight partner architecture release quality"
+).split()
+
+TSX_HEADER = """import {{ Deck, Slide, Heading, Text, FlexBox }} from 'spectacle';
+
+const brandColors = {{
+  black: '#050505',
+  mint: '#00FF9D',
+  white: '#FFFFFF',
+}};
+
+export const metadata = {{
+  id: '{id}',
+  title: '{title}',
+  description: '{description}',
+  createdAt: '{created}',
+  updatedAt: '{updated}',
+}};
+
+export default function Presentation() {{
+  return (
+    <Deck>
+"""
+
+TSX_SLIDE = """      <Slide backgroundColor={{brandColors.black}}>
+        <FlexBox flexDirection="column" style={{{{ padding: 80, gap: 24 }}}}>
+          <Heading color={{brandColors.mint}}>{heading}</Heading>
+          <Text color={{brandColors.white}}>{text}</Text>
+        </FlexBox>
+      </Slide>
+"""
+
+TSX_FOOTER = """    </Deck>
+  );
+}
+"""
+
+HTML_SLIDE = """<!DOCTYPE html>
+<html lang="ru">
+<head><meta charset="utf-8"><title>{title}</title>
+<style>body {{ margin: 0; width: 1920px; height: 1080px; background: #050505; color: #fff; }}</style>
+</head>
+<body><h1>{heading}</h1><p>{text}</p></body>
+</html>
+"""
+
+
+def generate_decks(
+    root: Path,
+    files: int,
+    slides: int,
+    subdirs: int = 0,
+    html_decks: int = 0,
+    words_per_slide: int = 40,
+    seed: int = 0,
+) -> list[Path]:
+    """
+    Write a synthetic presentations tree.
+
+    Args:
+        root: Presentations directory to create
+        files: Number of TSX presentation modules
+        slides: Number of slides per presentation
+        subdirs: Spread modules over this many subdirectories (0 keeps them flat)
+        html_decks: Number of static ``<deck>/slideN.html`` directories
+        words_per_slide: Words of body text per slide
+        seed: Random seed, so runs with equal parameters write equal trees
+
+    Returns:
+        Paths of the generated presentation sources
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    sources = []
+
+    for index in range(files):
+        directory = root / f"team-{index % subdirs:02d}" if subdirs else root
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"deck-{index:05d}"
+        body = "".join(
+            TSX_SLIDE.format(heading=_sentence(rng, 4), text=_sentence(rng, words_per_slide))
+            for _ in range(slides)
+        )
+        content = TSX_HEADER.format(
+            id=stem,
+            title=f"Deck {index} {_sentence(rng, 3)}",
+            description=_sentence(rng, 12),
+            created=f"2025-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            updated=f"2025-{(index + 3) % 12 + 1:02d}-{index % 28 + 1:02d}",
+        ) + body + TSX_FOOTER
+
+        file_path = directory / f"{stem}.tsx"
+        file_path.write_text(content, encoding="utf-8")
+        sources.append(file_path)
+
+    for index in range(html_decks):
+        deck_dir = root / f"html-deck-{index:03d}"
+        deck_dir.mkdir(parents=True, exist_ok=True)
+        title = f"HTML deck {index}"
+        for number in range(1, slides + 1):
+            (deck_dir / f"slide{number}.html").write_text(
+                HTML_SLIDE.format(title=title, heading=_sentence(rng, 4), text=_sentence(rng, words_per_slide)),
+                encoding="utf-8"
+            )
+        sources.append(deck_dir)
+
+    return sources
+
+
+def touch_sources(sources: list[Path], count: int) -> list[Path]:
+    """
+    Modify the first ``count`` TSX sources so the next reconcile re-parses them.
+
+    Args:
+        sources: Paths returned by :func:`generate_decks`
+        count: Number of sources to modify
+
+    Returns:
+        Modified paths
+    """
+    touched = [source for source in sources if source.is_file()][:count]
+    for source in touched:
+        with open(source, "a", encoding="utf-8") as f:
+            f.write("// touched\n")
+    return touched
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    """Build a pseudo-random sentence from the benchmark vocabulary."""
+    return " ".join(rng.choice(WORDS) for _ in range(length))
@@ -0,0 +1,143 @@
+"""
+Vedunya Presentation Builder - Configuration
+
+Environment settings shared by the API (main) and export workers
+(services.export_worker), and the services both build from them.
+"""
+import os
+from pathlib import Path
+from typing import Optional
+
+from services.diagnostics import DiagnosticsStore
+from services.page_cache import PageCache
+from services.presentation_scanner import PresentationScanner
+
+
+# Configuration
+BASE_DIR = Path(__file__).resolve().parent
+EXPORTS_DIR = BASE_DIR / "exports"
+# Persistent data (presentation index snapshot) - mount as a volume in Docker
+DATA_DIR = Path(os.getenv("DATA_DIR", str(BASE_DIR / "data")))
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
+
+# Presentations directory - configurable for Docker deployment
+# Default: ../frontend/src/presentations (for local dev)
+PRESENTATIONS_DIR = Path(os.getenv(
+    "PRESENTATIONS_DIR",
+    str(BASE_DIR.parent / "frontend" / "src" / "presentations")
+))
+
+# Recursive discovery: subdirectories namespace presentation ids (e.g. "team-a/deck")
+PRESENTATIONS_RECURSIVE = os.getenv("PRESENTATIONS_RECURSIVE", "true").lower() == "true"
+# Comma-separated glob patterns on relative paths, e.g. "team-*/*.tsx"
+PRESENTATIONS_INCLUDE = [p for p in os.getenv("PRESENTATIONS_INCLUDE", "").split(",") if p]
+PRESENTATIONS_EXCLUDE = [p for p in os.getenv("PRESENTATIONS_EXCLUDE", "").split(",") if p] or None
+
+# Static HTML decks (subdirectories with slideN.html), e.g. Vedunya_presentation/
+STATIC_DECKS_DIR = os.getenv(
+    "STATIC_DECKS_DIR",
+    str(BASE_DIR.parent / "frontend" / "public")
+)
+
+# Number of static HTML slides rendered in parallel per export
+HTML_EXPORT_CONCURRENCY = int(os.getenv("HTML_EXPORT_CONCURRENCY", "4"))
+
+# Seconds between background index reconciles with the presentations directory
+INDEX_RECONCILE_INTERVAL = float(os.getenv("INDEX_RECONCILE_INTERVAL", "30"))
+
+# Start Chromium and print a test page on startup (reported by /api/ready)
+EXPORT_WARMUP = os.getenv("EXPORT_WARMUP", "true").lower() == "true"
+
+# "inline": render exports in the API process (local dev)
+# "external": only enqueue; export workers (python -m services.export_worker) render
+EXPORT_QUEUE = os.getenv("EXPORT_QUEUE", "inline").lower()
+# Finished export jobs kept in memory (inline queue); older jobs and their PDFs are dropped
+EXPORT_HISTORY_SIZE = int(os.getenv("EXPORT_HISTORY_SIZE", "1000"))
+# Shared job queue/store, next to the PDFs on the exports volume
+JOB_STORE_PATH = Path(os.getenv("JOB_STORE_PATH", str(EXPORTS_DIR / "jobs.sqlite3")))
+# External queue: /api/ready checks every WORKER_CHECK_INTERVAL seconds that a
+# worker heartbeated within WORKER_HEARTBEAT_TIMEOUT seconds
+WORKER_HEARTBEAT_TIMEOUT = float(os.getenv("WORKER_HEARTBEAT_TIMEOUT", "30"))
+WORKER_CHECK_INTERVAL = float(os.getenv("WORKER_CHECK_INTERVAL", "10"))
+
+# Logging: LOG_FORMAT=json (one object per line, with request/job ids) or text
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+
+# Secret for X-Profile-Token profiling and /api/debug; unset disables both
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN") or None
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5"))
+# Captured profiles, on the exports volume so workers' profiles are visible too
+PROFILES_DIR = Path(os.getenv("PROFILES_DIR", str(EXPORTS_DIR / "profiles")))
+
+# PDF downloads: "direct" streams files through uvicorn; "accel" returns an
+# X-Accel-Redirect to an internal nginx location serving the exports volume
+EXPORT_DOWNLOAD_MODE = os.getenv("EXPORT_DOWNLOAD_MODE", "direct").lower()
+EXPORT_ACCEL_PREFIX = os.getenv("EXPORT_ACCEL_PREFIX", "/internal/exports/")
+
+# Console and timing capture of exports that fail or take longer than
+# EXPORT_SLOW_MS; the newest EXPORT_DIAGNOSTICS_KEEP captures are kept.
+# Tracing and the HAR cost every recorded render, so only a sampled fraction
+# of jobs records them; screenshots/DOM snapshots cost much more again
+EXPORT_DIAGNOSTICS = os.getenv("EXPORT_DIAGNOSTICS", "true").lower() == "true"
+EXPORT_DIAGNOSTICS_SAMPLE_RATE = float(os.getenv("EXPORT_DIAGNOSTICS_SAMPLE_RATE", "0.1"))
+EXPORT_DIAGNOSTICS_SNAPSHOTS = os.getenv("EXPORT_DIAGNOSTICS_SNAPSHOTS", "false").lower() == "true"
+EXPORT_SLOW_MS = float(os.getenv("EXPORT_SLOW_MS", "30000"))
+EXPORT_DIAGNOSTICS_KEEP = int(os.getenv("EXPORT_DIAGNOSTICS_KEEP", "20"))
+DIAGNOSTICS_DIR = Path(os.getenv("DIAGNOSTICS_DIR", str(EXPORTS_DIR / "diagnostics")))
+
+# Export creation limits: per-client token bucket (0 disables), and global
+# limits on jobs waiting / waiting or rendering (answered with 429)
+EXPORT_RATE_LIMIT_PER_MINUTE = float(os.getenv("EXPORT_RATE_LIMIT_PER_MINUTE", "10"))
+EXPORT_RATE_LIMIT_BURST = int(os.getenv("EXPORT_RATE_LIMIT_BURST", "5"))
+EXPORT_MAX_QUEUED = int(os.getenv("EXPORT_MAX_QUEUED", "50"))
+EXPORT_MAX_ACTIVE = int(os.getenv("EXPORT_MAX_ACTIVE", "100"))
+# Identify clients by X-Real-IP (only behind the bundled nginx, which sets it)
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+
+# Version of the viewer/frontend build in page cache keys (e.g. the frontend
+# image tag or git sha, set at build/deploy time). Unset: fingerprint the
+# viewer's index.html, which names the content-hashed bundles of the build
+RENDER_VERSION = os.getenv("RENDER_VERSION") or None
+
+# Rendered slide pages reused by incremental exports (0 disables the cache)
+PAGE_CACHE_DIR = Path(os.getenv("PAGE_CACHE_DIR", str(EXPORTS_DIR / "page-cache")))
+PAGE_CACHE_MAX_PAGES = int(os.getenv("PAGE_CACHE_MAX_PAGES", "2000"))
+
+# Opt-in speculative pre-rendering of added/modified presentations; exports of
+# unchanged sources are then answered with the ready PDF
+PRERENDER = os.getenv("PRERENDER", "false").lower() == "true"
+# Seconds a presentation must stay unchanged before it is pre-rendered
+PRERENDER_DEBOUNCE = float(os.getenv("PRERENDER_DEBOUNCE", "10"))
+PRERENDER_CONCURRENCY = int(os.getenv("PRERENDER_CONCURRENCY", "1"))
+
+
+def create_scanner() -> PresentationScanner:
+    """Create the presentation scanner from configuration (API and export workers)."""
+    return PresentationScanner(
+        str(PRESENTATIONS_DIR),
+        recursive=PRESENTATIONS_RECURSIVE,
+        include=PRESENTATIONS_INCLUDE,
+        exclude=PRESENTATIONS_EXCLUDE,
+        static_decks_dir=STATIC_DECKS_DIR
+    )
+
+
+def create_diagnostics() -> Optional[DiagnosticsStore]:
+    """Create the store of export diagnostics (None when disabled)."""
+    if not EXPORT_DIAGNOSTICS:
+        return None
+    return DiagnosticsStore(
+        str(DIAGNOSTICS_DIR),
+        slow_ms=EXPORT_SLOW_MS,
+        max_jobs=EXPORT_DIAGNOSTICS_KEEP,
+        sample_rate=EXPORT_DIAGNOSTICS_SAMPLE_RATE,
+        snapshots=EXPORT_DIAGNOSTICS_SNAPSHOTS
+    )
+
+
+def create_page_cache() -> Optional[PageCache]:
+    """Create the slide page cache from configuration (API and export workers)."""
+    if PAGE_CACHE_MAX_PAGES <= 0:
+        return None
+    return PageCache(str(PAGE_CACHE_DIR), max_pages=PAGE_CACHE_MAX_PAGES)
@@ -3,31 +3,84 @@ Vedunya Presentation Builder - FastAPI Backend
 
 Main application entry point.
 """
-import os
-from pathlib import Path
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
-from models.schemas import HealthResponse
-from services.presentation_scanner import PresentationScanner
+import config
+from models.schemas import HealthResponse, ReadinessResponse
+from services.admission import AdmissionPolicy, RateLimiter
+from services.presentation_index import PresentationIndex
+from services.search_index import SearchIndex
 from services.export_service import ExportService
-from routes.presentations import router as presentations_router, set_scanner
+from services.job_store import JobStore
+from services.prerender import Prerenderer
+from services.readiness import ReadinessTracker
+from services.profiler import ProfileStore
+from services.telemetry import RouteStats, TimingMiddleware, configure_logging
+from routes.presentations import router as presentations_router, set_index, set_scanner
 from routes.exports import router as exports_router, set_export_service
+from routes.search import router as search_router, set_search_index
+from routes.debug import router as debug_router, set_debug_state
 
 
-# Configuration
-BASE_DIR = Path(__file__).resolve().parent
-EXPORTS_DIR = BASE_DIR / "exports"
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
+# Warm-up state of index, search and renderer
+readiness = ReadinessTracker()
 
-# Presentations directory - configurable for Docker deployment
-# Default: ../frontend/src/presentations (for local dev)
-PRESENTATIONS_DIR = Path(os.getenv(
-    "PRESENTATIONS_DIR",
-    str(BASE_DIR.parent / "frontend" / "src" / "presentations")
-))
+# Per-route latency statistics and captured profiles
+route_stats = RouteStats()
+profile_store = ProfileStore(str(config.PROFILES_DIR))
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up(
+    index: PresentationIndex,
+    search_index: SearchIndex,
+    export_service: ExportService,
+) -> None:
+    """
+    Prime the presentation and search indexes and pre-start the renderer.
+
+    Args:
+        index: Presentation index
+        search_index: Search index fed by the presentation index
+        export_service: Export service whose browser is started
+    """
+    await readiness.retry("index", index.list_presentations)
+    await readiness.retry("search", lambda: search_index.sync(index))
+
+    if export_service.job_store is not None:
+        # Workers come and go: keep checking their heartbeats
+        await readiness.watch(
+            "renderer", lambda: check_export_workers(export_service.job_store), config.WORKER_CHECK_INTERVAL
+        )
+    elif config.EXPORT_WARMUP:
+        await readiness.retry("renderer", export_service.warm_up)
+    else:
+        readiness.skip("renderer", "Disabled by EXPORT_WARMUP=false")
+
+
+async def check_export_workers(store: JobStore) -> str:
+    """
+    Check that export workers are consuming the queue.
+
+    Args:
+        store: Shared job store the workers heartbeat into
+
+    Returns:
+        Number of live workers, as a readiness detail
+
+    Raises:
+        RuntimeError: If no worker heartbeated within WORKER_HEARTBEAT_TIMEOUT
+    """
+    live = await asyncio.to_thread(store.live_workers, config.WORKER_HEARTBEAT_TIMEOUT)
+    if not live:
+        raise RuntimeError(f"No export worker heartbeat in the last {config.WORKER_HEARTBEAT_TIMEOUT:.0f} s")
+    return f"{live} export worker(s) alive"
 
 
 # Lifespan context manager for startup/shutdown
@@ -35,27 +88,84 @@ PRESENTATIONS_DIR = Path(os.getenv(
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    print("Starting Vedunya Presentation Builder API...")
+    configure_logging(config.LOG_LEVEL, json_format=config.LOG_FORMAT == "json")
+    logger.info("Starting Vedunya Presentation Builder API...")
 
     # Initialize services
-    scanner = PresentationScanner(str(PRESENTATIONS_DIR))
+    scanner = config.create_scanner()
+    index = PresentationIndex(
+        scanner,
+        snapshot_path=str(config.DATA_DIR / "presentation-index.json"),
+        reconcile_interval=config.INDEX_RECONCILE_INTERVAL
+    )
+    search_index = SearchIndex()
+    index.add_listener(search_index.sync)
+    diagnostics = config.create_diagnostics()
     export_service = ExportService(
-        frontend_url=FRONTEND_URL,
-        exports_dir=str(EXPORTS_DIR)
+        frontend_url=config.FRONTEND_URL,
+        exports_dir=str(config.EXPORTS_DIR),
+        scanner=scanner,
+        html_concurrency=config.HTML_EXPORT_CONCURRENCY,
+        job_store=JobStore(str(config.JOB_STORE_PATH)) if config.EXPORT_QUEUE == "external" else None,
+        profile_store=profile_store,
+        page_cache=config.create_page_cache(),
+        reuse_exports=config.PRERENDER,
+        history_size=config.EXPORT_HISTORY_SIZE,
+        diagnostics=diagnostics,
+        render_version=config.RENDER_VERSION,
+        fingerprint_viewer=config.RENDER_VERSION is None
     )
+    prerenderer = None
+    if config.PRERENDER:
+        prerenderer = Prerenderer(
+            export_service, debounce=config.PRERENDER_DEBOUNCE, concurrency=config.PRERENDER_CONCURRENCY
+        )
+        index.add_listener(prerenderer.sync)
+    await index.start()
 
     # Set service instances in routers
     set_scanner(scanner)
-    set_export_service(export_service)
+    set_index(index)
+    set_search_index(search_index, index)
+    set_export_service(
+        export_service,
+        profiling_token=config.PROFILING_TOKEN,
+        accel_redirect_prefix=config.EXPORT_ACCEL_PREFIX if config.EXPORT_DOWNLOAD_MODE == "accel" else None,
+        index=index,
+        rate_limiter=(
+            RateLimiter(config.EXPORT_RATE_LIMIT_PER_MINUTE, config.EXPORT_RATE_LIMIT_BURST)
+            if config.EXPORT_RATE_LIMIT_PER_MINUTE > 0 else None
+        ),
+        admission=AdmissionPolicy(max_queued=config.EXPORT_MAX_QUEUED, max_active=config.EXPORT_MAX_ACTIVE),
+        trust_proxy=config.TRUST_PROXY_HEADERS
+    )
+    set_debug_state(route_stats, profile_store, config.PROFILING_TOKEN, export_service, diagnostics)
+
+    logger.info("Presentations directory: %s", config.PRESENTATIONS_DIR)
+    logger.info("Exports directory: %s", config.EXPORTS_DIR)
+    logger.info("Index snapshot: %s (%s)", index.snapshot_path, "loaded" if index.ready else "building")
+    logger.info("Frontend URL: %s", config.FRONTEND_URL)
+    logger.info("Export queue: %s%s", config.EXPORT_QUEUE, f" ({config.JOB_STORE_PATH})" if export_service.job_store else "")
+    logger.info("Export downloads: %s", config.EXPORT_DOWNLOAD_MODE)
+    logger.info("Profiling: %s", "enabled" if config.PROFILING_TOKEN else "disabled")
+    logger.info("Pre-rendering: %s", "enabled" if config.PRERENDER else "disabled")
 
-    print(f"Presentations directory: {PRESENTATIONS_DIR}")
-    print(f"Exports directory: {EXPORTS_DIR}")
-    print(f"Frontend URL: {FRONTEND_URL}")
+    # Warm up in the background; /api/ready reports progress
+    readiness.reset(["index", "search", "renderer"])
+    warmup_task = asyncio.create_task(warm_up(index, search_index, export_service))
 
     yield
 
     # Shutdown
-    print("Shutting down...")
+    logger.info("Shutting down...")
+    warmup_task.cancel()
+    try:
+        await warmup_task
+    except asyncio.CancelledError:
+        pass
+    await index.stop()
+    if prerenderer is not None:
+        await prerenderer.stop()
     await export_service.close()
 
 
@@ -80,11 +190,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID", "X-Profile-Id"],
+)
+
+# Request ids, Server-Timing, per-route latency and X-Profile-Token profiling
+app.add_middleware(
+    TimingMiddleware,
+    stats=route_stats,
+    profile_store=profile_store,
+    profiling_token=config.PROFILING_TOKEN,
+    sample_interval=config.PROFILE_SAMPLE_INTERVAL_MS / 1000,
 )
 
 # Include routers
 app.include_router(presentations_router)
 app.include_router(exports_router)
+app.include_router(search_router)
+app.include_router(debug_router)
 
 
 # Root endpoints
@@ -106,6 +228,28 @@ async def health_check() -> HealthResponse:
     )
 
 
+@app.get(
+    "/api/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Warm-up pending or failed"}},
+    summary="Readiness check"
+)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """
+    Report whether the service can serve and export quickly.
+
+    Unlike /api/health (process liveness), this returns 503 until the
+    presentation index, search index and renderer have been warmed up.
+
+    Returns:
+        ReadinessResponse: Overall status and per-component state
+    """
+    report = readiness.report()
+    if report.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
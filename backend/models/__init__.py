@@ -2,21 +2,43 @@
 Data models for Vedunya Presentation Builder API.
 """
 from .schemas import (
+    DeckType,
     Presentation,
     PresentationList,
+    PresentationSortField,
+    SortOrder,
+    SearchResult,
+    SearchResponse,
     ExportJob,
     ExportJobStatus,
+    ExportOutput,
+    ExportOutputFormat,
     ExportRequest,
     ExportStatusResponse,
+    ExportStatusBatchResponse,
     HealthResponse,
+    ComponentState,
+    ComponentStatus,
+    ReadinessResponse,
 )
 
 __all__ = [
+    "DeckType",
     "Presentation",
     "PresentationList",
+    "PresentationSortField",
+    "SortOrder",
+    "SearchResult",
+    "SearchResponse",
     "ExportJob",
     "ExportJobStatus",
+    "ExportOutput",
+    "ExportOutputFormat",
     "ExportRequest",
     "ExportStatusResponse",
+    "ExportStatusBatchResponse",
     "HealthResponse",
+    "ComponentState",
+    "ComponentStatus",
+    "ReadinessResponse",
 ]
@@ -3,8 +3,20 @@ Pydantic models for API request/response schemas.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Optional, Union
+from pydantic import BaseModel, Field, model_validator
+
+
+# Largest rendered image of an output (8K): width * scale x height * scale pixels
+MAX_IMAGE_WIDTH = 7680
+MAX_IMAGE_HEIGHT = 4320
+
+
+class DeckType(str, Enum):
+    """Presentation source type enum."""
+
+    SPECTACLE = "spectacle"
+    HTML = "html"
 
 
 class Presentation(BaseModel):
@@ -17,6 +29,11 @@ class Presentation(BaseModel):
     created_at: str = Field(..., description="Creation date (ISO format)", serialization_alias="createdAt")
     updated_at: str = Field(..., description="Last update date (ISO format)", serialization_alias="updatedAt")
     file_path: str = Field(..., description="Relative file path", serialization_alias="filePath")
+    deck_type: DeckType = Field(
+        DeckType.SPECTACLE,
+        description="Source type: Spectacle TSX module or static slideN.html directory",
+        serialization_alias="deckType"
+    )
 
     class Config:
         populate_by_name = True
@@ -28,7 +45,8 @@ class Presentation(BaseModel):
                 "slideCount": 4,
                 "createdAt": "2025-12-10T00:00:00Z",
                 "updatedAt": "2025-12-10T00:00:00Z",
-                "filePath": "presentations/welcome.tsx"
+                "filePath": "presentations/welcome.tsx",
+                "deckType": "spectacle"
             }
         }
 
@@ -37,9 +55,11 @@ class PresentationList(BaseModel):
     """List of presentations response."""
 
     presentations: list[Presentation] = Field(default_factory=list, description="List of available presentations")
-    total: int = Field(..., ge=0, description="Total number of presentations")
+    total: int = Field(..., ge=0, description="Total number of presentations matching the filters")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)", serialization_alias="nextCursor")
 
     class Config:
+        populate_by_name = True
         json_schema_extra = {
             "example": {
                 "presentations": [
@@ -53,11 +73,65 @@ class PresentationList(BaseModel):
                         "file_path": "presentations/welcome.tsx"
                     }
                 ],
+                "total": 1,
+                "nextCursor": None
+            }
+        }
+
+
+class SearchResult(BaseModel):
+    """Single ranked search hit."""
+
+    presentation: Presentation = Field(..., description="Matching presentation")
+    score: float = Field(..., description="Relevance score (higher is better)")
+    slide: Optional[int] = Field(None, ge=1, description="First slide (1-based) containing a query term")
+
+
+class SearchResponse(BaseModel):
+    """Search results response."""
+
+    query: str = Field(..., description="Original query string")
+    results: list[SearchResult] = Field(default_factory=list, description="Ranked results")
+    total: int = Field(..., ge=0, description="Total number of matching presentations")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "безопасность",
+                "results": [
+                    {
+                        "presentation": {
+                            "id": "vedunya-product",
+                            "title": "Ведунья — Корпоративный ИИ",
+                            "slideCount": 7,
+                            "createdAt": "2025-12-10",
+                            "updatedAt": "2025-12-10",
+                            "filePath": "presentations/vedunya-product.tsx"
+                        },
+                        "score": 4.2173,
+                        "slide": 2
+                    }
+                ],
                 "total": 1
             }
         }
 
 
+class PresentationSortField(str, Enum):
+    """Presentation list sort field enum."""
+
+    UPDATED = "updated"
+    CREATED = "created"
+    TITLE = "title"
+
+
+class SortOrder(str, Enum):
+    """Sort direction enum."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
 class ExportJobStatus(str, Enum):
     """Export job status enum."""
 
@@ -67,17 +141,81 @@ class ExportJobStatus(str, Enum):
     FAILED = "failed"
 
 
+class ExportOutputFormat(str, Enum):
+    """Format of an additional export output."""
+
+    PDF = "pdf"
+    PNG = "png"
+    JPEG = "jpeg"
+
+
+class ExportOutput(BaseModel):
+    """Additional output rendered from the page loaded for the main PDF."""
+
+    name: str = Field(
+        ...,
+        pattern=r"^[a-z0-9][a-z0-9-]{0,31}$",
+        description="Output name used in the download URL (/api/exports/{jobId}/download/{name})"
+    )
+    format: ExportOutputFormat = Field(
+        default=ExportOutputFormat.PDF,
+        description="'pdf', or 'png'/'jpeg' for a ZIP archive with one image per slide"
+    )
+    width: int = Field(default=1920, ge=320, le=7680, description="Page width in CSS pixels")
+    height: int = Field(default=1080, ge=180, le=4320, description="Page height in CSS pixels")
+    scale: float = Field(
+        default=1.0, gt=0, le=4,
+        description="Device scale factor of images: resolution is width x height x scale (PDFs: 1 only)"
+    )
+
+    @model_validator(mode="after")
+    def check_pdf_scale(self) -> "ExportOutput":
+        """Reject a scale factor for PDFs: they are vector, printing ignores the device scale factor."""
+        if self.format == ExportOutputFormat.PDF and self.scale != 1:
+            raise ValueError("scale applies to png/jpeg outputs only; set width/height for another PDF page size")
+        return self
+
+    @model_validator(mode="after")
+    def check_image_size(self) -> "ExportOutput":
+        """Cap the rendered image size: each screenshot is held in worker memory."""
+        if self.width * self.scale > MAX_IMAGE_WIDTH or self.height * self.scale > MAX_IMAGE_HEIGHT:
+            raise ValueError(
+                f"Image size {self.width * self.scale:g}x{self.height * self.scale:g} exceeds "
+                f"{MAX_IMAGE_WIDTH}x{MAX_IMAGE_HEIGHT}; lower width, height or scale"
+            )
+        return self
+
+
 class ExportRequest(BaseModel):
     """Request model for PDF export."""
 
     format: str = Field(default="pdf", description="Export format (currently only 'pdf')")
     quality: str = Field(default="high", description="Export quality: 'standard' or 'high'")
+    profile: bool = Field(
+        default=False,
+        description="Capture a sampling profile of the export (requires the X-Profile-Token header)"
+    )
+    slides: Optional[Union[str, list[int]]] = Field(
+        default=None,
+        description="Slides to export (1-based): range string '1-3,5' or list [1, 2, 3, 5]; all slides if omitted"
+    )
+    outputs: Optional[list[ExportOutput]] = Field(
+        default=None,
+        max_length=4,
+        description="Additional outputs (other PDF page sizes, slide images) rendered from the same page load"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "format": "pdf",
-                "quality": "high"
+                "quality": "high",
+                "slides": "1-3,5",
+                "outputs": [
+                    {"name": "720p", "format": "pdf", "width": 1280, "height": 720},
+                    {"name": "4k", "format": "png", "scale": 2},
+                    {"name": "thumbnails", "format": "png", "width": 1920, "height": 1080, "scale": 0.25}
+                ]
             }
         }
 
@@ -93,6 +231,11 @@ class ExportJob(BaseModel):
     error: Optional[str] = Field(None, description="Error message if job failed")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation timestamp", serialization_alias="createdAt")
     completed_at: Optional[datetime] = Field(None, description="Job completion timestamp", serialization_alias="completedAt")
+    profiled: bool = Field(False, description="A sampling profile is captured (GET /api/debug/profiles/{jobId})")
+    slides: Optional[str] = Field(None, description="Exported slides, e.g. '1-3,5' (null: all slides)")
+    outputs: Optional[list[ExportOutput]] = Field(None, description="Additional outputs of the job")
+    # Content key of the rendered sources (internal: reuse of identical exports)
+    source_key: Optional[str] = Field(None, exclude=True)
 
     class Config:
         populate_by_name = True
@@ -129,6 +272,31 @@ class ExportStatusResponse(BaseModel):
         }
 
 
+class ExportStatusBatchResponse(BaseModel):
+    """Response model for bulk (and long-poll) export status queries."""
+
+    jobs: list[ExportJob] = Field(..., description="Found jobs, in request order")
+    missing: list[str] = Field(default_factory=list, description="Requested job ids that do not exist")
+    version: str = Field(..., description="State version of the requested jobs; pass as 'since' to long-poll")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "jobs": [
+                    {
+                        "jobId": "export_123456789",
+                        "presentationId": "welcome",
+                        "status": "processing",
+                        "progress": 50,
+                        "createdAt": "2025-12-10T12:00:00Z"
+                    }
+                ],
+                "missing": [],
+                "version": "3f2a9c1b0d4e5f67"
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -142,3 +310,42 @@ class HealthResponse(BaseModel):
                 "service": "Vedunya Presentation Builder API"
             }
         }
+
+
+class ComponentState(str, Enum):
+    """Readiness state of a service component."""
+
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class ComponentStatus(BaseModel):
+    """Readiness of a single component (index, search, renderer)."""
+
+    state: ComponentState = Field(..., description="Component state")
+    detail: Optional[str] = Field(None, description="Error message or note")
+    duration_ms: Optional[float] = Field(None, description="Warm-up duration in milliseconds", serialization_alias="durationMs")
+
+    class Config:
+        populate_by_name = True
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness check response."""
+
+    status: str = Field(..., description="'ready' when every component is ready or skipped, otherwise 'starting' or 'failed'")
+    components: dict[str, ComponentStatus] = Field(default_factory=dict, description="Per-component readiness")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "starting",
+                "components": {
+                    "index": {"state": "ready", "durationMs": 42.0},
+                    "search": {"state": "ready", "durationMs": 8.5},
+                    "renderer": {"state": "pending"}
+                }
+            }
+        }
@@ -3,5 +3,7 @@ API routes for Vedunya Presentation Builder.
 """
 from .presentations import router as presentations_router
 from .exports import router as exports_router
+from .search import router as search_router
+from .debug import router as debug_router
 
-__all__ = ["presentations_router", "exports_router"]
+__all__ = ["presentations_router", "exports_router", "search_router", "debug_router"]
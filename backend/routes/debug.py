@@ -0,0 +1,183 @@
+"""
+Debug API Routes
+
+Token-protected access to per-route latency statistics, captured
+sampling profiles, diagnostics of failed or slow exports and memory usage. Disabled (404) unless PROFILING_TOKEN is configured.
+"""
+import resource
+import sys
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from services.diagnostics import DiagnosticsStore
+from services.export_service import ExportService
+from services.profiler import ProfileStore, token_matches
+from services.telemetry import RouteStats
+
+router = APIRouter(prefix="/api/debug", tags=["debug"], include_in_schema=False)
+
+# Instances (set in main.py)
+_route_stats: RouteStats | None = None
+_profile_store: ProfileStore | None = None
+_profiling_token: Optional[str] = None
+_export_service: ExportService | None = None
+_diagnostics: DiagnosticsStore | None = None
+
+
+def set_debug_state(
+    route_stats: RouteStats,
+    profile_store: ProfileStore,
+    profiling_token: Optional[str],
+    export_service: Optional[ExportService] = None,
+    diagnostics: Optional[DiagnosticsStore] = None,
+) -> None:
+    """Set route statistics, profile store, the access token, the export service and export diagnostics."""
+    global _route_stats, _profile_store, _profiling_token, _export_service, _diagnostics
+    _route_stats = route_stats
+    _profile_store = profile_store
+    _profiling_token = profiling_token
+    _export_service = export_service
+    _diagnostics = diagnostics
+
+
+def require_profiling_token(x_profile_token: Optional[str] = Header(None)) -> None:
+    """
+    Check the X-Profile-Token header.
+
+    Raises:
+        HTTPException: 404 if profiling is disabled, 403 if the token is wrong
+    """
+    if not _profiling_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not token_matches(x_profile_token, _profiling_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid profiling token")
+
+
+@router.get("/timings", dependencies=[Depends(require_profiling_token)], summary="Per-route latency")
+async def get_timings() -> dict:
+    """
+    Get request count, errors and latency percentiles per route since startup.
+
+    Returns:
+        Mapping of ``"METHOD /route/template"`` to statistics
+    """
+    return {"routes": _route_stats.snapshot() if _route_stats else {}}
+
+
+@router.get("/profiles", dependencies=[Depends(require_profiling_token)], summary="List profiles")
+async def list_profiles() -> dict:
+    """
+    List captured profiles, newest first.
+
+    Returns:
+        Profiles with id, size and creation time
+    """
+    return {"profiles": _profile_store.list_profiles() if _profile_store else []}
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    dependencies=[Depends(require_profiling_token)],
+    response_class=PlainTextResponse,
+    summary="Download profile"
+)
+async def get_profile(profile_id: str) -> PlainTextResponse:
+    """
+    Download a profile in folded-stack format.
+
+    Args:
+        profile_id: ``request_<request id>`` or an export job id
+
+    Returns:
+        PlainTextResponse: ``# key: value`` header lines followed by folded stacks
+
+    Raises:
+        HTTPException: 404 if the profile does not exist (yet)
+    """
+    content = _profile_store.get(profile_id) if _profile_store else None
+    if content is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile '{profile_id}' not found"
+        )
+    return PlainTextResponse(content)
+
+
+@router.get("/exports", dependencies=[Depends(require_profiling_token)], summary="List export diagnostics")
+async def list_export_diagnostics() -> dict:
+    """
+    List kept diagnostics of failed or slow exports, newest first.
+
+    Returns:
+        Captures with job id, presentation id, reason and duration
+    """
+    return {"exports": _diagnostics.list_captures() if _diagnostics else []}
+
+
+@router.get("/exports/{job_id}", dependencies=[Depends(require_profiling_token)], summary="Export diagnostics")
+async def get_export_diagnostics(job_id: str) -> dict:
+    """
+    Get the timing breakdown of a failed or slow export and its captured files.
+
+    Args:
+        job_id: Export job identifier
+
+    Returns:
+        Status, error, duration, per-phase timings and ``files`` (name to size)
+
+    Raises:
+        HTTPException: 404 if no diagnostics were kept for the job
+    """
+    capture = _diagnostics.get(job_id) if _diagnostics else None
+    if capture is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No diagnostics for export '{job_id}'"
+        )
+    return capture
+
+
+@router.get(
+    "/exports/{job_id}/{name}",
+    dependencies=[Depends(require_profiling_token)],
+    response_class=FileResponse,
+    summary="Download export diagnostics file"
+)
+async def get_export_diagnostics_file(job_id: str, name: str) -> FileResponse:
+    """
+    Download one captured file: ``trace.zip`` (open with ``playwright show-trace``),
+    ``network.har``, ``console.log`` or ``timings.json``.
+
+    Args:
+        job_id: Export job identifier
+        name: File name
+
+    Raises:
+        HTTPException: 404 if the file was not captured
+    """
+    path = _diagnostics.get_file(job_id, name) if _diagnostics else None
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Diagnostics file '{name}' not found for export '{job_id}'"
+        )
+    return FileResponse(path=str(path), filename=f"{job_id}-{name}")
+
+
+@router.get("/memory", dependencies=[Depends(require_profiling_token)], summary="Memory usage")
+async def get_memory() -> dict:
+    """
+    Get the process peak RSS and the memory held by export job records.
+
+    Returns:
+        ``max_rss_kb`` and export job counts, history limit and approximate bytes
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss //= 1024  # bytes on macOS, kilobytes on Linux
+    return {
+        "max_rss_kb": max_rss,
+        "export_jobs": _export_service.memory_usage() if _export_service else None,
+    }
@@ -3,26 +3,83 @@ Exports API Routes
 
 Endpoints for creating and managing PDF export jobs.
 """
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+import math
+import re
+from pathlib import Path
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, Response
 
 from models.schemas import (
     ExportJob,
     ExportRequest,
+    ExportStatusBatchResponse,
     ExportStatusResponse,
 )
+from services.admission import AdmissionPolicy, RateLimiter
+from services.export_outputs import MEDIA_TYPES, find_output, output_extension
 from services.export_service import ExportService
+from services.presentation_index import PresentationIndex
+from services.profiler import token_matches
+from services.slide_selection import format_slide_selection, parse_slide_selection
 
 router = APIRouter(prefix="/api/exports", tags=["exports"])
 
+# Limits of bulk status queries
+MAX_STATUS_JOBS = 100
+MAX_STATUS_WAIT = 60.0
+
+# "30s" or "30"
+_WAIT = re.compile(r"^(\d+(?:\.\d+)?)s?$")
+
 # Export service instance (set in main.py)
 _export_service: ExportService | None = None
 
+# Token allowing profiled exports (None disables profiling)
+_profiling_token: Optional[str] = None
+
+# Internal nginx location of the exports directory (None: stream files from Python)
+_accel_redirect_prefix: Optional[str] = None
 
-def set_export_service(service: ExportService) -> None:
-    """Set the export service instance."""
-    global _export_service
+# Guards of export creation (None: not checked)
+_index: Optional[PresentationIndex] = None
+_rate_limiter: Optional[RateLimiter] = None
+_admission: Optional[AdmissionPolicy] = None
+_trust_proxy: bool = False
+
+
+def set_export_service(
+    service: ExportService,
+    profiling_token: Optional[str] = None,
+    accel_redirect_prefix: Optional[str] = None,
+    index: Optional[PresentationIndex] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    admission: Optional[AdmissionPolicy] = None,
+    trust_proxy: bool = False,
+) -> None:
+    """
+    Set the export service instance, the profiling token, the download mode
+    and the guards of export creation.
+
+    Args:
+        service: Export service
+        profiling_token: Token allowing profiled exports
+        accel_redirect_prefix: Internal nginx location of the exports directory
+        index: Presentation index validating presentation ids
+        rate_limiter: Per-client limit of export creation
+        admission: Global limits on exports in flight
+        trust_proxy: Identify clients by the X-Real-IP header set by nginx
+    """
+    global _export_service, _profiling_token, _accel_redirect_prefix
+    global _index, _rate_limiter, _admission, _trust_proxy
     _export_service = service
+    _profiling_token = profiling_token
+    _accel_redirect_prefix = accel_redirect_prefix
+    _index = index
+    _rate_limiter = rate_limiter
+    _admission = admission
+    _trust_proxy = trust_proxy
 
 
 def get_export_service() -> ExportService:
@@ -33,25 +90,40 @@ def get_export_service() -> ExportService:
 
 
 @router.post(
-    "/{presentation_id}/export",
+    "/{presentation_id:path}/export",
     response_model=ExportJob,
     status_code=status.HTTP_201_CREATED,
     summary="Start PDF export"
 )
 async def create_export(
     presentation_id: str,
-    request: ExportRequest = ExportRequest()
+    http_request: Request,
+    request: ExportRequest = ExportRequest(),
+    x_profile_token: Optional[str] = Header(None)
 ) -> ExportJob:
     """
     Create a new PDF export job for a presentation.
 
+    Checks run cheapest first, before any render work: the client's rate
+    limit, the request, the presentation id and finally the export load.
+
     Args:
         presentation_id: ID of presentation to export
+        http_request: HTTP request (client address for rate limiting)
         request: Export configuration options
+        x_profile_token: Profiling token, required when ``request.profile`` is set
 
     Returns:
         ExportJob: Created job with status and job_id
 
+    Raises:
+        HTTPException: 400 if the slide selection is malformed or output names repeat
+        HTTPException: 403 if a profile is requested without a valid token
+        HTTPException: 404 if the presentation does not exist
+        HTTPException: 422 if the slide selection goes past the last slide
+        HTTPException: 429 if the client exceeded its rate limit or the
+            export load is too high (with Retry-After)
+
     Example response:
         ```json
         {
@@ -65,14 +137,128 @@ async def create_export(
     """
     service = get_export_service()
 
-    # Validate presentation exists (via scanner)
-    # This will be done in frontend for now, backend trusts the request
+    if _rate_limiter is not None:
+        wait = _rate_limiter.check(_client_id(http_request))
+        if wait > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many export requests, retry later",
+                headers={"Retry-After": str(math.ceil(wait))}
+            )
 
-    job = await service.create_export_job(presentation_id)
+    if request.profile and not token_matches(x_profile_token, _profiling_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Profiling requires a valid X-Profile-Token header"
+        )
+
+    try:
+        selection = parse_slide_selection(request.slides)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    names = [output.name for output in request.outputs or []]
+    if len(set(names)) != len(names):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Output names must be unique"
+        )
+
+    # Validate presentation exists before any browser work
+    if _index is not None:
+        presentation = await _index.get(presentation_id)
+        if presentation is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Presentation '{presentation_id}' not found"
+            )
+        if selection and selection[-1] > presentation.slide_count:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=(
+                    f"Slide {selection[-1]} does not exist: "
+                    f"'{presentation_id}' has {presentation.slide_count} slides"
+                )
+            )
+
+    if _admission is not None:
+        reason = await _admission.check(service)
+        if reason is not None:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"{reason}, retry later",
+                headers={"Retry-After": str(_admission.retry_after)}
+            )
+
+    job = await service.create_export_job(
+        presentation_id,
+        profile=request.profile,
+        slides=format_slide_selection(selection) if selection else None,
+        outputs=request.outputs
+    )
 
     return job
 
 
+@router.get(
+    "/status",
+    response_model=ExportStatusBatchResponse,
+    summary="Check status of several exports"
+)
+async def get_export_statuses(
+    ids: str = Query(..., description="Comma-separated export job ids"),
+    wait: Optional[str] = Query(None, description="Long-poll: hold up to this long for a change, e.g. '30s'"),
+    since: Optional[str] = Query(None, description="Version from the previous response (required to long-poll)")
+) -> ExportStatusBatchResponse:
+    """
+    Get the status of many export jobs in one request.
+
+    With ``wait`` and ``since``, the request is held until the status or
+    progress of any requested job differs from the state identified by
+    ``since`` (or the wait expires, returning the same version).
+
+    Args:
+        ids: Comma-separated export job identifiers
+        wait: Maximum wait, seconds (``30`` or ``30s``; at most 60)
+        since: ``version`` of the previous response
+
+    Returns:
+        ExportStatusBatchResponse: Jobs in request order, unknown ids and the state version
+
+    Raises:
+        HTTPException: 400 if ids or wait are invalid
+    """
+    service = get_export_service()
+
+    job_ids = list(dict.fromkeys(job_id for job_id in ids.split(",") if job_id))
+    if not job_ids or len(job_ids) > MAX_STATUS_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pass between 1 and {MAX_STATUS_JOBS} job ids"
+        )
+
+    timeout = 0.0
+    if wait is not None:
+        match = _WAIT.match(wait)
+        if match is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid wait, expected seconds such as '30s'"
+            )
+        timeout = min(float(match.group(1)), MAX_STATUS_WAIT)
+
+    jobs, version = await service.watch_jobs(job_ids, since=since, timeout=timeout)
+
+    return ExportStatusBatchResponse(
+        jobs=[jobs[job_id] for job_id in job_ids if job_id in jobs],
+        missing=[job_id for job_id in job_ids if job_id not in jobs],
+        version=version
+    )
+
+
 @router.get(
     "/{job_id}/status",
     response_model=ExportStatusResponse,
@@ -121,22 +307,91 @@ async def get_export_status(job_id: str) -> ExportStatusResponse:
     response_class=FileResponse,
     summary="Download exported PDF"
 )
-async def download_export(job_id: str) -> FileResponse:
+async def download_export(job_id: str) -> Response:
     """
     Download the exported PDF file.
 
+    With an X-Accel-Redirect prefix configured, only the job is checked and
+    nginx sends the file from the shared exports volume itself.
+
     Args:
         job_id: Export job identifier
 
     Returns:
-        FileResponse: PDF file download
+        FileResponse with the PDF, or an empty response with X-Accel-Redirect
 
     Raises:
         HTTPException: 404 if job not found or not completed
         HTTPException: 400 if job failed or still processing
     """
     service = get_export_service()
+    job = await _finished_job(service, job_id)
+
+    # Get PDF file path
+    pdf_path = service.get_pdf_path(job_id)
+    if pdf_path is None or not pdf_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="PDF file not found"
+        )
+
+    name = _download_name(job)
+    filename = f"{name}_slides-{job.slides}.pdf" if job.slides else f"{name}.pdf"
+    return _file_response(pdf_path, filename, "application/pdf")
+
+
+@router.get(
+    "/{job_id}/download/{output_name}",
+    response_class=FileResponse,
+    summary="Download an additional export output"
+)
+async def download_export_output(job_id: str, output_name: str) -> Response:
+    """
+    Download one of the job's additional outputs (PDF, or ZIP of slide images).
+
+    Args:
+        job_id: Export job identifier
+        output_name: Output name from the export request
+
+    Returns:
+        FileResponse with the file, or an empty response with X-Accel-Redirect
+
+    Raises:
+        HTTPException: 404 if job or output not found
+        HTTPException: 400 if job failed or still processing
+    """
+    service = get_export_service()
+    job = await _finished_job(service, job_id)
 
+    output = find_output(job.outputs, output_name)
+    path = service.get_output_path(job_id, output) if output else None
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Output '{output_name}' not found"
+        )
+
+    extension = output_extension(output)
+    return _file_response(path, f"{_download_name(job)}_{output.name}.{extension}", MEDIA_TYPES[extension])
+
+
+def _client_id(request: Request) -> str:
+    """Client address: X-Real-IP behind the trusted nginx proxy, else the peer address."""
+    if _trust_proxy:
+        real_ip = request.headers.get("x-real-ip")
+        if real_ip:
+            return real_ip.strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def _finished_job(service: ExportService, job_id: str) -> ExportJob:
+    """
+    Get a job whose files can be downloaded.
+
+    Raises:
+        HTTPException: 404 if job not found
+        HTTPException: 400 if job failed or still processing
+    """
     # Check job exists
     job = await service.get_job_status(job_id)
     if job is None:
@@ -158,20 +413,31 @@ async def download_export(job_id: str) -> FileResponse:
             detail=f"Export job is {job.status}, not ready for download"
         )
 
-    # Get PDF file path
-    pdf_path = service.get_pdf_path(job_id)
-    if pdf_path is None or not pdf_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="PDF file not found"
+    return job
+
+
+def _download_name(job: ExportJob) -> str:
+    """File name stem of a job's downloads: namespaced ids ("team-a/deck") become "team-a_deck"."""
+    return job.presentation_id.replace("/", "_")
+
+
+def _file_response(path: Path, filename: str, media_type: str) -> Response:
+    """Send an export file, through nginx when X-Accel-Redirect is configured."""
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"'
+    }
+
+    if _accel_redirect_prefix:
+        # nginx serves the file (sendfile); Python stays out of the data path
+        return Response(
+            media_type=media_type,
+            headers={**headers, "X-Accel-Redirect": f"{_accel_redirect_prefix}{path.name}"}
         )
 
     # Return file
     return FileResponse(
-        path=str(pdf_path),
-        media_type="application/pdf",
-        filename=f"{job.presentation_id}.pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="{job.presentation_id}.pdf"'
-        }
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        headers=headers
     )
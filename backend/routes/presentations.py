@@ -3,17 +3,29 @@ Presentations API Routes
 
 Endpoints for listing and retrieving presentation metadata.
 """
+import json
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, status
+from typing import AsyncIterator, Optional
 
-from models.schemas import Presentation, PresentationList
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from models.schemas import Presentation, PresentationList, PresentationSortField, SortOrder
+from services.presentation_index import PresentationIndex
 from services.presentation_scanner import PresentationScanner
+from services.presentation_query import InvalidQueryError, project_presentation, query_presentations
+from services.response_cache import ResponseCache
+from services.telemetry import add_timing, timed
 
 router = APIRouter(prefix="/api/presentations", tags=["presentations"])
 
 # Initialize scanner with presentations directory
 # This path will be set dynamically in main.py
 _scanner: PresentationScanner | None = None
+_index: PresentationIndex | None = None
+
+# Serialized list/detail responses for the current index version
+_response_cache = ResponseCache()
 
 
 def set_scanner(scanner: PresentationScanner) -> None:
@@ -29,13 +41,51 @@ def get_scanner() -> PresentationScanner:
     return _scanner
 
 
-@router.get("", response_model=PresentationList, summary="List all presentations")
-async def list_presentations() -> PresentationList:
+def set_index(index: PresentationIndex) -> None:
+    """Set the presentation index instance (resets cached responses)."""
+    global _index, _response_cache
+    _index = index
+    _response_cache = ResponseCache()
+
+
+def get_index() -> PresentationIndex:
+    """Get the presentation index instance."""
+    if _index is None:
+        raise RuntimeError("Presentation index not initialized")
+    return _index
+
+
+@router.get("", response_model=PresentationList, summary="List presentations")
+async def list_presentations(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of presentations per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's nextCursor"),
+    sort: PresentationSortField = Query(PresentationSortField.UPDATED, description="Sort field"),
+    order: SortOrder = Query(SortOrder.DESC, description="Sort direction"),
+    title: Optional[str] = Query(None, description="Case-insensitive substring filter on title"),
+    description: Optional[str] = Query(None, description="Case-insensitive substring filter on description"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to include (id is always included)"),
+) -> Response:
     """
-    Get list of all available presentations.
+    Get a page of available presentations.
+
+    Responses are served from pre-serialized (gzip/brotli) bodies cached
+    per index version and carry an ETag; ``If-None-Match`` yields 304.
+
+    Args:
+        limit: Maximum number of presentations per page
+        cursor: Opaque cursor returned as ``nextCursor`` by the previous page
+        sort: Sort field (updated, created or title)
+        order: Sort direction (asc or desc)
+        title: Case-insensitive substring filter on title
+        description: Case-insensitive substring filter on description
+        fields: Comma-separated field projection, e.g. ``id,title,slideCount``
 
     Returns:
-        PresentationList: Object containing list of presentations and total count
+        PresentationList: Page of presentations, total match count and next cursor
+
+    Raises:
+        HTTPException: 400 if cursor or fields are invalid
 
     Example response:
         ```json
@@ -44,33 +94,89 @@ async def list_presentations() -> PresentationList:
                 {
                     "id": "welcome",
                     "title": "Welcome to Vedunya",
-                    "description": "Example presentation",
-                    "slide_count": 4,
-                    "created_at": "2025-12-10T00:00:00Z",
-                    "updated_at": "2025-12-10T00:00:00Z",
-                    "file_path": "presentations/welcome.tsx"
+                    "slideCount": 4
                 }
             ],
-            "total": 1
+            "total": 1,
+            "nextCursor": null
         }
         ```
     """
+    index = get_index()
+    with timed("index"):
+        presentations = await index.list_presentations()
+
+    key = ("list", limit, cursor, sort.value, order.value, title, description, fields)
+    cached = _response_cache.get(key, index.version)
+    if cached is not None:
+        add_timing("cache", description="hit")
+        return cached.to_response(request)
+    add_timing("cache", description="miss")
+
+    try:
+        with timed("query"):
+            page = query_presentations(
+                presentations,
+                sort=sort,
+                order=order,
+                title=title,
+                description=description,
+                limit=limit,
+                cursor=cursor,
+                fields=fields
+            )
+    except InvalidQueryError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    with timed("serialize"):
+        cached = _response_cache.put(key, index.version, {
+            "presentations": [project_presentation(p, page.fields) for p in page.items],
+            "total": page.total,
+            "nextCursor": page.next_cursor,
+        })
+    return cached.to_response(request)
+
+
+@router.get("/stream", summary="Stream presentations by directory shard")
+async def stream_presentations() -> StreamingResponse:
+    """
+    Stream all presentations as NDJSON, one line per directory shard.
+
+    Lines are sent as soon as each directory has been scanned, so clients
+    can render a large catalog progressively instead of waiting for a
+    full walk of the tree.
+
+    Returns:
+        StreamingResponse: ``application/x-ndjson`` body
+
+    Example line:
+        ```json
+        {"shard": "team-a", "presentations": [{"id": "team-a/quarterly", "title": "Quarterly"}]}
+        ```
+    """
     scanner = get_scanner()
-    presentations = await scanner.scan_all()
 
-    return PresentationList(
-        presentations=presentations,
-        total=len(presentations)
-    )
+    async def generate() -> AsyncIterator[bytes]:
+        async for shard, presentations in scanner.scan_shards():
+            line = {
+                "shard": shard,
+                "presentations": [p.model_dump(mode="json", by_alias=True) for p in presentations],
+            }
+            yield (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
 
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
-@router.get("/{presentation_id}", response_model=Presentation, summary="Get presentation by ID")
-async def get_presentation(presentation_id: str) -> Presentation:
+
+@router.get("/{presentation_id:path}", response_model=Presentation, summary="Get presentation by ID")
+async def get_presentation(request: Request, presentation_id: str) -> Response:
     """
     Get metadata for a specific presentation.
 
     Args:
-        presentation_id: Unique presentation identifier (filename without extension)
+        presentation_id: Unique presentation identifier (relative path without extension)
 
     Returns:
         Presentation: Presentation metadata object
@@ -91,8 +197,16 @@ async def get_presentation(presentation_id: str) -> Presentation:
         }
         ```
     """
-    scanner = get_scanner()
-    presentation = await scanner.get_by_id(presentation_id)
+    index = get_index()
+    key = ("detail", presentation_id)
+    cached = _response_cache.get(key, index.version)
+    if cached is not None:
+        add_timing("cache", description="hit")
+        return cached.to_response(request)
+    add_timing("cache", description="miss")
+
+    with timed("index"):
+        presentation = await index.get(presentation_id)
 
     if presentation is None:
         raise HTTPException(
@@ -100,4 +214,5 @@ async def get_presentation(presentation_id: str) -> Presentation:
             detail=f"Presentation '{presentation_id}' not found"
         )
 
-    return presentation
+    cached = _response_cache.put(key, index.version, project_presentation(presentation, None))
+    return cached.to_response(request)
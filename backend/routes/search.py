@@ -0,0 +1,85 @@
+"""
+Search API Routes
+
+Full-text search across presentation titles, descriptions and slide text.
+"""
+from fastapi import APIRouter, Query
+
+from models.schemas import SearchResponse, SearchResult
+from services.search_index import SearchIndex
+from services.presentation_index import PresentationIndex
+from services.telemetry import timed
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+# Search and presentation index instances (set in main.py)
+_search_index: SearchIndex | None = None
+_presentation_index: PresentationIndex | None = None
+
+
+def set_search_index(search_index: SearchIndex, presentation_index: PresentationIndex) -> None:
+    """Set the search index and the presentation index it is built from."""
+    global _search_index, _presentation_index
+    _search_index = search_index
+    _presentation_index = presentation_index
+
+
+def get_search_index() -> SearchIndex:
+    """Get the search index instance."""
+    if _search_index is None or _presentation_index is None:
+        raise RuntimeError("Search index not initialized")
+    return _search_index
+
+
+@router.get("", response_model=SearchResponse, summary="Search presentations")
+async def search_presentations(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+) -> SearchResponse:
+    """
+    Search presentations by title, description and visible slide text.
+
+    All query words must match; words of three or more characters also
+    match as prefixes. Matching is case-insensitive and treats "ё" as "е".
+
+    Args:
+        q: Search query
+        limit: Maximum number of results
+
+    Returns:
+        SearchResponse: Ranked results with the first matching slide
+
+    Example response:
+        ```json
+        {
+            "query": "безопасность",
+            "results": [
+                {
+                    "presentation": {"id": "vedunya-product", "title": "Ведунья — Корпоративный ИИ"},
+                    "score": 4.2173,
+                    "slide": 2
+                }
+            ],
+            "total": 1
+        }
+        ```
+    """
+    search_index = get_search_index()
+
+    # First query before the background build finished: build synchronously
+    if not search_index.ready:
+        with timed("build"):
+            await _presentation_index.list_presentations()
+            await search_index.sync(_presentation_index)
+
+    with timed("search"):
+        hits, total = search_index.search(q, limit=limit)
+
+    return SearchResponse(
+        query=q,
+        results=[
+            SearchResult(presentation=hit.presentation, score=hit.score, slide=hit.slide)
+            for hit in hits
+        ],
+        total=total
+    )
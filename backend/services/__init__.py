@@ -2,6 +2,9 @@
 Services for Vedunya Presentation Builder.
 """
 from .presentation_scanner import PresentationScanner
+from .presentation_index import PresentationIndex
+from .search_index import SearchIndex
 from .export_service import ExportService
+from .job_store import JobStore
 
-__all__ = ["PresentationScanner", "ExportService"]
+__all__ = ["PresentationScanner", "PresentationIndex", "SearchIndex", "ExportService", "JobStore"]
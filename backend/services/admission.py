@@ -0,0 +1,111 @@
+"""
+Export Admission
+
+Per-client token-bucket rate limits and a global admission policy for
+export creation, so browser work is only started for requests the
+service can actually serve.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from services.export_service import ExportService
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity``."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """
+        Take one token.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token bucket per client, for the most recently seen ``max_clients`` clients."""
+
+    def __init__(self, per_minute: float, burst: int, max_clients: int = 10000):
+        """
+        Initialize rate limiter.
+
+        Args:
+            per_minute: Sustained requests per minute per client
+            burst: Requests a client may make at once after being idle
+            max_clients: Buckets kept; the least recently seen are dropped
+                (a dropped client starts again with a full bucket)
+        """
+        self.rate = per_minute / 60
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def check(self, client: str, now: Optional[float] = None) -> float:
+        """
+        Count a request of a client.
+
+        Args:
+            client: Client identifier (address)
+            now: Current monotonic time (default: time.monotonic())
+
+        Returns:
+            0 if the request is allowed, otherwise seconds to wait
+        """
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.rate, self.burst, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        return bucket.take(now)
+
+
+@dataclass
+class AdmissionPolicy:
+    """Global limits on export work in flight."""
+
+    # Jobs waiting to be rendered (queue depth)
+    max_queued: int = 50
+    # Jobs waiting or rendering
+    max_active: int = 100
+    # Retry-After sent with rejections, seconds
+    retry_after: int = 10
+
+    async def check(self, service: ExportService) -> Optional[str]:
+        """
+        Decide whether a new export can be admitted.
+
+        Args:
+            service: Export service reporting its current load
+
+        Returns:
+            None if admitted, otherwise the reason for rejecting it
+        """
+        rendering, queued = await service.load()
+        if queued >= self.max_queued:
+            return f"Export queue is full ({queued} waiting)"
+        if rendering + queued >= self.max_active:
+            return f"Too many exports in progress ({rendering + queued})"
+        return None
@@ -0,0 +1,290 @@
+"""
+Export Diagnostics
+
+Captures what happened while an export rendered: browser console output,
+a breakdown of where the time went (browser start, navigation to
+networkidle, PDF printing, ...) and, for sampled jobs, a Playwright trace
+and a HAR of the page's network requests. Captures of jobs that failed or
+exceeded the slow threshold are kept in a bounded on-disk store; the rest
+are discarded.
+
+Console lines and phase timings cost next to nothing and are collected for
+every job. Tracing and HAR recording add work to every recorded render,
+and trace screenshots and DOM snapshots (off unless ``snapshots`` is set)
+add much more, so only a fraction of jobs (``sample_rate``) records them.
+"""
+import json
+import os
+import random
+import re
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+
+# Files of a kept capture (names double as API path segments)
+TRACE_FILE = "trace.zip"
+HAR_FILE = "network.har"
+CONSOLE_FILE = "console.log"
+TIMINGS_FILE = "timings.json"
+ARTIFACTS = (TIMINGS_FILE, CONSOLE_FILE, HAR_FILE, TRACE_FILE)
+
+# Console lines kept per capture
+MAX_CONSOLE_LINES = 1000
+
+# Job ids double as directory names (no leading dot: no "..", no staging area)
+_JOB_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,99}$")
+
+_STAGING = ".staging"
+
+
+class ExportCapture:
+    """Diagnostics collected while one job renders."""
+
+    def __init__(self, directory: Path, record: bool = True, snapshots: bool = False):
+        """
+        Initialize capture.
+
+        Args:
+            directory: Staging directory receiving the trace and HAR
+            record: Record a trace and a HAR (otherwise console and timings only)
+            snapshots: Record screenshots and DOM snapshots in the trace
+        """
+        self.directory = directory
+        self.record = record
+        self.snapshots = snapshots
+        self.started = time.perf_counter()
+        self.phases: list[dict[str, Any]] = []
+        self.console: list[str] = []
+        self.dropped_console_lines = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the start offset and duration of a render phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                "name": name,
+                "start_ms": round((started - self.started) * 1000, 1),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+
+    def context_options(self) -> dict[str, Any]:
+        """Browser context options recording a HAR (written when the context closes), if recording."""
+        if not self.record:
+            return {}
+        return {"record_har_path": str(self.directory / HAR_FILE), "record_har_content": "omit"}
+
+    async def attach(self, context: BrowserContext) -> None:
+        """
+        Collect console output of a browser context's pages and, if recording, trace it.
+
+        Args:
+            context: Context created with context_options()
+        """
+        context.on("page", self._watch_page)
+        if self.record:
+            await context.tracing.start(screenshots=self.snapshots, snapshots=self.snapshots)
+
+    async def detach(self, context: BrowserContext) -> None:
+        """
+        Save the trace of a context (call before closing it).
+
+        Never raises: a crashed browser leaves the capture without a trace.
+
+        Args:
+            context: Context passed to attach()
+        """
+        if not self.record:
+            return
+        try:
+            await context.tracing.stop(path=str(self.directory / TRACE_FILE))
+        except Exception as e:
+            self.log(f"[capture] trace not saved: {e}")
+
+    def log(self, line: str) -> None:
+        """Append a console line, dropping lines beyond MAX_CONSOLE_LINES."""
+        if len(self.console) < MAX_CONSOLE_LINES:
+            self.console.append(f"{time.perf_counter() - self.started:9.3f}s {line}")
+        else:
+            self.dropped_console_lines += 1
+
+    def _watch_page(self, page: Page) -> None:
+        """Collect console messages, page errors and failed requests of a page."""
+        page.on("console", lambda message: self.log(f"[{message.type}] {message.text}"))
+        page.on("pageerror", lambda error: self.log(f"[pageerror] {error}"))
+        page.on("requestfailed", lambda request: self.log(
+            f"[requestfailed] {request.method} {request.url}: {request.failure}"
+        ))
+
+
+class DiagnosticsStore:
+    """Directory of kept export captures, keeping only the newest ``max_jobs``."""
+
+    def __init__(
+        self,
+        directory: str,
+        slow_ms: float = 30000.0,
+        max_jobs: int = 20,
+        sample_rate: float = 1.0,
+        snapshots: bool = False,
+    ):
+        """
+        Initialize diagnostics store.
+
+        Args:
+            directory: Directory for ``<job_id>/`` captures (shared with workers)
+            slow_ms: Render duration above which a successful job's capture is kept
+            max_jobs: Number of captures kept; older ones are deleted
+            sample_rate: Fraction of jobs that record a trace and a HAR (0..1)
+            snapshots: Record screenshots and DOM snapshots in traces
+        """
+        self.directory = Path(directory)
+        self.slow_ms = slow_ms
+        self.max_jobs = max_jobs
+        self.sample_rate = sample_rate
+        self.snapshots = snapshots
+
+    def sampled(self) -> bool:
+        """Decide whether the next job records a trace and a HAR (``sample_rate`` of jobs)."""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def begin(self, job_id: str) -> ExportCapture:
+        """
+        Start capturing a job; sampled jobs also record a trace and a HAR.
+
+        Args:
+            job_id: Export job identifier
+
+        Returns:
+            Capture to pass to the render
+        """
+        if not _JOB_ID.match(job_id):
+            raise ValueError(f"Invalid job id: {job_id!r}")
+        staging = self.directory / _STAGING / f"{job_id}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        record = self.sampled()
+        if record:
+            staging.mkdir(parents=True)
+        return ExportCapture(staging, record=record, snapshots=self.snapshots)
+
+    def finish(self, capture: ExportCapture, job_id: str, meta: dict[str, Any], failed: bool) -> Optional[Path]:
+        """
+        Keep the capture of a failed or slow job, discard any other.
+
+        Args:
+            capture: Capture returned by begin()
+            job_id: Export job identifier
+            meta: Job details written to the timings file (status, error, ...)
+            failed: The job failed
+
+        Returns:
+            Directory of the kept capture, or None if it was discarded
+        """
+        duration_ms = round((time.perf_counter() - capture.started) * 1000, 1)
+        if not failed and duration_ms < self.slow_ms:
+            shutil.rmtree(capture.directory, ignore_errors=True)
+            return None
+
+        timings = {
+            **meta,
+            "job_id": job_id,
+            "reason": "failed" if failed else "slow",
+            "duration_ms": duration_ms,
+            "slow_ms": self.slow_ms,
+            "captured_at": time.time(),
+            "recorded": capture.record,
+            "phases": capture.phases,
+        }
+        capture.directory.mkdir(parents=True, exist_ok=True)
+        (capture.directory / TIMINGS_FILE).write_text(json.dumps(timings, indent=2), encoding="utf-8")
+        console = "\n".join(capture.console)
+        if capture.dropped_console_lines:
+            console += f"\n... {capture.dropped_console_lines} more line(s) dropped"
+        (capture.directory / CONSOLE_FILE).write_text(console + "\n", encoding="utf-8")
+
+        path = self.directory / job_id
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(capture.directory, path)
+        self._prune()
+        return path
+
+    def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        """
+        Read a kept capture's timings and list its files.
+
+        Args:
+            job_id: Export job identifier
+
+        Returns:
+            Timings with a ``files`` mapping of name to size, or None if not kept
+        """
+        path = self._path(job_id)
+        if path is None:
+            return None
+        try:
+            timings = json.loads((path / TIMINGS_FILE).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        timings["files"] = {
+            name: (path / name).stat().st_size for name in ARTIFACTS if (path / name).is_file()
+        }
+        return timings
+
+    def get_file(self, job_id: str, name: str) -> Optional[Path]:
+        """
+        Locate one file of a kept capture.
+
+        Args:
+            job_id: Export job identifier
+            name: One of ARTIFACTS
+
+        Returns:
+            File path or None if not found
+        """
+        path = self._path(job_id)
+        if path is None or name not in ARTIFACTS or not (path / name).is_file():
+            return None
+        return path / name
+
+    def list_captures(self) -> list[dict[str, Any]]:
+        """
+        List kept captures, newest first.
+
+        Returns:
+            Dictionaries with job id, reason, duration and capture time
+        """
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.iterdir():
+            if path.name == _STAGING or not path.is_dir():
+                continue
+            try:
+                timings = json.loads((path / TIMINGS_FILE).read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                continue
+            entries.append({
+                "job_id": path.name,
+                "presentation_id": timings.get("presentation_id"),
+                "reason": timings.get("reason"),
+                "duration_ms": timings.get("duration_ms"),
+                "captured_at": timings.get("captured_at", 0),
+            })
+        return sorted(entries, key=lambda entry: entry["captured_at"], reverse=True)
+
+    def _path(self, job_id: str) -> Optional[Path]:
+        if not _JOB_ID.match(job_id):
+            return None
+        return self.directory / job_id
+
+    def _prune(self) -> None:
+        """Delete the oldest captures beyond max_jobs."""
+        for entry in self.list_captures()[self.max_jobs:]:
+            shutil.rmtree(self.directory / entry["job_id"], ignore_errors=True)
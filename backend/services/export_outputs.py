@@ -0,0 +1,94 @@
+"""
+Export Outputs
+
+Additional outputs of an export job (``ExportRequest.outputs``): PDFs with
+another page size (scale factor 1 only) and per-slide images at any size
+and scale factor up to 8K. They are rendered
+from the page already loaded for the main PDF; switching between outputs
+only changes the device metrics, so the browser re-runs layout and paint
+but not navigation and hydration.
+"""
+import io
+import os
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import CDPSession, Page
+
+from models.schemas import ExportOutput, ExportOutputFormat
+
+
+# Media type of downloads by file extension
+MEDIA_TYPES = {"pdf": "application/pdf", "zip": "application/zip"}
+
+# Resolves after the next two animation frames (layout and paint done)
+_NEXT_FRAME = "() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))"
+
+
+def output_extension(output: ExportOutput) -> str:
+    """File extension of an output: ``pdf``, or ``zip`` for images."""
+    return "pdf" if output.format == ExportOutputFormat.PDF else "zip"
+
+
+def output_filename(job_id: str, output: ExportOutput) -> str:
+    """
+    File name of an output in the exports directory.
+
+    Args:
+        job_id: Export job identifier
+        output: Output specification
+
+    Returns:
+        ``<job_id>.<name>.pdf`` or ``<job_id>.<name>.zip``
+    """
+    return f"{job_id}.{output.name}.{output_extension(output)}"
+
+
+def find_output(outputs: Optional[list[ExportOutput]], name: str) -> Optional[ExportOutput]:
+    """Output of a job by name (None if the job has no such output)."""
+    return next((output for output in outputs or [] if output.name == name), None)
+
+
+async def apply_layout(session: CDPSession, page: Page, output: ExportOutput) -> None:
+    """
+    Re-layout a loaded page for an output's page size and scale factor.
+
+    Args:
+        session: CDP session of the page (overrides last while it is attached)
+        page: Loaded page
+        output: Output specification
+    """
+    await session.send("Emulation.setDeviceMetricsOverride", {
+        "width": output.width,
+        "height": output.height,
+        "deviceScaleFactor": output.scale,
+        "mobile": False,
+    })
+    await page.evaluate(_NEXT_FRAME)
+
+
+def pdf_options(base: dict, output: ExportOutput) -> dict:
+    """page.pdf() options of an output: the base options with the output's page size."""
+    return {**base, "width": f"{output.width}px", "height": f"{output.height}px"}
+
+
+def write_image_archive(images: list[tuple[int, bytes]], output: ExportOutput, path: Path) -> None:
+    """
+    Write per-slide images as a ZIP archive (``slide-01.png``, ...), atomically.
+
+    Images are already compressed, so they are stored without deflate.
+
+    Args:
+        images: (1-based slide number, encoded image) pairs in slide order
+        output: Output specification (image format)
+        path: Destination file
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for number, image in images:
+            archive.writestr(f"slide-{number:02d}.{output.format.value}", image)
+
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(buffer.getvalue())
+    os.replace(tmp_path, path)
@@ -4,60 +4,218 @@ Export Service
 Handles PDF export of presentations using Playwright for browser automation.
 """
 import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import time
+import urllib.request
 import uuid
+from contextlib import nullcontext
 from pathlib import Path
-from datetime import datetime, timezone
 from typing import Optional
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
-from models.schemas import ExportJob, ExportJobStatus
+from models.schemas import ExportJob, ExportJobStatus, ExportOutput, ExportOutputFormat
+from services.diagnostics import DiagnosticsStore, ExportCapture
+from services.export_outputs import apply_layout, output_filename, pdf_options, write_image_archive
+from services.job_history import JobHistory, JobRecord
+from services.job_store import BACKGROUND_PRIORITY, JobStore
+from services.page_cache import PageCache, deck_key, html_page_keys, spectacle_page_keys
+from services.pdf_tools import merge_pdf_pages, split_pdf_pages
+from services.presentation_scanner import PresentationScanner, list_html_slides
+from services.profiler import ProfileStore, StackSampler
+from services.slide_selection import format_slide_selection, parse_slide_selection
+from services.telemetry import job_id_var
+
+
+# Chromium flags used for every export browser
+BROWSER_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',  # Avoid shared memory issues
+    '--no-sandbox',  # Required for some macOS configurations
+    '--disable-setuid-sandbox',
+    '--disable-gpu',  # Avoid GPU acceleration issues
+]
+
+# Slide page geometry (16:9)
+SLIDE_WIDTH = 1920
+SLIDE_HEIGHT = 1080
+
+# Device scale factor of Spectacle renders
+SPECTACLE_SCALE = 2
+
+# Slide elements of the Spectacle viewer
+SPECTACLE_SLIDE_SELECTOR = ".spectacle-v7-slide"
+
+# Pages a loaded deck prints to: every slide box spans ceil(height / page
+# height) pages, and content outside the slides can add more at the end
+_PRINTED_PAGES = """([selector, pageHeight]) => {
+  const spans = Array.from(document.querySelectorAll(selector),
+    slide => Math.max(1, Math.ceil(slide.getBoundingClientRect().height / pageHeight - 0.001)));
+  const pages = spans.reduce((total, span) => total + span, 0);
+  return {spans, pages: Math.max(pages, Math.ceil(document.documentElement.scrollHeight / pageHeight - 0.001))};
+}"""
+
+# Seconds a fingerprint of the viewer build is trusted before it is fetched again
+VIEWER_FINGERPRINT_TTL = 60.0
+
+# Settings that change rendered pages (part of page cache keys)
+SPECTACLE_RENDER_SETTINGS = f"{SLIDE_WIDTH}x{SLIDE_HEIGHT}@{SPECTACLE_SCALE}"
+HTML_RENDER_SETTINGS = f"{SLIDE_WIDTH}x{SLIDE_HEIGHT}@1;screen"
+
+# Seconds between re-checks of watched jobs while long-polling (progress
+# changes and jobs rendered by export workers are picked up this way)
+WATCH_POLL_INTERVAL = 0.5
+
+# Options shared by every page.pdf() call of a slide render
+PDF_OPTIONS = {
+    "width": f"{SLIDE_WIDTH}px",
+    "height": f"{SLIDE_HEIGHT}px",
+    "print_background": True,
+    "margin": {"top": "0", "right": "0", "bottom": "0", "left": "0"},
+    "prefer_css_page_size": False,
+}
+
+logger = logging.getLogger(__name__)
+
+# Tiny page printed by warm_up() to prove the renderer works end to end
+WARMUP_PAGE = (
+    "<!DOCTYPE html><html><body style=\"margin:0;width:1920px;height:1080px;background:#050505\">"
+    "<h1 style=\"color:#00FF9D\">Vedunya</h1></body></html>"
+)
 
 
 class ExportService:
     """Manages PDF export operations using Playwright."""
 
-    def __init__(self, frontend_url: str, exports_dir: str):
+    def __init__(
+        self,
+        frontend_url: str,
+        exports_dir: str,
+        scanner: Optional[PresentationScanner] = None,
+        html_concurrency: int = 4,
+        job_store: Optional[JobStore] = None,
+        profile_store: Optional[ProfileStore] = None,
+        page_cache: Optional[PageCache] = None,
+        reuse_exports: bool = False,
+        history_size: int = 1000,
+        diagnostics: Optional[DiagnosticsStore] = None,
+        render_version: Optional[str] = None,
+        fingerprint_viewer: bool = False,
+    ):
         """
         Initialize export service.
 
         Args:
             frontend_url: Base URL of frontend application (e.g., http://localhost:5173)
             exports_dir: Directory to store exported PDF files
+            scanner: Scanner used to resolve presentation sources (static HTML
+                decks are rendered from disk instead of through the frontend)
+            html_concurrency: Number of HTML slides rendered in parallel
+            job_store: Shared queue; when set, jobs are only enqueued here and
+                rendered by export workers (``python -m services.export_worker``)
+            profile_store: Where sampling profiles of profiled jobs are saved
+            page_cache: Cache of rendered slide pages; when set, exports
+                re-render only slides whose source changed
+            reuse_exports: Answer an export request with the PDF of a completed
+                export (or pre-render) of identical sources, without rendering
+            history_size: Finished jobs kept in memory; older jobs are dropped
+                together with their PDFs
+            diagnostics: Where trace, HAR, console and timing captures of
+                failed or slow jobs are kept (None disables capturing)
+            render_version: Version of the viewer/frontend build; part of every
+                page cache key, so a redeploy does not reuse stale pages
+            fingerprint_viewer: Derive the render version from the viewer's
+                index.html (it names the content-hashed bundles of the build)
         """
         self.frontend_url = frontend_url.rstrip("/")
         self.exports_dir = Path(exports_dir)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
+        self.scanner = scanner
+        self.html_concurrency = max(1, html_concurrency)
+        self.job_store = job_store
+        self.profile_store = profile_store
+        self.page_cache = page_cache
+        self.reuse_exports = reuse_exports
+        self.diagnostics = diagnostics
+        self.render_version = render_version or ""
+        self.fingerprint_viewer = fingerprint_viewer
+        self._fingerprinted_at = float("-inf")
+
+        # In-memory job records (jobs rendered by this process)
+        self.jobs = JobHistory(history_size)
+
+        # Diagnostic captures of jobs rendering now, by job ID
+        self._captures: dict[str, ExportCapture] = {}
 
-        # In-memory job storage (for production, use Redis or database)
-        self.jobs: dict[str, ExportJob] = {}
+        # Pre-render jobs of this process and the user exports rendering now
+        self._background: set[str] = set()
+        self.foreground_renders = 0
 
-    async def create_export_job(self, presentation_id: str) -> ExportJob:
+        # Replaced (after being set) whenever a job of this process changes status
+        self._changed = asyncio.Event()
+
+        # Shared browser; every export gets its own context
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
+
+    async def create_export_job(
+        self,
+        presentation_id: str,
+        profile: bool = False,
+        background: bool = False,
+        slides: Optional[str] = None,
+        outputs: Optional[list[ExportOutput]] = None,
+    ) -> ExportJob:
         """
         Create a new export job.
 
+        With reuse_exports, a job whose sources match a completed export is
+        completed at once with a copy of that export's PDF.
+
         Args:
             presentation_id: ID of presentation to export
+            profile: Capture a sampling profile while the job renders
+            background: Speculative pre-render, queued behind user exports
+            slides: Normalized 1-based slide selection such as ``"1-3,5"``
+                (None exports every slide)
+            outputs: Additional outputs rendered from the same page load
 
         Returns:
             ExportJob object with job details
         """
         job_id = f"export_{uuid.uuid4().hex[:12]}"
 
-        job = ExportJob(
+        job = JobRecord(
             job_id=job_id,
             presentation_id=presentation_id,
-            status=ExportJobStatus.PENDING,
-            progress=0,
-            created_at=datetime.now(timezone.utc)
+            created_at=time.time(),
+            profiled=profile,
+            slides=slides,
+            outputs=outputs
         )
 
-        self.jobs[job_id] = job
+        # Reuse covers the main PDF only; jobs with additional outputs render
+        if self.reuse_exports and not profile and not outputs and await self._reuse_export(job):
+            return job.to_job()
+
+        if self.job_store is not None:
+            # Rendered by an export worker
+            priority = BACKGROUND_PRIORITY if background else 0
+            await asyncio.to_thread(self.job_store.enqueue, job.to_job(), priority)
+            return job.to_job()
+
+        self._remember(job)
+        if background:
+            self._background.add(job_id)
 
         # Start export in background
         asyncio.create_task(self._process_export(job_id))
 
-        return job
+        return job.to_job()
 
     async def get_job_status(self, job_id: str) -> Optional[ExportJob]:
         """
@@ -69,7 +227,162 @@ class ExportService:
         Returns:
             ExportJob object or None if not found
         """
-        return self.jobs.get(job_id)
+        if self.job_store is not None:
+            return await asyncio.to_thread(self.job_store.get, job_id)
+        record = self.jobs.get(job_id)
+        return record.to_job() if record else None
+
+    async def get_jobs(self, job_ids: list[str]) -> dict[str, ExportJob]:
+        """
+        Get several jobs at once.
+
+        Args:
+            job_ids: Export job identifiers
+
+        Returns:
+            Found jobs by job ID
+        """
+        if self.job_store is not None:
+            return await asyncio.to_thread(self.job_store.get_many, job_ids)
+        records = (self.jobs.get(job_id) for job_id in job_ids)
+        return {record.job_id: record.to_job() for record in records if record is not None}
+
+    async def watch_jobs(
+        self,
+        job_ids: list[str],
+        since: Optional[str] = None,
+        timeout: float = 0.0,
+    ) -> tuple[dict[str, ExportJob], str]:
+        """
+        Get jobs, waiting until their state differs from a known version.
+
+        Args:
+            job_ids: Export job identifiers
+            since: Version returned by an earlier call (None: return at once)
+            timeout: Maximum seconds to wait for a change
+
+        Returns:
+            Tuple of (found jobs by job ID, state version); the version is
+            unchanged if the timeout expired
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            changed = self._changed
+            jobs = await self.get_jobs(job_ids)
+            version = jobs_version(job_ids, jobs)
+            remaining = deadline - loop.time()
+            if since is None or version != since or remaining <= 0:
+                return jobs, version
+
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=min(WATCH_POLL_INTERVAL, remaining))
+            except asyncio.TimeoutError:
+                pass
+
+    def _notify_change(self) -> None:
+        """Wake long-polling status requests."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def _reuse_export(self, job: JobRecord) -> bool:
+        """
+        Complete a new job from a finished export of identical sources.
+
+        Args:
+            job: Newly created job (completed in place on success)
+
+        Returns:
+            True if an export was reused
+        """
+        source = self.scanner.get_file_path(job.presentation_id) if self.scanner else None
+        await self._refresh_render_version()
+        source_key = await asyncio.to_thread(self._source_key, source, job.slides)
+        if source_key is None:
+            return False
+
+        if self.job_store is not None:
+            ready = await asyncio.to_thread(self.job_store.find_completed, source_key)
+        else:
+            ready = max(
+                (other for other in self.jobs.finished_records()
+                 if other.source_key == source_key and other.status == ExportJobStatus.COMPLETED),
+                key=lambda other: other.completed_at,
+                default=None
+            )
+
+        ready_path = self.get_pdf_path(ready.job_id) if ready else None
+        if ready_path is None:
+            return False
+
+        await asyncio.to_thread(_link_or_copy, ready_path, self.exports_dir / f"{job.job_id}.pdf")
+        job.status = ExportJobStatus.COMPLETED
+        job.progress = 100
+        job.completed_at = time.time()
+        job.source_key = source_key
+
+        if self.job_store is not None:
+            await asyncio.to_thread(self.job_store.enqueue, job.to_job())
+        else:
+            self._remember(job)
+        logger.info("export reused", extra={"fields": {
+            "presentation_id": job.presentation_id,
+            "job_id": job.job_id,
+            "reused_job_id": ready.job_id,
+        }})
+        return True
+
+    def _source_key(self, source: Optional[Path], slides: Optional[str] = None) -> Optional[str]:
+        """
+        Content key of a presentation's sources (None if unknown or unreadable).
+
+        Args:
+            source: TSX file or HTML deck directory
+            slides: Slide selection; the key covers only the selected slides
+        """
+        if source is None:
+            return None
+        try:
+            if source.is_dir():
+                page_keys = html_page_keys(
+                    source, list_html_slides(source), self._render_settings(HTML_RENDER_SETTINGS)
+                )
+            else:
+                page_keys = spectacle_page_keys(source, self._render_settings(SPECTACLE_RENDER_SETTINGS))
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        selection = parse_slide_selection(slides)
+        if selection is not None:
+            if selection[-1] > len(page_keys):
+                return None
+            page_keys = [page_keys[number - 1] for number in selection]
+        return deck_key(page_keys) if page_keys else None
+
+    def _render_settings(self, settings: str) -> str:
+        """Render settings of page keys, including the viewer/frontend build version."""
+        return f"{settings};build={self.render_version}" if self.render_version else settings
+
+    async def _refresh_render_version(self) -> None:
+        """Re-fingerprint the viewer build, at most once per VIEWER_FINGERPRINT_TTL (never raises)."""
+        if not self.fingerprint_viewer or time.monotonic() - self._fingerprinted_at < VIEWER_FINGERPRINT_TTL:
+            return
+        self._fingerprinted_at = time.monotonic()
+        try:
+            index_html = await asyncio.to_thread(_fetch, f"{self.frontend_url}/")
+        except (OSError, ValueError) as e:
+            # Keep the last known version; the render itself reports an unreachable viewer
+            logger.warning("Viewer build not fingerprinted: %s", e)
+            return
+
+        version = hashlib.sha256(index_html).hexdigest()[:16]
+        if version != self.render_version:
+            logger.info("viewer build changed", extra={"fields": {
+                "previous": self.render_version or None,
+                "render_version": version,
+            }})
+            self.render_version = version
 
     def get_pdf_path(self, job_id: str) -> Optional[Path]:
         """
@@ -84,6 +397,20 @@ class ExportService:
         pdf_path = self.exports_dir / f"{job_id}.pdf"
         return pdf_path if pdf_path.exists() else None
 
+    def get_output_path(self, job_id: str, output: ExportOutput) -> Optional[Path]:
+        """
+        Get file path of a job's additional output.
+
+        Args:
+            job_id: Export job identifier
+            output: Output of the job
+
+        Returns:
+            Path to the PDF or ZIP file or None if not found
+        """
+        path = self.exports_dir / output_filename(job_id, output)
+        return path if path.exists() else None
+
     async def _process_export(self, job_id: str) -> None:
         """
         Process export job (internal method).
@@ -95,75 +422,77 @@ class ExportService:
         if not job:
             return
 
-        try:
-            # Update status to processing
-            job.status = ExportJobStatus.PROCESSING
-            job.progress = 10
-
-            # Use fresh playwright instance for each export to avoid stale browser issues
-            async with async_playwright() as p:
-                # Launch with robust options for macOS compatibility
-                browser = await p.chromium.launch(
-                    headless=True,
-                    # Additional args for macOS stability
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',  # Avoid shared memory issues
-                        '--no-sandbox',  # Required for some macOS configurations
-                        '--disable-setuid-sandbox',
-                        '--disable-gpu',  # Avoid GPU acceleration issues
-                    ]
-                )
-
-                # Create browser context and page
-                context = await browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    device_scale_factor=2,  # High DPI for better quality
-                )
-
-                page = await context.new_page()
+        await self.process_job(job)
 
-                # Navigate to presentation viewer
-                url = f"{self.frontend_url}/view/{job.presentation_id}?print=true"
-                await page.goto(url, wait_until="networkidle")
+    async def process_job(self, job: JobRecord) -> None:
+        """
+        Render a job to PDF, updating its status and progress in place.
 
-                job.progress = 30
+        Never raises: failures are recorded on the job.
 
-                # Wait for Spectacle presentation to load
-                # Spectacle uses .spectacle-v7-slide class for slides
-                await page.wait_for_selector(".spectacle-v7-slide", timeout=10000)
-                await asyncio.sleep(1)  # Additional wait for animations
+        Args:
+            job: Job to render
+        """
+        job_token = job_id_var.set(job.job_id)
+        sampler = StackSampler().start() if job.profiled and self.profile_store is not None else None
+        capture = await self._begin_capture(job)
+        started = time.perf_counter()
+        foreground = job.job_id not in self._background
+        if foreground:
+            self.foreground_renders += 1
+        logger.info("export started", extra={"fields": {"presentation_id": job.presentation_id}})
 
-                job.progress = 50
+        try:
+            await self._render_job(job)
+        finally:
+            if foreground:
+                self.foreground_renders -= 1
+            self._background.discard(job.job_id)
+            if sampler is not None:
+                await asyncio.to_thread(self.profile_store.save, job.job_id, sampler.stop(), {
+                    "kind": "export",
+                    "presentation_id": job.presentation_id,
+                    "status": job.status.value,
+                })
+            if capture is not None:
+                await self._finish_capture(job, capture)
+            logger.info("export finished", extra={"fields": {
+                "presentation_id": job.presentation_id,
+                "status": job.status.value,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            }})
+            job_id_var.reset(job_token)
+            self._drop(self.jobs.finish(job.job_id))
+            self._notify_change()
 
-                # Generate PDF
-                pdf_path = self.exports_dir / f"{job_id}.pdf"
+    async def _render_job(self, job: JobRecord) -> None:
+        """Render a job, recording the outcome on it (never raises)."""
+        job_id = job.job_id
 
-                await page.pdf(
-                    path=str(pdf_path),
-                    width="1920px",
-                    height="1080px",
-                    print_background=True,
-                    margin={"top": "0", "right": "0", "bottom": "0", "left": "0"},
-                    prefer_css_page_size=False,
-                )
+        try:
+            # Update status to processing
+            job.status = ExportJobStatus.PROCESSING
+            job.progress = 10
+            self._notify_change()
 
-                job.progress = 90
+            pdf_path = self.exports_dir / f"{job_id}.pdf"
+            source = self.scanner.get_file_path(job.presentation_id) if self.scanner else None
+            await self._refresh_render_version()
+            if self.reuse_exports:
+                # Key of the sources as they are now, before rendering them
+                job.source_key = await asyncio.to_thread(self._source_key, source, job.slides)
 
-                # Cleanup
-                await context.close()
-                await browser.close()
+            if source is not None and source.is_dir():
+                await self._export_html_deck(job, source, pdf_path)
+            else:
+                await self._export_spectacle(job, pdf_path, source)
 
             # Update job status
             job.status = ExportJobStatus.COMPLETED
             job.progress = 100
-            job.download_url = f"/api/exports/{job_id}/download"
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = time.time()
 
         except Exception as e:
-            # Update job with error
-            job.status = ExportJobStatus.FAILED
-
             # Provide detailed error message for common issues
             error_msg = str(e)
             if "Target page, context or browser has been closed" in error_msg:
@@ -177,11 +506,448 @@ class ExportService:
                     "Chromium browser not found. Run: `playwright install chromium`"
                 )
 
-            job.error = error_msg
-            job.completed_at = datetime.now(timezone.utc)
-            print(f"Export job {job_id} failed: {e}")
-            import traceback
-            traceback.print_exc()
+            job.fail(error_msg, time.time())
+            logger.exception("export failed", extra={"fields": {"presentation_id": job.presentation_id}})
+
+            # Relaunch on the next export if the browser died
+            if self._browser is not None and not self._browser.is_connected():
+                await self._reset_browser()
+
+    async def warm_up(self) -> float:
+        """
+        Start the shared browser and print a tiny page to PDF.
+
+        Pays Chromium's cold start (process launch, shared libraries, fonts)
+        before the first real export and fails loudly if the renderer is
+        unusable.
+
+        Returns:
+            Test render duration in milliseconds (excluding browser launch)
+
+        Raises:
+            Exception: Playwright error if Chromium cannot start or print
+        """
+        browser = await self._get_browser()
+
+        started = asyncio.get_running_loop().time()
+        context = await browser.new_context(viewport={"width": SLIDE_WIDTH, "height": SLIDE_HEIGHT})
+        try:
+            page = await context.new_page()
+            await page.set_content(WARMUP_PAGE)
+            document = await page.pdf(width=f"{SLIDE_WIDTH}px", height=f"{SLIDE_HEIGHT}px", print_background=True)
+        finally:
+            await context.close()
+
+        if not document.startswith(b"%PDF"):
+            raise RuntimeError("Warm-up render did not produce a PDF")
+        return round((asyncio.get_running_loop().time() - started) * 1000, 1)
+
+    async def _export_spectacle(self, job: JobRecord, pdf_path: Path, source: Optional[Path] = None) -> None:
+        """
+        Render a Spectacle presentation through the frontend viewer.
+
+        The viewer prints one page per slide. Only the selected slides
+        (``job.slides``) are printed, using Chromium page ranges of the
+        pages they lay out to (a slide may overflow onto several). With a page
+        cache, only slides whose key is not cached are printed and the rest
+        are spliced in from the cache; if everything is cached and the job
+        has no additional outputs, no browser is started. Additional outputs
+        are rendered from the same loaded page.
+
+        Args:
+            job: Job being processed (progress is updated in place)
+            pdf_path: Destination PDF path
+            source: Presentation TSX file (enables the page cache)
+        """
+        selection = parse_slide_selection(job.slides)
+        with self._phase(job, "cache"):
+            keys, pages = await self._cached_pages(
+                lambda: spectacle_page_keys(source, self._render_settings(SPECTACLE_RENDER_SETTINGS))
+                if source is not None else []
+            )
+        wanted = _selected_positions(selection, len(keys)) if keys else []
+        missing = [position for position in wanted if pages[position] is None]
+        if keys and not missing and not job.outputs:
+            await self._write_pages(job, [pages[position] for position in wanted], pdf_path, rendered=0)
+            return
+
+        # Create browser context and page (a fresh context isolates exports)
+        context = await self._new_context(
+            job,
+            viewport={"width": SLIDE_WIDTH, "height": SLIDE_HEIGHT},
+            device_scale_factor=SPECTACLE_SCALE,  # High DPI for better quality
+        )
+
+        rendered = None
+        written = False
+        try:
+            page = await context.new_page()
+
+            # Navigate to presentation viewer
+            url = f"{self.frontend_url}/view/{job.presentation_id}?print=true"
+            with self._phase(job, "navigation"):
+                await page.goto(url, wait_until="networkidle")
+
+            job.progress = 30
+
+            # Wait for Spectacle presentation to load
+            # Spectacle uses .spectacle-v7-slide class for slides
+            with self._phase(job, "slides_ready"):
+                await page.wait_for_selector(SPECTACLE_SLIDE_SELECTOR, timeout=10000)
+                await asyncio.sleep(1)  # Additional wait for animations
+
+            job.progress = 50
+
+            # Printed pages per slide and in total, when measured (cached pages only fit a 1:1 layout)
+            spans = page_count = None
+            if keys and missing and len(missing) < len(keys):
+                # Cached pages map 1:1 to slide blocks only if no slide spills onto extra pages
+                with self._phase(job, "layout"):
+                    spans, page_count = await _printed_layout(page)
+                if page_count == len(keys):
+                    # Print only the changed/selected slides
+                    try:
+                        with self._phase(job, "pdf"):
+                            document = await page.pdf(**PDF_OPTIONS, page_ranges=_page_ranges(missing))
+                        rendered = await asyncio.to_thread(split_pdf_pages, document)
+                    except Exception as e:
+                        logger.warning("Partial print failed, printing the whole deck: %s", e)
+                    if rendered is not None and len(rendered) != len(missing):
+                        rendered = None
+                else:
+                    logger.warning(
+                        "Deck lays out as %d pages for %d slide blocks; page cache not used",
+                        page_count, len(keys)
+                    )
+
+            if rendered is None and keys and missing and page_count in (None, len(keys)):
+                with self._phase(job, "pdf"):
+                    document = await page.pdf(**PDF_OPTIONS)
+                rendered = await asyncio.to_thread(split_pdf_pages, document)
+                missing = list(range(len(keys)))
+                if len(rendered) != len(keys):
+                    logger.warning(
+                        "Deck printed %d pages for %d slide blocks; page cache not used",
+                        len(rendered), len(keys)
+                    )
+                    rendered = None
+                    if selection is None:
+                        # The whole deck is what was asked for: keep this print
+                        await self._write_document(job, document, pdf_path)
+                        written = True
+
+            if rendered is None and not written and (missing or not keys):
+                # No cache, or slides could not be mapped to pages: print as is
+                options = dict(PDF_OPTIONS)
+                if selection is not None:
+                    # Slides may span several pages: select the pages they print to
+                    if spans is None:
+                        with self._phase(job, "layout"):
+                            spans, page_count = await _printed_layout(page)
+                    options["page_ranges"] = _printed_page_ranges(selection, spans, page_count)
+                with self._phase(job, "pdf"):
+                    document = await page.pdf(**options)
+                await self._write_document(job, document, pdf_path)
+                written = True
+
+            job.progress = 70
+
+            if job.outputs:
+                if not wanted:
+                    slide_count = await page.locator(SPECTACLE_SLIDE_SELECTOR).count()
+                    wanted = _selected_positions(selection, slide_count)
+                await self._render_spectacle_outputs(job, page, wanted, selection)
+
+            job.progress = 90 if written else 80
+        finally:
+            await self._close_context(job, context)
+
+        if written:
+            return
+        for position, document in zip(missing, rendered or []):
+            pages[position] = document
+            await asyncio.to_thread(self.page_cache.put, keys[position], document)
+        await self._write_pages(
+            job, [pages[position] for position in wanted], pdf_path, rendered=len(missing) if rendered else 0
+        )
+
+    async def _render_spectacle_outputs(
+        self,
+        job: JobRecord,
+        page: Page,
+        positions: list[int],
+        selection: Optional[list[int]],
+    ) -> None:
+        """
+        Render a job's additional outputs from the loaded viewer page.
+
+        Args:
+            job: Job with outputs
+            page: Viewer page with all slides loaded
+            positions: 0-based positions of the exported slides
+            selection: 1-based slide selection (None: all slides)
+        """
+        session = await page.context.new_cdp_session(page)
+        slides = page.locator(SPECTACLE_SLIDE_SELECTOR)
+        try:
+            for output in job.outputs:
+                path = self.exports_dir / output_filename(job.job_id, output)
+                with self._phase(job, f"output.{output.name}"):
+                    await apply_layout(session, page, output)
+                    if output.format == ExportOutputFormat.PDF:
+                        options = pdf_options(PDF_OPTIONS, output)
+                        if selection is not None:
+                            spans, page_count = await _printed_layout(page, output.height)
+                            options["page_ranges"] = _printed_page_ranges(selection, spans, page_count)
+                        await self._write_document(job, await page.pdf(**options), path)
+                    else:
+                        images = [
+                            (position + 1, await slides.nth(position).screenshot(type=output.format.value))
+                            for position in positions
+                        ]
+                        await asyncio.to_thread(write_image_archive, images, output, path)
+        finally:
+            await session.detach()
+
+    async def _export_html_deck(self, job: JobRecord, deck_dir: Path, pdf_path: Path) -> None:
+        """
+        Render a static HTML deck straight from disk.
+
+        Every selected slideN.html is opened in its own page of one browser
+        context, up to html_concurrency at a time, printed to a single
+        1920x1080 page and stitched into the final PDF. No frontend is
+        involved. With a page cache, only slides whose key is not cached
+        are rendered; additional outputs are rendered from the same page
+        load as the slide's main page.
+
+        Args:
+            job: Job being processed (progress is updated in place)
+            deck_dir: Directory with slideN.html pages
+            pdf_path: Destination PDF path
+        """
+        slides = list_html_slides(deck_dir)
+        if not slides:
+            raise ValueError(f"No slideN.html pages found in {deck_dir}")
+        wanted = _selected_positions(parse_slide_selection(job.slides), len(slides))
+
+        with self._phase(job, "cache"):
+            keys, pages = await self._cached_pages(
+                lambda: html_page_keys(deck_dir, slides, self._render_settings(HTML_RENDER_SETTINGS))
+            )
+        if not keys:
+            pages = [None] * len(slides)
+        missing = [position for position in wanted if pages[position] is None]
+        # Additional outputs need every exported slide loaded
+        load = wanted if job.outputs else missing
+        if not load:
+            await self._write_pages(job, [pages[position] for position in wanted], pdf_path, rendered=0)
+            return
+
+        semaphore = asyncio.Semaphore(self.html_concurrency)
+        rendered = 0
+        outputs: dict[str, list[Optional[bytes]]] = {output.name: [None] * len(slides) for output in job.outputs or []}
+
+        context = await self._new_context(
+            job,
+            viewport={"width": SLIDE_WIDTH, "height": SLIDE_HEIGHT},
+        )
+
+        job.progress = 30
+
+        async def render(position: int) -> None:
+            nonlocal rendered
+            stem = slides[position].stem
+            document = None
+            async with semaphore:
+                page = await context.new_page()
+                try:
+                    with self._phase(job, f"{stem}.navigation"):
+                        await page.goto(slides[position].as_uri(), wait_until="networkidle")
+                    # Slides are designed for screens; keep the on-screen layout
+                    await page.emulate_media(media="screen")
+                    if pages[position] is None:
+                        with self._phase(job, f"{stem}.pdf"):
+                            document = await page.pdf(**PDF_OPTIONS, page_ranges="1")
+                    if job.outputs:
+                        session = await context.new_cdp_session(page)
+                        for output in job.outputs:
+                            with self._phase(job, f"{stem}.{output.name}"):
+                                await apply_layout(session, page, output)
+                                if output.format == ExportOutputFormat.PDF:
+                                    result = await page.pdf(**pdf_options(PDF_OPTIONS, output), page_ranges="1")
+                                else:
+                                    result = await page.screenshot(type=output.format.value)
+                            outputs[output.name][position] = result
+                finally:
+                    await page.close()
+
+            if document is not None:
+                pages[position] = document
+                if keys:
+                    await asyncio.to_thread(self.page_cache.put, keys[position], document)
+            rendered += 1
+            job.progress = 30 + int(55 * rendered / len(load))
+
+        try:
+            await asyncio.gather(*(render(position) for position in load))
+        finally:
+            await self._close_context(job, context)
+
+        await self._write_pages(job, [pages[position] for position in wanted], pdf_path, rendered=len(missing))
+        for output in job.outputs or []:
+            path = self.exports_dir / output_filename(job.job_id, output)
+            results = outputs[output.name]
+            if output.format == ExportOutputFormat.PDF:
+                await asyncio.to_thread(
+                    merge_pdf_pages, [results[position] for position in wanted], path, True, _document_title(job)
+                )
+            else:
+                images = [(position + 1, results[position]) for position in wanted]
+                await asyncio.to_thread(write_image_archive, images, output, path)
+
+    async def _write_document(self, job: JobRecord, document: bytes, path: Path) -> None:
+        """Write a printed document, titled with the slide range of partial exports."""
+        if job.slides:
+            await asyncio.to_thread(merge_pdf_pages, [document], path, False, _document_title(job))
+        else:
+            await asyncio.to_thread(_write_atomic, path, document)
+
+    async def _new_context(self, job: JobRecord, **options) -> BrowserContext:
+        """Open a browser context for a job, tracing it and recording a HAR if the job is captured."""
+        capture = self._captures.get(job.job_id)
+        with self._phase(job, "browser"):
+            browser = await self._get_browser()
+        with self._phase(job, "context"):
+            if capture is None:
+                return await browser.new_context(**options)
+            context = await browser.new_context(**options, **capture.context_options())
+            await capture.attach(context)
+            return context
+
+    async def _close_context(self, job: JobRecord, context: BrowserContext) -> None:
+        """Close a job's browser context, saving its trace first (the HAR is written on close)."""
+        capture = self._captures.get(job.job_id)
+        with self._phase(job, "close"):
+            if capture is not None:
+                await capture.detach(context)
+            await context.close()
+
+    def _phase(self, job: JobRecord, name: str):
+        """Time a render phase of a captured job (no-op for other jobs)."""
+        capture = self._captures.get(job.job_id)
+        return capture.phase(name) if capture is not None else nullcontext()
+
+    async def _begin_capture(self, job: JobRecord) -> Optional[ExportCapture]:
+        """Start a diagnostic capture of a job, if diagnostics are enabled."""
+        if self.diagnostics is None:
+            return None
+        try:
+            capture = await asyncio.to_thread(self.diagnostics.begin, job.job_id)
+        except (OSError, ValueError) as e:
+            logger.warning("Diagnostics capture not started: %s", e)
+            return None
+        self._captures[job.job_id] = capture
+        return capture
+
+    async def _finish_capture(self, job: JobRecord, capture: ExportCapture) -> None:
+        """Keep the capture of a failed or slow job, discard any other (never raises)."""
+        self._captures.pop(job.job_id, None)
+        try:
+            kept = await asyncio.to_thread(
+                self.diagnostics.finish,
+                capture,
+                job.job_id,
+                {"presentation_id": job.presentation_id, "status": job.status.value, "error": job.error},
+                job.status == ExportJobStatus.FAILED,
+            )
+        except OSError as e:
+            logger.warning("Diagnostics capture not saved: %s", e)
+            return
+        if kept is not None:
+            logger.info("export diagnostics saved", extra={"fields": {
+                "presentation_id": job.presentation_id,
+                "path": str(kept),
+            }})
+
+    async def _cached_pages(self, compute_keys) -> tuple[list[str], list[Optional[bytes]]]:
+        """
+        Compute page keys and look them up in the page cache.
+
+        Args:
+            compute_keys: Callable returning page keys (run in a thread)
+
+        Returns:
+            Tuple of (keys, cached page or None per key); both empty when
+            there is no page cache or the keys cannot be computed
+        """
+        if self.page_cache is None:
+            return [], []
+
+        def lookup() -> tuple[list[str], list[Optional[bytes]]]:
+            keys = compute_keys()
+            return keys, [self.page_cache.get(key) for key in keys]
+
+        try:
+            return await asyncio.to_thread(lookup)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Page cache lookup failed: %s", e)
+            return [], []
+
+    async def _write_pages(self, job: JobRecord, pages: list[bytes], pdf_path: Path, rendered: int) -> None:
+        """Splice single-slide pages into the final PDF."""
+        with self._phase(job, "write"):
+            await asyncio.to_thread(merge_pdf_pages, pages, pdf_path, True, _document_title(job))
+        if self.page_cache is not None:
+            await asyncio.to_thread(self.page_cache.prune)
+        logger.info("export pages", extra={"fields": {
+            "pages": len(pages),
+            "rendered": rendered,
+            "cached": len(pages) - rendered,
+        }})
+        job.progress = 90
+
+    async def _get_browser(self) -> Browser:
+        """Return the shared browser, (re)launching it if needed."""
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                await self._reset_browser()
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            try:
+                self._browser = await self._launch_browser(self._playwright)
+            except Exception:
+                await self._reset_browser()
+                raise
+            return self._browser
+
+    async def _reset_browser(self) -> None:
+        """Close the shared browser and Playwright driver, ignoring errors."""
+        browser, playwright = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+    async def _launch_browser(self, playwright: Playwright) -> Browser:
+        """Launch headless Chromium with robust options for macOS/Docker."""
+        return await playwright.chromium.launch(
+            headless=True,
+            args=BROWSER_ARGS
+        )
 
     async def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """
@@ -193,31 +959,177 @@ class ExportService:
         Returns:
             Number of jobs cleaned up
         """
-        cleaned = 0
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
+        cutoff_time = time.time() - (max_age_hours * 3600)
+
+        expired = [
+            job for job in self.jobs.finished_records()
+            if job.completed_at is not None and job.completed_at < cutoff_time
+        ]
 
-        job_ids_to_remove = []
+        # Remove jobs from memory and their PDF files
+        for job in expired:
+            self.jobs.remove(job.job_id)
+        self._drop(expired)
+
+        return len(expired)
+
+    async def load(self) -> tuple[int, int]:
+        """
+        Current export load.
 
-        for job_id, job in self.jobs.items():
-            if job.completed_at is None:
-                continue
+        Returns:
+            Tuple of (jobs rendering, jobs waiting to be rendered); with a job
+            store, the load of all export workers
+        """
+        if self.job_store is not None:
+            rendering = await asyncio.to_thread(self.job_store.count, ExportJobStatus.PROCESSING)
+            queued = await asyncio.to_thread(self.job_store.count, ExportJobStatus.PENDING)
+            return rendering, queued
+        active = self.jobs.active_records()
+        rendering = sum(1 for job in active if job.status == ExportJobStatus.PROCESSING)
+        return rendering, len(active) - rendering
 
-            job_age = job.completed_at.timestamp()
-            if job_age < cutoff_time:
-                # Remove PDF file if exists
-                pdf_path = self.exports_dir / f"{job_id}.pdf"
-                if pdf_path.exists():
-                    pdf_path.unlink()
+    def memory_usage(self) -> dict:
+        """
+        Report memory held by in-memory job records.
 
-                job_ids_to_remove.append(job_id)
-                cleaned += 1
+        Returns:
+            Job counts, history limit, dropped jobs and approximate bytes
+        """
+        return self.jobs.memory_usage()
 
-        # Remove jobs from memory
-        for job_id in job_ids_to_remove:
-            del self.jobs[job_id]
+    def _remember(self, job: JobRecord) -> None:
+        """Track a job of this process, dropping the oldest finished jobs beyond the history size."""
+        self._drop(self.jobs.add(job))
 
-        return cleaned
+    def _drop(self, jobs: list[JobRecord]) -> None:
+        """Delete the files of jobs dropped from memory (they can no longer be downloaded)."""
+        for job in jobs:
+            remove_job_files(self.exports_dir, job.job_id)
 
     async def close(self) -> None:
-        """Cleanup resources (no-op, browser is created per-export)."""
-        pass
+        """Close the shared browser."""
+        async with self._browser_lock:
+            await self._reset_browser()
+
+
+def remove_job_files(exports_dir: Path, job_id: str) -> None:
+    """Delete a job's PDF and additional outputs."""
+    (exports_dir / f"{job_id}.pdf").unlink(missing_ok=True)
+    for path in exports_dir.glob(f"{job_id}.*.*"):
+        path.unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file and rename."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def jobs_version(job_ids: list[str], jobs: dict[str, ExportJob]) -> str:
+    """
+    Version of the observable state (status, progress) of a set of jobs.
+
+    Args:
+        job_ids: Requested job identifiers
+        jobs: Found jobs by job ID
+
+    Returns:
+        Short opaque version string
+    """
+    digest = hashlib.sha256()
+    for job_id in sorted(set(job_ids)):
+        job = jobs.get(job_id)
+        state = f"{job.status.value}:{job.progress}" if job else "missing"
+        digest.update(f"{job_id}={state};".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _selected_positions(selection: Optional[list[int]], slide_count: int) -> list[int]:
+    """
+    Convert a 1-based slide selection to 0-based positions.
+
+    Raises:
+        ValueError: If a selected slide does not exist
+    """
+    if selection is None:
+        return list(range(slide_count))
+    if selection[-1] > slide_count:
+        raise ValueError(f"Slide {selection[-1]} does not exist (the presentation has {slide_count} slides)")
+    return [number - 1 for number in selection]
+
+
+async def _printed_layout(page: Page, page_height: int = SLIDE_HEIGHT) -> tuple[list[int], int]:
+    """
+    Measure the pages a loaded viewer page prints to, from its print-media layout.
+
+    Args:
+        page: Viewer page with all slides loaded
+        page_height: Printed page height in CSS pixels
+
+    Returns:
+        Tuple of (pages spanned by each slide, total page count); the total
+        is greater than the slide count if a slide overflows
+    """
+    await page.emulate_media(media="print")
+    try:
+        layout = await page.evaluate(_PRINTED_PAGES, [SPECTACLE_SLIDE_SELECTOR, page_height])
+    finally:
+        await page.emulate_media(media="null")
+    return layout["spans"], layout["pages"]
+
+
+def _printed_page_ranges(selection: list[int], spans: list[int], page_count: int) -> str:
+    """
+    Chromium page ranges printing the selected slides.
+
+    Args:
+        selection: 1-based slide selection
+        spans: Pages spanned by each slide
+        page_count: Total printed pages
+
+    Returns:
+        1-based page ranges, e.g. ``"2-4"`` for slides 2-3 when slide 2 overflows
+
+    Raises:
+        ValueError: If a selected slide does not exist or pages print outside the slides
+    """
+    _selected_positions(selection, len(spans))
+    if sum(spans) != page_count:
+        raise ValueError(
+            f"Cannot select slides: the deck prints {page_count} pages, "
+            f"{page_count - sum(spans)} of them outside its slides"
+        )
+    selected = set(selection)
+    pages = []
+    first = 1
+    for number, span in enumerate(spans, start=1):
+        if number in selected:
+            pages.extend(range(first, first + span))
+        first += span
+    return format_slide_selection(pages)
+
+
+def _page_ranges(positions: list[int]) -> str:
+    """Chromium page ranges (1-based) of 0-based slide positions."""
+    return format_slide_selection([position + 1 for position in positions])
+
+
+def _document_title(job: JobRecord) -> Optional[str]:
+    """PDF title marking partial exports with their slide range."""
+    return f"{job.presentation_id} (slides {job.slides})" if job.slides else None
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link a finished PDF under a new name, copying across file systems."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _fetch(url: str, timeout: float = 5.0) -> bytes:
+    """GET a URL and return the response body."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
@@ -0,0 +1,233 @@
+"""
+Export Worker
+
+Renders export jobs outside the API process. Workers claim jobs from the
+shared JobStore, render them with their own browser and write PDFs to
+the shared exports directory, so export capacity scales with the number
+of worker processes (``--processes``) and containers.
+
+Usage (from the backend directory, with the API in EXPORT_QUEUE=external mode):
+    python -m services.export_worker --processes 2 --concurrency 2
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from typing import Optional
+
+import config
+from models.schemas import ExportJob
+from services.export_service import ExportService, remove_job_files
+from services.job_history import JobRecord
+from services.job_store import JobStore
+from services.profiler import ProfileStore
+from services.telemetry import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+class ExportWorker:
+    """Claims queued export jobs and renders them."""
+
+    def __init__(
+        self,
+        service: ExportService,
+        store: JobStore,
+        concurrency: int = 1,
+        poll_interval: float = 0.5,
+        heartbeat_interval: float = 2.0,
+        stale_after: float = 60.0,
+        cleanup_interval: float = 3600.0,
+        max_age_hours: int = 24,
+        worker_id: Optional[str] = None,
+    ):
+        """
+        Initialize export worker.
+
+        Args:
+            service: Export service used for rendering (without a job store)
+            store: Shared job queue and store
+            concurrency: Jobs rendered at once by this worker
+            poll_interval: Seconds between queue polls when idle
+            heartbeat_interval: Seconds between progress/heartbeat writes
+                (of running jobs, and of the worker itself for readiness)
+            stale_after: Seconds without a heartbeat after which another
+                worker's job is returned to the queue
+            cleanup_interval: Seconds between removals of old jobs and PDFs
+            max_age_hours: Age after which finished jobs and PDFs are removed
+            worker_id: Identifier recorded on claimed jobs
+        """
+        self.service = service
+        self.store = store
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.cleanup_interval = cleanup_interval
+        self.max_age_hours = max_age_hours
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._running: set[asyncio.Task] = set()
+        self._last_cleanup: Optional[float] = None
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Process jobs until ``stop`` is set, then finish running jobs.
+
+        Args:
+            stop: Event that ends the claim loop
+        """
+        loop = asyncio.get_running_loop()
+        next_maintenance = 0.0
+        next_heartbeat = 0.0
+
+        try:
+            while not stop.is_set():
+                if loop.time() >= next_heartbeat:
+                    await asyncio.to_thread(self.store.worker_heartbeat, self.worker_id, self.concurrency)
+                    next_heartbeat = loop.time() + self.heartbeat_interval
+                if loop.time() >= next_maintenance:
+                    await self._maintain()
+                    next_maintenance = loop.time() + self.stale_after / 2
+
+                job = None
+                if len(self._running) < self.concurrency:
+                    job = await asyncio.to_thread(self.store.claim, self.worker_id)
+
+                if job is not None:
+                    task = asyncio.create_task(self.process(job))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+                    continue
+
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+        finally:
+            await asyncio.to_thread(self.store.remove_worker, self.worker_id)
+
+    async def process(self, job: ExportJob) -> None:
+        """
+        Render a claimed job, persisting progress and a heartbeat meanwhile.
+
+        Args:
+            job: Job claimed from the store
+        """
+        logger.info("Worker %s claimed %s", self.worker_id, job.job_id)
+        record = JobRecord.from_job(job)
+        render = asyncio.create_task(self.service.process_job(record))
+
+        while True:
+            done, _pending = await asyncio.wait({render}, timeout=self.heartbeat_interval)
+            # Written after the render finished too, so the outcome is never lost
+            await asyncio.to_thread(self.store.update, record.to_job())
+            if done:
+                break
+
+    async def _maintain(self) -> None:
+        """Requeue abandoned jobs and remove expired ones with their PDFs."""
+        requeued = await asyncio.to_thread(self.store.requeue_stale, self.stale_after)
+        if requeued:
+            logger.warning("Worker %s requeued %d abandoned job(s)", self.worker_id, requeued)
+
+        now = asyncio.get_running_loop().time()
+        if self._last_cleanup is not None and now - self._last_cleanup < self.cleanup_interval:
+            return
+        self._last_cleanup = now
+
+        cutoff = time.time() - self.max_age_hours * 3600
+        job_ids = await asyncio.to_thread(self.store.finished_before, cutoff)
+        for job_id in job_ids:
+            remove_job_files(self.service.exports_dir, job_id)
+        await asyncio.to_thread(self.store.delete, job_ids)
+        if job_ids:
+            logger.info("Worker %s removed %d expired job(s)", self.worker_id, len(job_ids))
+
+
+async def serve(concurrency: int, poll_interval: float) -> None:
+    """
+    Run one worker process with configuration shared with the API.
+
+    Args:
+        concurrency: Jobs rendered at once
+        poll_interval: Seconds between queue polls when idle
+    """
+    configure_logging(config.LOG_LEVEL, json_format=config.LOG_FORMAT == "json")
+    store = JobStore(str(config.JOB_STORE_PATH))
+    service = ExportService(
+        frontend_url=config.FRONTEND_URL,
+        exports_dir=str(config.EXPORTS_DIR),
+        scanner=config.create_scanner(),
+        html_concurrency=config.HTML_EXPORT_CONCURRENCY,
+        profile_store=ProfileStore(str(config.PROFILES_DIR)),
+        page_cache=config.create_page_cache(),
+        reuse_exports=config.PRERENDER,
+        diagnostics=config.create_diagnostics(),
+        render_version=config.RENDER_VERSION,
+        fingerprint_viewer=config.RENDER_VERSION is None,
+    )
+    worker = ExportWorker(service, store, concurrency=concurrency, poll_interval=poll_interval)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Export worker %s started (queue: %s, concurrency: %d)", worker.worker_id, store.path, concurrency)
+    if config.EXPORT_WARMUP:
+        try:
+            await service.warm_up()
+        except Exception as e:
+            logger.warning("Export worker warm-up failed: %s", e)
+
+    try:
+        await worker.run(stop)
+    finally:
+        await service.close()
+        logger.info("Export worker %s stopped", worker.worker_id)
+
+
+def _run_process(concurrency: int, poll_interval: float) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(serve(concurrency, poll_interval))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Parse arguments and start one or more worker processes."""
+    parser = argparse.ArgumentParser(description="Render queued presentation exports")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes (each with its own browser)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Jobs rendered at once per process")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Queue poll interval when idle, seconds")
+    args = parser.parse_args(argv)
+
+    if args.processes <= 1:
+        _run_process(args.concurrency, args.poll_interval)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_run_process, args=(args.concurrency, args.poll_interval), name=f"export-worker-{n}")
+        for n in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    # Forward SIGTERM (docker stop) so every child finishes its running jobs
+    signal.signal(signal.SIGTERM, lambda *_: [process.terminate() for process in processes])
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
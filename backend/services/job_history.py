@@ -0,0 +1,246 @@
+"""
+Job History
+
+Compact in-memory records of export jobs. Pending and processing jobs are
+kept until they finish; finished jobs go to a ring buffer holding the most
+recent ``max_finished`` jobs, so a long-running API process keeps a bounded
+amount of job state. Records are converted to ``ExportJob`` models only
+when they leave the export service (API responses).
+"""
+import sys
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from models.schemas import ExportJob, ExportJobStatus, ExportOutput
+
+
+# Longest error message kept on a failed job (tracebacks are logged, not stored)
+MAX_ERROR_LENGTH = 500
+
+_FINISHED = (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
+
+
+class JobRecord:
+    """Mutable state of one export job, with timestamps as epoch seconds."""
+
+    __slots__ = (
+        "job_id",
+        "presentation_id",
+        "status",
+        "progress",
+        "error",
+        "created_at",
+        "completed_at",
+        "profiled",
+        "slides",
+        "outputs",
+        "source_key",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        presentation_id: str,
+        created_at: float,
+        status: ExportJobStatus = ExportJobStatus.PENDING,
+        progress: int = 0,
+        error: Optional[str] = None,
+        completed_at: Optional[float] = None,
+        profiled: bool = False,
+        slides: Optional[str] = None,
+        outputs: Optional[list[ExportOutput]] = None,
+        source_key: Optional[str] = None,
+    ):
+        self.job_id = job_id
+        # Exports of the same deck share one id string
+        self.presentation_id = sys.intern(presentation_id)
+        # Enum members are singletons: no per-job status strings
+        self.status = ExportJobStatus(status)
+        self.progress = progress
+        self.error = error
+        self.created_at = created_at
+        self.completed_at = completed_at
+        self.profiled = profiled
+        self.slides = slides
+        self.outputs = outputs or None
+        self.source_key = source_key
+
+    @classmethod
+    def from_job(cls, job: ExportJob) -> "JobRecord":
+        """
+        Create a record from an API/store model.
+
+        Args:
+            job: Export job model
+
+        Returns:
+            Equivalent record
+        """
+        return cls(
+            job_id=job.job_id,
+            presentation_id=job.presentation_id,
+            created_at=job.created_at.timestamp(),
+            status=job.status,
+            progress=job.progress or 0,
+            error=job.error,
+            completed_at=job.completed_at.timestamp() if job.completed_at else None,
+            profiled=job.profiled,
+            slides=job.slides,
+            outputs=job.outputs,
+            source_key=job.source_key,
+        )
+
+    def to_job(self) -> ExportJob:
+        """
+        Convert to the API model.
+
+        Returns:
+            ExportJob with datetimes and the download URL of completed jobs
+        """
+        completed = self.status == ExportJobStatus.COMPLETED
+        return ExportJob(
+            job_id=self.job_id,
+            presentation_id=self.presentation_id,
+            status=self.status,
+            progress=self.progress,
+            download_url=f"/api/exports/{self.job_id}/download" if completed else None,
+            error=self.error,
+            created_at=datetime.fromtimestamp(self.created_at, timezone.utc),
+            completed_at=(
+                datetime.fromtimestamp(self.completed_at, timezone.utc)
+                if self.completed_at is not None else None
+            ),
+            profiled=self.profiled,
+            slides=self.slides,
+            outputs=self.outputs,
+            source_key=self.source_key,
+        )
+
+    def fail(self, error: str, completed_at: float) -> None:
+        """
+        Mark the job failed, truncating long error messages.
+
+        Args:
+            error: Error message
+            completed_at: Epoch seconds of the failure
+        """
+        if len(error) > MAX_ERROR_LENGTH:
+            error = error[:MAX_ERROR_LENGTH - 1] + "…"
+        self.status = ExportJobStatus.FAILED
+        self.error = error
+        self.completed_at = completed_at
+
+    @property
+    def finished(self) -> bool:
+        """True once the job completed or failed."""
+        return self.status in _FINISHED
+
+
+class JobHistory:
+    """Active job records plus a ring buffer of the most recent finished ones."""
+
+    def __init__(self, max_finished: int = 1000):
+        """
+        Initialize job history.
+
+        Args:
+            max_finished: Finished jobs kept; the oldest are dropped first
+        """
+        self.max_finished = max(1, max_finished)
+        self._active: dict[str, JobRecord] = {}
+        self._finished: OrderedDict[str, JobRecord] = OrderedDict()
+        self.evicted = 0
+
+    def add(self, record: JobRecord) -> list[JobRecord]:
+        """
+        Track a job (finished records go straight to the history).
+
+        Args:
+            record: Job record
+
+        Returns:
+            Finished records dropped to make room
+        """
+        if record.finished:
+            self._active.pop(record.job_id, None)
+            self._finished[record.job_id] = record
+            return self._trim()
+        self._active[record.job_id] = record
+        return []
+
+    def finish(self, job_id: str) -> list[JobRecord]:
+        """
+        Move a job that completed or failed into the history.
+
+        Args:
+            job_id: Export job identifier
+
+        Returns:
+            Finished records dropped to make room
+        """
+        record = self._active.get(job_id)
+        if record is None or not record.finished:
+            return []
+        return self.add(record)
+
+    def remove(self, job_id: str) -> None:
+        """Forget a job."""
+        self._active.pop(job_id, None)
+        self._finished.pop(job_id, None)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """Record of a job, or None if unknown or dropped."""
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+    def active_records(self) -> list[JobRecord]:
+        """Pending and processing records."""
+        return list(self._active.values())
+
+    def finished_records(self) -> list[JobRecord]:
+        """Finished records, oldest first."""
+        return list(self._finished.values())
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._active or job_id in self._finished
+
+    def __iter__(self) -> Iterator[JobRecord]:
+        yield from list(self._active.values())
+        yield from list(self._finished.values())
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._finished)
+
+    def memory_usage(self) -> dict:
+        """
+        Approximate memory held by job records.
+
+        Returns:
+            Counts of active and finished jobs, the history limit, jobs
+            dropped so far and the size of records and their strings in bytes
+        """
+        size = sys.getsizeof(self._active) + sys.getsizeof(self._finished)
+        seen: set[int] = set()
+        for record in self:
+            size += sys.getsizeof(record)
+            for name in ("job_id", "presentation_id", "error", "slides", "source_key"):
+                value = getattr(record, name)
+                if value is not None and id(value) not in seen:
+                    seen.add(id(value))
+                    size += sys.getsizeof(value)
+        return {
+            "active": len(self._active),
+            "finished": len(self._finished),
+            "max_finished": self.max_finished,
+            "evicted": self.evicted,
+            "bytes": size,
+        }
+
+    def _trim(self) -> list[JobRecord]:
+        """Drop the oldest finished records beyond max_finished."""
+        dropped = []
+        while len(self._finished) > self.max_finished:
+            _job_id, record = self._finished.popitem(last=False)
+            dropped.append(record)
+        self.evicted += len(dropped)
+        return dropped
@@ -0,0 +1,357 @@
+"""
+Export Job Store
+
+SQLite-backed export queue and job store shared by the API and export
+workers. The database lives on the exports volume, so any number of
+worker processes (or containers mounting the same volume on one host)
+can claim jobs from it.
+"""
+import json
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from models.schemas import ExportJob, ExportJobStatus, ExportOutput
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS export_jobs (
+    job_id TEXT PRIMARY KEY,
+    presentation_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER,
+    download_url TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    completed_at REAL,
+    worker_id TEXT,
+    heartbeat_at REAL,
+    profiled INTEGER NOT NULL DEFAULT 0,
+    source_key TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    slides TEXT,
+    outputs TEXT
+);
+CREATE INDEX IF NOT EXISTS export_jobs_queue ON export_jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS export_workers (
+    worker_id TEXT PRIMARY KEY,
+    heartbeat_at REAL NOT NULL,
+    concurrency INTEGER NOT NULL DEFAULT 1
+);
+"""
+
+_COLUMNS = (
+    "job_id, presentation_id, status, progress, download_url, error, created_at, completed_at, profiled, source_key, "
+    "slides, outputs"
+)
+
+# Columns added after the first release: name -> definition (for ALTER TABLE)
+_ADDED_COLUMNS = {
+    "profiled": "INTEGER NOT NULL DEFAULT 0",
+    "source_key": "TEXT",
+    "priority": "INTEGER NOT NULL DEFAULT 0",
+    "slides": "TEXT",
+    "outputs": "TEXT",
+}
+
+# Priority of speculative pre-renders: claimed after every user export
+BACKGROUND_PRIORITY = -1
+
+
+class JobStore:
+    """Export queue and job records in a SQLite database."""
+
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        """
+        Initialize job store, creating the database if needed.
+
+        Args:
+            path: SQLite database file (on the shared exports volume)
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(export_jobs)")}
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in existing:
+                    connection.execute(f"ALTER TABLE export_jobs ADD COLUMN {name} {definition}")
+            connection.execute("CREATE INDEX IF NOT EXISTS export_jobs_source ON export_jobs (source_key)")
+
+    def enqueue(self, job: ExportJob, priority: int = 0) -> None:
+        """
+        Add a job to the queue (or record an already completed one).
+
+        Args:
+            job: Job to store (pending jobs are claimed by workers)
+            priority: Higher priorities are claimed first
+                (BACKGROUND_PRIORITY for pre-renders)
+        """
+        with closing(self._connect()) as connection:
+            connection.execute(
+                f"INSERT INTO export_jobs ({_COLUMNS}, priority) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*_to_row(job), priority)
+            )
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Export job identifier
+
+        Returns:
+            ExportJob or None if not found
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                f"SELECT {_COLUMNS} FROM export_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def get_many(self, job_ids: list[str]) -> dict[str, ExportJob]:
+        """
+        Get several jobs in one query.
+
+        Args:
+            job_ids: Export job identifiers
+
+        Returns:
+            Found jobs by job ID
+        """
+        if not job_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in job_ids)
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM export_jobs WHERE job_id IN ({placeholders})", list(job_ids)
+            ).fetchall()
+        return {row[0]: _from_row(row) for row in rows}
+
+    def claim(self, worker_id: str) -> Optional[ExportJob]:
+        """
+        Atomically take the oldest pending job of the highest priority.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            Claimed job (now processing) or None if the queue is empty
+        """
+        now = time.time()
+        with closing(self._connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    f"SELECT {_COLUMNS} FROM export_jobs WHERE status = ? "
+                    "ORDER BY priority DESC, created_at LIMIT 1",
+                    (ExportJobStatus.PENDING.value,)
+                ).fetchone()
+                if row is None:
+                    connection.execute("COMMIT")
+                    return None
+
+                connection.execute(
+                    "UPDATE export_jobs SET status = ?, worker_id = ?, heartbeat_at = ? WHERE job_id = ?",
+                    (ExportJobStatus.PROCESSING.value, worker_id, now, row[0])
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        job = _from_row(row)
+        job.status = ExportJobStatus.PROCESSING
+        return job
+
+    def update(self, job: ExportJob) -> None:
+        """
+        Persist a job's progress or outcome and refresh its heartbeat.
+
+        Args:
+            job: Job with updated fields
+        """
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "UPDATE export_jobs SET status = ?, progress = ?, download_url = ?, error = ?, "
+                "completed_at = ?, source_key = ?, heartbeat_at = ? WHERE job_id = ?",
+                (
+                    job.status.value,
+                    job.progress,
+                    job.download_url,
+                    job.error,
+                    job.completed_at.timestamp() if job.completed_at else None,
+                    job.source_key,
+                    time.time(),
+                    job.job_id,
+                )
+            )
+
+    def find_completed(self, source_key: str) -> Optional[ExportJob]:
+        """
+        Find the newest completed job rendered from identical sources.
+
+        Args:
+            source_key: Content key of the presentation sources
+
+        Returns:
+            Completed job or None
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                f"SELECT {_COLUMNS} FROM export_jobs WHERE source_key = ? AND status = ? "
+                "ORDER BY completed_at DESC LIMIT 1",
+                (source_key, ExportJobStatus.COMPLETED.value)
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def requeue_stale(self, max_silence: float) -> int:
+        """
+        Return jobs of workers that stopped heartbeating to the queue.
+
+        Args:
+            max_silence: Seconds without a heartbeat after which a
+                processing job is considered abandoned
+
+        Returns:
+            Number of requeued jobs
+        """
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(
+                "UPDATE export_jobs SET status = ?, progress = 0, worker_id = NULL "
+                "WHERE status = ? AND heartbeat_at < ?",
+                (ExportJobStatus.PENDING.value, ExportJobStatus.PROCESSING.value, time.time() - max_silence)
+            )
+            return cursor.rowcount
+
+    def finished_before(self, cutoff: float) -> list[str]:
+        """
+        List completed or failed jobs that finished before a timestamp.
+
+        Args:
+            cutoff: Unix timestamp
+
+        Returns:
+            Job IDs
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT job_id FROM export_jobs WHERE completed_at IS NOT NULL AND completed_at < ?",
+                (cutoff,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, job_ids: list[str]) -> None:
+        """
+        Remove job records.
+
+        Args:
+            job_ids: Job IDs to remove
+        """
+        with closing(self._connect()) as connection:
+            connection.executemany("DELETE FROM export_jobs WHERE job_id = ?", [(job_id,) for job_id in job_ids])
+
+    def count(self, status: ExportJobStatus) -> int:
+        """
+        Count jobs in a status (e.g. the queue depth for pending).
+
+        Args:
+            status: Job status
+
+        Returns:
+            Number of jobs
+        """
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM export_jobs WHERE status = ?", (status.value,)
+            ).fetchone()[0]
+
+    def worker_heartbeat(self, worker_id: str, concurrency: int = 1) -> None:
+        """
+        Record that a worker is alive (idle or rendering).
+
+        Args:
+            worker_id: Worker identifier
+            concurrency: Jobs the worker renders at once
+        """
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "INSERT INTO export_workers (worker_id, heartbeat_at, concurrency) VALUES (?, ?, ?) "
+                "ON CONFLICT (worker_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at, "
+                "concurrency = excluded.concurrency",
+                (worker_id, time.time(), concurrency)
+            )
+
+    def remove_worker(self, worker_id: str) -> None:
+        """
+        Forget a worker that stopped.
+
+        Args:
+            worker_id: Worker identifier
+        """
+        with closing(self._connect()) as connection:
+            connection.execute("DELETE FROM export_workers WHERE worker_id = ?", (worker_id,))
+
+    def live_workers(self, max_silence: float) -> int:
+        """
+        Count workers that heartbeated recently.
+
+        Args:
+            max_silence: Seconds without a heartbeat after which a worker is
+                considered dead
+
+        Returns:
+            Number of live workers
+        """
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM export_workers WHERE heartbeat_at >= ?", (time.time() - max_silence,)
+            ).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection (one per operation, safe across threads)."""
+        return sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+
+
+def _to_row(job: ExportJob) -> tuple:
+    """Convert an ExportJob to a row tuple in _COLUMNS order."""
+    return (
+        job.job_id,
+        job.presentation_id,
+        job.status.value,
+        job.progress,
+        job.download_url,
+        job.error,
+        job.created_at.timestamp(),
+        job.completed_at.timestamp() if job.completed_at else None,
+        int(job.profiled),
+        job.source_key,
+        job.slides,
+        json.dumps([output.model_dump(mode="json") for output in job.outputs]) if job.outputs else None,
+    )
+
+
+def _from_row(row: tuple) -> ExportJob:
+    """Convert a row tuple in _COLUMNS order to an ExportJob."""
+    job_id, presentation_id, status, progress, download_url, error, created_at, completed_at, profiled, source_key, slides, outputs = row
+    return ExportJob(
+        job_id=job_id,
+        presentation_id=presentation_id,
+        status=ExportJobStatus(status),
+        progress=progress,
+        download_url=download_url,
+        error=error,
+        created_at=datetime.fromtimestamp(created_at, timezone.utc),
+        completed_at=datetime.fromtimestamp(completed_at, timezone.utc) if completed_at else None,
+        profiled=bool(profiled),
+        source_key=source_key,
+        slides=slides,
+        outputs=[ExportOutput(**output) for output in json.loads(outputs)] if outputs else None,
+    )
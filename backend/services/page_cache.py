@@ -0,0 +1,192 @@
+"""
+Page Cache
+
+Rendered single-slide PDF pages keyed by a hash of everything that can
+change how the slide looks: the slide's own source, the code it shares
+with the other slides (theme constants such as ``brandColors``, helper
+components, local imports) and the render settings. Exports re-render
+only slides whose key is missing and splice the rest from the cache.
+"""
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from services.slide_text import split_tsx_slides
+
+
+# Bump to invalidate every cached page after changes to the key scheme or
+# the renderer; viewer/frontend builds are covered by the render settings
+# (ExportService.render_version)
+CACHE_VERSION = "1"
+
+# Relative imports of a TSX source (`from './theme'`, `import '../deck.css'`)
+_RELATIVE_IMPORT = re.compile(r'''(?:from|import)\s+['"](\.{1,2}/[^'"]+)['"]''')
+_IMPORT_EXTENSIONS = ["", ".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts", "/index.js"]
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+
+
+class PageCache:
+    """Directory of cached slide pages, keeping the most recently used ``max_pages``."""
+
+    def __init__(self, directory: str, max_pages: int = 2000):
+        """
+        Initialize page cache.
+
+        Args:
+            directory: Directory for ``<key>.pdf`` files (shared with workers)
+            max_pages: Number of pages kept; least recently used are deleted
+        """
+        self.directory = Path(directory)
+        self.max_pages = max_pages
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a cached page, marking it as recently used.
+
+        Args:
+            key: Page key
+
+        Returns:
+            Single-page PDF document or None if not cached
+        """
+        if not _KEY.match(key):
+            return None
+        path = self.directory / f"{key}.pdf"
+        try:
+            document = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return document
+
+    def put(self, key: str, document: bytes) -> None:
+        """
+        Store a rendered page.
+
+        Args:
+            key: Page key
+            document: Single-page PDF document
+        """
+        if not _KEY.match(key):
+            raise ValueError(f"Invalid page key: {key!r}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.pdf"
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(document)
+        os.replace(tmp_path, path)
+
+    def prune(self) -> int:
+        """
+        Delete the least recently used pages beyond max_pages.
+
+        Returns:
+            Number of deleted pages
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort(reverse=True)
+        for _mtime, path in entries[self.max_pages:]:
+            path.unlink(missing_ok=True)
+        return max(0, len(entries) - self.max_pages)
+
+
+def spectacle_page_keys(source: Path, render_settings: str) -> list[str]:
+    """
+    Compute page keys of a Spectacle presentation, one per ``<Slide>`` block.
+
+    A slide's key covers its block, its position, the slide count, all code
+    outside the slide blocks and the content of locally imported modules,
+    so editing one slide changes only that slide's key while editing shared
+    theme code changes every key.
+
+    Args:
+        source: Presentation TSX file
+        render_settings: Viewport, scale and other settings that affect output
+
+    Returns:
+        Page keys in slide order (empty if no slide blocks were found)
+    """
+    content = source.read_text(encoding="utf-8")
+    shared_code, slides = split_tsx_slides(content)
+
+    shared = hashlib.sha256()
+    shared.update(f"{CACHE_VERSION}\0{render_settings}\0spectacle\0{len(slides)}\0".encode("utf-8"))
+    shared.update(shared_code.encode("utf-8"))
+    for module in _local_imports(source, content):
+        shared.update(b"\0" + module.read_bytes())
+
+    return [_slide_key(shared, str(position).encode("utf-8"), slide.encode("utf-8"))
+            for position, slide in enumerate(slides)]
+
+
+def html_page_keys(deck_dir: Path, slides: list[Path], render_settings: str) -> list[str]:
+    """
+    Compute page keys of a static HTML deck, one per ``slideN.html``.
+
+    A slide's key covers its own HTML and the deck's other files (styles,
+    scripts, images; by size and modification time).
+
+    Args:
+        deck_dir: Deck directory
+        slides: slideN.html pages in slide order
+        render_settings: Viewport and other settings that affect output
+
+    Returns:
+        Page keys in slide order
+    """
+    slide_set = set(slides)
+    shared = hashlib.sha256()
+    shared.update(f"{CACHE_VERSION}\0{render_settings}\0html\0".encode("utf-8"))
+    for path in sorted(deck_dir.rglob("*")):
+        if path in slide_set or not path.is_file():
+            continue
+        stat = path.stat()
+        shared.update(f"{path.relative_to(deck_dir)}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+
+    return [_slide_key(shared, slide.name.encode("utf-8"), slide.read_bytes()) for slide in slides]
+
+
+def deck_key(page_keys: list[str]) -> str:
+    """
+    Combine page keys into a key of the whole rendered document.
+
+    Args:
+        page_keys: Page keys in slide order
+
+    Returns:
+        Content key of the deck
+    """
+    return hashlib.sha256("\n".join(page_keys).encode("ascii")).hexdigest()
+
+
+def _slide_key(shared: "hashlib._Hash", position: bytes, slide: bytes) -> str:
+    """Key of one slide: shared hash state extended with the slide's own bytes."""
+    digest = shared.copy()
+    digest.update(b"\0slide\0" + position + b"\0")
+    digest.update(slide)
+    return digest.hexdigest()
+
+
+def _local_imports(source: Path, content: str) -> list[Path]:
+    """Resolve relative imports of a source file to existing files."""
+    modules = []
+    for specifier in _RELATIVE_IMPORT.findall(content):
+        base = source.parent / specifier
+        for extension in _IMPORT_EXTENSIONS:
+            candidate = Path(f"{base}{extension}")
+            if candidate.is_file():
+                modules.append(candidate)
+                break
+    return modules
+
@@ -0,0 +1,69 @@
+"""
+PDF Tools
+
+Helpers for assembling exported PDF documents from per-slide renders.
+"""
+import io
+import os
+from pathlib import Path
+from typing import Optional
+
+from pypdf import PdfReader, PdfWriter
+
+
+def merge_pdf_pages(
+    documents: list[bytes],
+    output_path: Path,
+    first_page_only: bool = True,
+    title: Optional[str] = None,
+) -> int:
+    """
+    Stitch rendered PDF documents into one file.
+
+    Args:
+        documents: PDF documents in output order
+        output_path: Destination file (written atomically)
+        first_page_only: Keep only the first page of each document, so a
+            slide that overflows the 1920x1080 page never adds blank pages
+        title: Document title written to the PDF metadata
+
+    Returns:
+        Number of pages written
+    """
+    writer = PdfWriter()
+
+    for document in documents:
+        reader = PdfReader(io.BytesIO(document))
+        pages = reader.pages[:1] if first_page_only else reader.pages
+        for page in pages:
+            writer.add_page(page)
+
+    if title:
+        writer.add_metadata({"/Title": title})
+
+    tmp_path = output_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    os.replace(tmp_path, output_path)
+
+    return len(writer.pages)
+
+
+def split_pdf_pages(document: bytes) -> list[bytes]:
+    """
+    Split a PDF document into single-page documents.
+
+    Args:
+        document: PDF document
+
+    Returns:
+        One PDF document per page, in page order
+    """
+    pages = []
+    for page in PdfReader(io.BytesIO(document)).pages:
+        writer = PdfWriter()
+        writer.add_page(page)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        pages.append(buffer.getvalue())
+    return pages
@@ -0,0 +1,124 @@
+"""
+Speculative Pre-rendering
+
+Renders presentations in the background as soon as the presentation
+index sees them added or modified, so the next export request is
+answered from a ready PDF (ExportService with ``reuse_exports``).
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from models.schemas import ExportJobStatus
+from services.export_service import ExportService
+from services.presentation_index import PresentationIndex
+
+logger = logging.getLogger(__name__)
+
+
+class Prerenderer:
+    """Schedules debounced, low-priority pre-renders of changed presentations."""
+
+    def __init__(
+        self,
+        service: ExportService,
+        debounce: float = 10.0,
+        concurrency: int = 1,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize pre-renderer.
+
+        Args:
+            service: Export service creating the pre-render jobs
+            debounce: Seconds a presentation must stay unchanged before it is
+                rendered (rapid successive saves cause a single render)
+            concurrency: Pre-renders in flight at once
+            poll_interval: Seconds between checks for running user exports
+                and pre-render completion
+        """
+        self.service = service
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        # presentation id -> source fingerprint of the last sync
+        self._fingerprints: Optional[dict[str, tuple[int, int]]] = None
+        # Pre-renders still inside their debounce window, by presentation id
+        self._waiting: dict[str, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.rendered = 0
+
+    async def sync(self, index: PresentationIndex) -> None:
+        """
+        Schedule pre-renders of presentations added or modified since the
+        last sync (presentation index listener).
+
+        The first sync only records the current state: presentations are
+        pre-rendered when they change while the process runs.
+
+        Args:
+            index: Presentation index providing source fingerprints
+        """
+        current = {
+            entry.presentation.id: (entry.mtime_ns, entry.size)
+            for entry in index.entries.values()
+            if entry.presentation is not None
+        }
+        previous, self._fingerprints = self._fingerprints, current
+        if previous is None:
+            return
+
+        for presentation_id in set(self._waiting) - set(current):
+            self._waiting.pop(presentation_id).cancel()
+
+        for presentation_id, fingerprint in current.items():
+            if previous.get(presentation_id) != fingerprint:
+                self.schedule(presentation_id)
+
+    def schedule(self, presentation_id: str) -> None:
+        """
+        Pre-render a presentation after the debounce delay, restarting the
+        delay if it is already waiting.
+
+        Args:
+            presentation_id: Presentation to render
+        """
+        waiting = self._waiting.pop(presentation_id, None)
+        if waiting is not None:
+            waiting.cancel()
+
+        task = asyncio.create_task(self._prerender(presentation_id))
+        self._waiting[presentation_id] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        """Cancel waiting and running pre-renders."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._waiting.clear()
+
+    async def _prerender(self, presentation_id: str) -> None:
+        """Wait out the debounce, then render with low priority."""
+        await asyncio.sleep(self.debounce)
+        if self._waiting.get(presentation_id) is asyncio.current_task():
+            del self._waiting[presentation_id]
+
+        async with self._semaphore:
+            # User exports rendered by this process go first
+            while self.service.foreground_renders > 0:
+                await asyncio.sleep(self.poll_interval)
+
+            job = await self.service.create_export_job(presentation_id, background=True)
+            while job is not None and job.status in (ExportJobStatus.PENDING, ExportJobStatus.PROCESSING):
+                await asyncio.sleep(self.poll_interval)
+                job = await self.service.get_job_status(job.job_id)
+
+        if job is not None and job.status == ExportJobStatus.COMPLETED:
+            self.rendered += 1
+        logger.info("pre-render finished", extra={"fields": {
+            "presentation_id": presentation_id,
+            "status": job.status.value if job else "missing",
+        }})
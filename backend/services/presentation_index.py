@@ -0,0 +1,300 @@
+"""
+Presentation Index
+
+Persistent metadata index over the presentations directory. Holds a
+fingerprint (mtime + size) and the extracted Presentation for every
+source file, so a restarted process can answer list requests from the
+on-disk snapshot while the directory is reconciled in the background.
+"""
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from models.schemas import Presentation
+from services.presentation_scanner import PresentationScanner
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the snapshot layout changes; older snapshots are ignored
+SNAPSHOT_FORMAT = 1
+
+# Minimum seconds between reconciles triggered by lookups of unknown ids
+MISS_RECONCILE_INTERVAL = 1.0
+
+
+@dataclass
+class IndexEntry:
+    """Indexed presentation source file."""
+
+    mtime_ns: int
+    size: int
+    presentation: Optional[Presentation]
+
+
+class PresentationIndex:
+    """In-memory presentation index backed by a JSON snapshot file."""
+
+    def __init__(
+        self,
+        scanner: PresentationScanner,
+        snapshot_path: Optional[str] = None,
+        reconcile_interval: float = 30.0,
+    ):
+        """
+        Initialize presentation index.
+
+        Args:
+            scanner: Scanner used to walk and parse presentation sources
+            snapshot_path: File to persist the index to (None disables persistence)
+            reconcile_interval: Seconds between background reconciles (0 disables polling)
+        """
+        self.scanner = scanner
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.reconcile_interval = reconcile_interval
+
+        # Keyed by source path relative to presentations_dir
+        self.entries: dict[str, IndexEntry] = {}
+        self._by_id: dict[str, Presentation] = {}
+
+        # Incremented whenever the indexed catalog changes
+        self.version = 0
+
+        self._ready = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: list[Callable[["PresentationIndex"], Awaitable[None]]] = []
+        self._notified = False
+        self._reconciled_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index holds a loaded snapshot or a completed scan."""
+        return self._ready.is_set()
+
+    async def start(self) -> None:
+        """Load the snapshot (if any) and start background reconciliation."""
+        if await asyncio.to_thread(self.load):
+            self._ready.set()
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background reconciliation."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def add_listener(self, listener: Callable[["PresentationIndex"], Awaitable[None]]) -> None:
+        """
+        Register a coroutine called after reconciles that change the catalog.
+
+        Listeners are also called after the first reconcile of the process,
+        so they can build derived state from a loaded snapshot.
+
+        Args:
+            listener: Async callable receiving this index
+        """
+        self._listeners.append(listener)
+
+    async def list_presentations(self) -> list[Presentation]:
+        """
+        Get all indexed presentations.
+
+        Waits for the first reconcile only when no snapshot was available.
+
+        Returns:
+            List of Presentation objects
+        """
+        await self._ensure_ready()
+        return list(self._by_id.values())
+
+    async def get(self, presentation_id: str) -> Optional[Presentation]:
+        """
+        Get an indexed presentation by ID.
+
+        An unknown id reconciles the index first (at most once per
+        MISS_RECONCILE_INTERVAL), so files added since the last reconcile are
+        found while include/exclude patterns still apply.
+
+        Args:
+            presentation_id: Presentation identifier
+
+        Returns:
+            Presentation object or None if not found
+        """
+        await self._ensure_ready()
+        presentation = self._by_id.get(presentation_id)
+        if presentation is None and await self._reconcile_on_miss():
+            presentation = self._by_id.get(presentation_id)
+        return presentation
+
+    async def reconcile(self) -> bool:
+        """
+        Bring the index in line with the presentations directory.
+
+        Only files whose fingerprint changed are re-parsed.
+
+        Returns:
+            True if the catalog changed
+        """
+        async with self._lock:
+            changed = False
+            seen: set[str] = set()
+
+            async for _shard, files in self.scanner.iter_source_files():
+                fingerprints = await asyncio.to_thread(_fingerprint_all, self.scanner, files)
+                for file_path, fingerprint in zip(files, fingerprints):
+                    if fingerprint is None:
+                        continue
+
+                    key = self.scanner.source_key(file_path)
+                    seen.add(key)
+                    entry = self.entries.get(key)
+                    if entry and (entry.mtime_ns, entry.size) == fingerprint:
+                        continue
+
+                    presentation = await self.scanner.parse_file(file_path)
+                    self.entries[key] = IndexEntry(fingerprint[0], fingerprint[1], presentation)
+                    changed = True
+
+            for key in set(self.entries) - seen:
+                del self.entries[key]
+                changed = True
+
+            if changed:
+                self._rebuild()
+                if self.snapshot_path:
+                    await asyncio.to_thread(self.save)
+
+            self._ready.set()
+            self._reconciled_at = asyncio.get_running_loop().time()
+
+            if changed or not self._notified:
+                self._notified = True
+                for listener in self._listeners:
+                    try:
+                        await listener(self)
+                    except Exception as e:
+                        logger.exception("Error in presentation index listener: %s", e)
+
+            return changed
+
+    def load(self) -> bool:
+        """
+        Load the index snapshot from disk.
+
+        Returns:
+            True if a compatible snapshot was loaded
+        """
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if data.get("format") != SNAPSHOT_FORMAT or data.get("root") != self._root_signature():
+                return False
+
+            self.entries = {
+                key: IndexEntry(
+                    mtime_ns=raw["mtime_ns"],
+                    size=raw["size"],
+                    presentation=Presentation.model_validate(raw["presentation"]) if raw["presentation"] else None
+                )
+                for key, raw in data["entries"].items()
+            }
+        except Exception as e:
+            logger.warning("Error loading presentation index %s: %s", self.snapshot_path, e)
+            self.entries = {}
+            return False
+
+        self._rebuild()
+        return True
+
+    def save(self) -> None:
+        """Atomically write the index snapshot to disk."""
+        if self.snapshot_path is None:
+            return
+
+        data = {
+            "format": SNAPSHOT_FORMAT,
+            "root": self._root_signature(),
+            "entries": {
+                key: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "presentation": entry.presentation.model_dump() if entry.presentation else None,
+                }
+                for key, entry in self.entries.items()
+            },
+        }
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _root_signature(self) -> str:
+        """Identify the scanned directories a snapshot belongs to."""
+        signature = str(self.scanner.presentations_dir)
+        if self.scanner.static_decks_dir is not None:
+            signature += f"|{self.scanner.static_decks_dir}"
+        return signature
+
+    async def _ensure_ready(self) -> None:
+        """Run a first reconcile if neither a snapshot nor a scan is available."""
+        if not self._ready.is_set():
+            await self.reconcile()
+
+    async def _reconcile_on_miss(self) -> bool:
+        """
+        Reconcile after a lookup miss, unless the index was reconciled just now.
+
+        Misses during a running reconcile wait for it instead of starting another.
+
+        Returns:
+            True if the catalog changed
+        """
+        if self._lock.locked():
+            async with self._lock:
+                return True
+        loop = asyncio.get_running_loop()
+        if self._reconciled_at is not None and loop.time() - self._reconciled_at < MISS_RECONCILE_INTERVAL:
+            return False
+        return await self.reconcile()
+
+    async def _run(self) -> None:
+        """Background loop: reconcile now, then every reconcile_interval seconds."""
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.exception("Error reconciling presentation index: %s", e)
+
+            if self.reconcile_interval <= 0:
+                return
+            await asyncio.sleep(self.reconcile_interval)
+
+    def _rebuild(self) -> None:
+        """Rebuild the id lookup and bump the catalog version."""
+        by_id: dict[str, Presentation] = {}
+        for key in sorted(self.entries):
+            presentation = self.entries[key].presentation
+            if presentation is not None and presentation.id not in by_id:
+                by_id[presentation.id] = presentation
+
+        self._by_id = by_id
+        self.version += 1
+
+
+def _fingerprint_all(scanner: PresentationScanner, sources: list[Path]) -> list[Optional[tuple[int, int]]]:
+    """Fingerprint sources, returning None for sources that vanished."""
+    return [scanner.fingerprint(source) for source in sources]
@@ -0,0 +1,196 @@
+"""
+Presentation Query
+
+Filtering, sorting, cursor pagination and field projection for presentation lists.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from models.schemas import Presentation, PresentationSortField, SortOrder
+
+
+# Field names accepted by ``fields=`` (API aliases and attribute names)
+_FIELD_ALIASES: dict[str, str] = {}
+for _name, _info in Presentation.model_fields.items():
+    _FIELD_ALIASES[_name] = _name
+    if _info.serialization_alias:
+        _FIELD_ALIASES[_info.serialization_alias] = _name
+
+
+class InvalidQueryError(ValueError):
+    """Raised when list query parameters cannot be applied."""
+
+
+@dataclass
+class PresentationPage:
+    """One page of a presentation list query."""
+
+    items: list[Presentation]
+    total: int
+    next_cursor: Optional[str] = None
+    fields: Optional[set[str]] = field(default=None)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[set[str]]:
+    """
+    Parse a comma-separated ``fields=`` projection.
+
+    Args:
+        fields: Comma-separated field names (camelCase aliases or snake_case)
+
+    Returns:
+        Set of model attribute names (always including ``id``) or None for all fields
+
+    Raises:
+        InvalidQueryError: If an unknown field is requested
+    """
+    if not fields:
+        return None
+
+    selected = {"id"}
+    for raw_name in fields.split(","):
+        name = raw_name.strip()
+        if not name:
+            continue
+        if name not in _FIELD_ALIASES:
+            raise InvalidQueryError(f"Unknown field '{name}'")
+        selected.add(_FIELD_ALIASES[name])
+
+    return selected
+
+
+def encode_cursor(sort: PresentationSortField, order: SortOrder, presentation: Presentation) -> str:
+    """
+    Build an opaque cursor pointing after the given presentation.
+
+    Args:
+        sort: Sort field the cursor belongs to
+        order: Sort direction the cursor belongs to
+        presentation: Last presentation of the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [sort.value, order.value, _sort_key(presentation, sort), presentation.id]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: PresentationSortField, order: SortOrder) -> tuple[str, str]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string from a previous response
+        sort: Sort field of the current request
+        order: Sort direction of the current request
+
+    Returns:
+        Tuple of (sort key, presentation id) of the last seen item
+
+    Raises:
+        InvalidQueryError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort, cursor_order, key, presentation_id = payload
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidQueryError("Malformed cursor")
+
+    if cursor_sort != sort.value or cursor_order != order.value:
+        raise InvalidQueryError("Cursor does not match the requested sort order")
+
+    return str(key), str(presentation_id)
+
+
+def query_presentations(
+    presentations: list[Presentation],
+    *,
+    sort: PresentationSortField = PresentationSortField.UPDATED,
+    order: SortOrder = SortOrder.DESC,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> PresentationPage:
+    """
+    Apply filters, sorting and cursor pagination to a presentation list.
+
+    Args:
+        presentations: Full list of presentations
+        sort: Field to sort by
+        order: Sort direction
+        title: Case-insensitive substring filter on title
+        description: Case-insensitive substring filter on description
+        limit: Maximum number of items on the page
+        cursor: Cursor returned by the previous page
+        fields: Comma-separated field projection
+
+    Returns:
+        PresentationPage with the requested slice and total match count
+
+    Raises:
+        InvalidQueryError: If the cursor or field projection is invalid
+    """
+    selected_fields = parse_fields(fields)
+
+    matches = presentations
+    if title:
+        needle = title.casefold()
+        matches = [p for p in matches if needle in p.title.casefold()]
+    if description:
+        needle = description.casefold()
+        matches = [p for p in matches if p.description and needle in p.description.casefold()]
+
+    descending = order == SortOrder.DESC
+    ordered = sorted(matches, key=lambda p: (_sort_key(p, sort), p.id), reverse=descending)
+
+    start = 0
+    if cursor:
+        after = decode_cursor(cursor, sort, order)
+        start = len(ordered)
+        for index, presentation in enumerate(ordered):
+            position = (_sort_key(presentation, sort), presentation.id)
+            if (position < after) if descending else (position > after):
+                start = index
+                break
+
+    items = ordered[start:start + limit]
+    next_cursor = None
+    if items and start + limit < len(ordered):
+        next_cursor = encode_cursor(sort, order, items[-1])
+
+    return PresentationPage(
+        items=items,
+        total=len(matches),
+        next_cursor=next_cursor,
+        fields=selected_fields
+    )
+
+
+def project_presentation(presentation: Presentation, fields: Optional[set[str]]) -> dict[str, Any]:
+    """
+    Serialize a presentation with API aliases, keeping only selected fields.
+
+    Args:
+        presentation: Presentation to serialize
+        fields: Attribute names to keep, or None for all fields
+
+    Returns:
+        JSON-compatible dictionary
+    """
+    return presentation.model_dump(mode="json", by_alias=True, include=fields)
+
+
+def _sort_key(presentation: Presentation, sort: PresentationSortField) -> str:
+    """Return the comparable sort value of a presentation."""
+    if sort == PresentationSortField.TITLE:
+        return presentation.title.casefold()
+    if sort == PresentationSortField.CREATED:
+        return presentation.created_at
+    return presentation.updated_at
@@ -3,29 +3,68 @@ Presentation Scanner Service
 
 Scans the presentations directory and extracts metadata from presentation files.
 """
+import asyncio
+import logging
 import os
 import re
+from collections import deque
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime
 
-from models.schemas import Presentation
+from models.schemas import DeckType, Presentation
+from services.slide_text import extract_html_text
+
+logger = logging.getLogger(__name__)
+
+
+# Supported presentation source extensions, in lookup priority order
+SOURCE_EXTENSIONS = (".tsx", ".jsx", ".ts", ".js")
+
+# Static HTML decks: a directory of slide1.html, slide2.html, ...
+HTML_SLIDE_PATTERN = re.compile(r'^slide(\d+)\.html$')
+
+# Index key prefix for decks under static_decks_dir
+STATIC_KEY_PREFIX = "static:"
+
+# Directories never descended into unless explicitly included
+DEFAULT_EXCLUDE = ("node_modules", ".*", "__pycache__")
 
 
 class PresentationScanner:
     """Scans presentation files and extracts metadata."""
 
-    def __init__(self, presentations_dir: str):
+    def __init__(
+        self,
+        presentations_dir: str,
+        recursive: bool = True,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        static_decks_dir: Optional[str] = None,
+    ):
         """
         Initialize scanner with presentations directory path.
 
+        Static HTML decks (directories of ``slideN.html`` pages) are found
+        anywhere in presentations_dir and directly under static_decks_dir.
+
         Args:
             presentations_dir: Absolute path to presentations directory
+            recursive: Descend into subdirectories (ids are namespaced by subdirectory)
+            include: Glob patterns a file's relative path must match (default: all)
+            exclude: Glob patterns for relative paths or names to skip
+            static_decks_dir: Optional extra directory whose subdirectories are HTML decks
         """
         self.presentations_dir = Path(presentations_dir)
         if not self.presentations_dir.exists():
             raise ValueError(f"Presentations directory not found: {presentations_dir}")
 
+        self.recursive = recursive
+        self.include = list(include or [])
+        self.exclude = list(DEFAULT_EXCLUDE if exclude is None else exclude)
+        self.static_decks_dir = Path(static_decks_dir) if static_decks_dir else None
+
     async def scan_all(self) -> list[Presentation]:
         """
         Scan all presentation files and extract metadata.
@@ -35,36 +74,232 @@ class PresentationScanner:
         """
         presentations = []
 
-        # Find all .tsx, .jsx, .ts, .js files
-        for extension in ["*.tsx", "*.jsx", "*.ts", "*.js"]:
-            for file_path in self.presentations_dir.glob(extension):
-                try:
-                    presentation = await self._parse_presentation_file(file_path)
-                    if presentation:
-                        presentations.append(presentation)
-                except Exception as e:
-                    print(f"Error parsing {file_path}: {e}")
-                    continue
+        async for _shard, shard_presentations in self.scan_shards():
+            presentations.extend(shard_presentations)
 
         return presentations
 
+    async def scan_shards(self) -> AsyncIterator[tuple[str, list[Presentation]]]:
+        """
+        Scan presentations one directory (shard) at a time.
+
+        Each directory listing runs in a worker thread, so a large tree never
+        blocks the event loop for a whole walk.
+
+        Yields:
+            Tuple of (relative directory, presentations found directly in it)
+        """
+        async for shard, files in self.iter_source_files():
+            presentations = []
+            for file_path in files:
+                presentation = await self.parse_file(file_path)
+                if presentation:
+                    presentations.append(presentation)
+
+            if presentations:
+                yield shard, presentations
+
+    async def iter_source_files(self) -> AsyncIterator[tuple[str, list[Path]]]:
+        """
+        Walk presentations_dir and list source files one directory at a time.
+
+        Static HTML decks are reported as their directory path.
+
+        Yields:
+            Tuple of (relative directory, presentation sources directly in it)
+        """
+        pending = deque([""])
+
+        while pending:
+            shard = pending.popleft()
+            files, subdirs = await asyncio.to_thread(self._list_directory, shard)
+
+            if self.recursive:
+                pending.extend(subdirs)
+
+            yield shard, files
+
+        if self.static_decks_dir is not None and self.static_decks_dir.is_dir():
+            decks = await asyncio.to_thread(self._list_static_decks)
+            yield self.static_decks_dir.name, decks
+
+    async def parse_file(self, file_path: Path) -> Optional[Presentation]:
+        """
+        Parse a single presentation source (TSX file or HTML deck directory).
+
+        Args:
+            file_path: Absolute path of a source yielded by iter_source_files
+
+        Returns:
+            Presentation object or None if the file has no metadata or fails to parse
+        """
+        try:
+            if file_path.is_dir():
+                return await asyncio.to_thread(self._parse_html_deck, file_path)
+            return await self._parse_presentation_file(file_path)
+        except Exception as e:
+            logger.warning("Error parsing %s: %s", file_path, e)
+            return None
+
+    def fingerprint(self, source: Path) -> Optional[tuple[int, int]]:
+        """
+        Get a change fingerprint of a presentation source.
+
+        Args:
+            source: TSX file or HTML deck directory
+
+        Returns:
+            Tuple of (mtime_ns, size) - newest mtime and total size for decks -
+            or None if the source vanished
+        """
+        try:
+            if source.is_dir():
+                stats = [slide.stat() for slide in list_html_slides(source)]
+                if not stats:
+                    return None
+                return max(st.st_mtime_ns for st in stats), sum(st.st_size for st in stats)
+
+            stat = source.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def source_key(self, source: Path) -> str:
+        """
+        Get the stable index key of a source.
+
+        Args:
+            source: Path yielded by iter_source_files
+
+        Returns:
+            Path relative to presentations_dir, or prefixed name for static decks
+        """
+        if self.static_decks_dir is not None and source.parent == self.static_decks_dir:
+            return f"{STATIC_KEY_PREFIX}{source.name}"
+        return source.relative_to(self.presentations_dir).as_posix()
+
+    def source_path(self, key: str) -> Path:
+        """
+        Resolve an index key produced by source_key back to a path.
+
+        Args:
+            key: Source key
+
+        Returns:
+            Absolute source path
+        """
+        if key.startswith(STATIC_KEY_PREFIX) and self.static_decks_dir is not None:
+            return self.static_decks_dir / key[len(STATIC_KEY_PREFIX):]
+        return self.presentations_dir / key
+
     async def get_by_id(self, presentation_id: str) -> Optional[Presentation]:
         """
         Get presentation metadata by ID.
 
         Args:
-            presentation_id: Presentation identifier (filename without extension)
+            presentation_id: Presentation identifier (relative path without extension,
+                e.g. ``welcome`` or ``team-a/quarterly``)
 
         Returns:
             Presentation object or None if not found
         """
-        # Try all supported extensions
-        for extension in [".tsx", ".jsx", ".ts", ".js"]:
-            file_path = self.presentations_dir / f"{presentation_id}{extension}"
-            if file_path.exists():
-                return await self._parse_presentation_file(file_path)
+        file_path = self.get_file_path(presentation_id)
+        if file_path is None:
+            return None
+
+        return await self.parse_file(file_path)
+
+    def _list_directory(self, shard: str) -> tuple[list[Path], list[str]]:
+        """
+        List presentation files and subdirectories of one shard.
 
-        return None
+        Args:
+            shard: Directory relative to presentations_dir ("" for the root)
+
+        Returns:
+            Tuple of (sorted presentation file paths, sorted relative subdirectories)
+        """
+        directory = self.presentations_dir / shard if shard else self.presentations_dir
+        files: list[Path] = []
+        subdirs: list[str] = []
+        is_html_deck = False
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = f"{shard}/{entry.name}" if shard else entry.name
+                    if self._is_excluded(relative, entry.name):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(relative)
+                    elif entry.is_file() and HTML_SLIDE_PATTERN.match(entry.name):
+                        is_html_deck = True
+                    elif entry.is_file() and entry.name.endswith(SOURCE_EXTENSIONS):
+                        if self.include and not any(fnmatch(relative, p) for p in self.include):
+                            continue
+                        files.append(Path(entry.path))
+        except OSError as e:
+            logger.warning("Error scanning %s: %s", directory, e)
+
+        # An HTML deck directory is one presentation; its assets are not scanned
+        if is_html_deck and shard:
+            if self.include and not any(fnmatch(shard, p) for p in self.include):
+                return [], []
+            return [directory], []
+
+        return sorted(files), sorted(subdirs)
+
+    def _list_static_decks(self) -> list[Path]:
+        """List HTML deck directories directly under static_decks_dir."""
+        decks = []
+        for entry in sorted(self.static_decks_dir.iterdir()):
+            if entry.is_dir() and not self._is_excluded(entry.name, entry.name) and list_html_slides(entry):
+                decks.append(entry)
+        return decks
+
+    def _is_excluded(self, relative: str, name: str) -> bool:
+        """Check a relative path or bare name against exclude patterns."""
+        return any(fnmatch(relative, p) or fnmatch(name, p) for p in self.exclude)
+
+    def _parse_html_deck(self, deck_dir: Path) -> Optional[Presentation]:
+        """
+        Build metadata for a static HTML deck directory.
+
+        Args:
+            deck_dir: Directory containing slideN.html pages
+
+        Returns:
+            Presentation object or None if the directory has no slides
+        """
+        slides = list_html_slides(deck_dir)
+        if not slides:
+            return None
+
+        stats = [slide.stat() for slide in slides]
+        title, _text = extract_html_text(slides[0].read_text(encoding="utf-8"))
+
+        if self.static_decks_dir is not None and deck_dir.parent == self.static_decks_dir:
+            presentation_id = deck_dir.name
+            file_path = f"{self.static_decks_dir.name}/{deck_dir.name}"
+        else:
+            presentation_id = deck_dir.relative_to(self.presentations_dir).as_posix()
+            file_path = f"presentations/{presentation_id}"
+
+        return Presentation(
+            id=presentation_id,
+            title=title or deck_dir.name.replace("-", " ").replace("_", " "),
+            slide_count=len(slides),
+            created_at=datetime.fromtimestamp(min(st.st_ctime for st in stats)).isoformat(),
+            updated_at=datetime.fromtimestamp(max(st.st_mtime for st in stats)).isoformat(),
+            file_path=file_path,
+            deck_type=DeckType.HTML
+        )
+
+    def _namespace(self, file_path: Path) -> str:
+        """Return the id namespace (relative parent directory) of a file."""
+        parent = file_path.parent.relative_to(self.presentations_dir).as_posix()
+        return "" if parent == "." else parent
 
     async def _parse_presentation_file(self, file_path: Path) -> Optional[Presentation]:
         """
@@ -95,6 +330,9 @@ class PresentationScanner:
 
             # Use metadata from file or fallback to defaults
             presentation_id = metadata.get("id", file_path.stem)
+            namespace = self._namespace(file_path)
+            if namespace:
+                presentation_id = f"{namespace}/{presentation_id}"
             title = metadata.get("title", file_path.stem.replace("-", " ").replace("_", " ").title())
             description = metadata.get("description")
 
@@ -111,11 +349,11 @@ class PresentationScanner:
                 slide_count=slide_count,
                 created_at=created_at,
                 updated_at=updated_at,
-                file_path=f"presentations/{file_path.name}"
+                file_path=f"presentations/{file_path.relative_to(self.presentations_dir).as_posix()}"
             )
 
         except Exception as e:
-            print(f"Error parsing presentation {file_path}: {e}")
+            logger.warning("Error parsing presentation %s: %s", file_path, e)
             return None
 
     def _extract_metadata(self, content: str) -> dict:
@@ -182,11 +420,48 @@ class PresentationScanner:
             presentation_id: Presentation identifier
 
         Returns:
-            Path object or None if not found
+            Source file path, HTML deck directory, or None if not found
         """
-        for extension in [".tsx", ".jsx", ".ts", ".js"]:
-            file_path = self.presentations_dir / f"{presentation_id}{extension}"
-            if file_path.exists():
+        parts = presentation_id.split("/")
+        if any(part in ("", ".", "..") for part in parts):
+            return None
+        if len(parts) > 1 and not self.recursive:
+            return None
+
+        for extension in SOURCE_EXTENSIONS:
+            file_path = self.presentations_dir.joinpath(*parts[:-1], f"{parts[-1]}{extension}")
+            if file_path.is_file():
                 return file_path
 
+        deck_dir = self.presentations_dir.joinpath(*parts)
+        if deck_dir.is_dir() and list_html_slides(deck_dir):
+            return deck_dir
+
+        if self.static_decks_dir is not None and len(parts) == 1:
+            deck_dir = self.static_decks_dir / parts[0]
+            if deck_dir.is_dir() and list_html_slides(deck_dir):
+                return deck_dir
+
         return None
+
+
+def list_html_slides(directory: Path) -> list[Path]:
+    """
+    List the slideN.html pages of a static deck in slide order.
+
+    Args:
+        directory: Deck directory
+
+    Returns:
+        Slide file paths sorted by slide number (empty if not a deck)
+    """
+    numbered = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = HTML_SLIDE_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    numbered.append((int(match.group(1)), Path(entry.path)))
+    except OSError:
+        return []
+    return [path for _number, path in sorted(numbered)]
@@ -0,0 +1,207 @@
+"""
+Sampling Profiler
+
+Low-overhead stack sampler for capturing profiles of single requests or
+export jobs in production, and a bounded on-disk store for the results.
+
+Profiles use the folded-stack format (``frame;frame;frame count``), which
+flamegraph.pl, speedscope and inferno read directly.
+"""
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+
+# Profile ids double as file names
+_PROFILE_ID = re.compile(r"^[A-Za-z0-9_.-]{1,100}$")
+
+# Deepest stack recorded per sample
+MAX_DEPTH = 128
+
+
+@dataclass
+class Profile:
+    """Folded stack samples of one thread."""
+
+    samples: Counter = field(default_factory=Counter)
+    interval: float = 0.005
+    duration_s: float = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def folded(self) -> str:
+        """Render samples as folded stacks, hottest first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class StackSampler:
+    """Samples the Python stack of one thread from a background thread."""
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        """
+        Initialize sampler.
+
+        Args:
+            thread_id: Thread to sample (default: the thread calling start(),
+                i.e. the event loop thread)
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self._profile = Profile(interval=interval)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> "StackSampler":
+        """Start sampling."""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        """
+        Stop sampling.
+
+        Returns:
+            Collected profile
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._profile.duration_s = time.perf_counter() - self._started
+        return self._profile
+
+    def _run(self) -> None:
+        """Sampling loop (runs in the sampler thread)."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self._profile.samples[";".join(reversed(stack))] += 1
+
+
+class ProfileStore:
+    """Directory of saved profiles, keeping only the newest ``max_profiles``."""
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        """
+        Initialize profile store.
+
+        Args:
+            directory: Directory for ``<id>.folded`` files (shared with workers)
+            max_profiles: Number of profiles kept; older ones are deleted
+        """
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+
+    def save(self, profile_id: str, profile: Profile, meta: dict[str, str]) -> Path:
+        """
+        Save a profile with metadata header lines.
+
+        Args:
+            profile_id: Profile identifier (request or job based)
+            profile: Collected profile
+            meta: Metadata written as ``# key: value`` lines
+
+        Returns:
+            Path of the saved file
+        """
+        if not _PROFILE_ID.match(profile_id):
+            raise ValueError(f"Invalid profile id: {profile_id!r}")
+
+        header = {
+            **meta,
+            "duration_s": f"{profile.duration_s:.3f}",
+            "interval_s": f"{profile.interval:g}",
+            "samples": str(profile.sample_count),
+        }
+        content = "".join(f"# {key}: {value}\n" for key, value in header.items()) + profile.folded()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{profile_id}.folded"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        self._prune()
+        return path
+
+    def get(self, profile_id: str) -> Optional[str]:
+        """
+        Read a saved profile.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            Folded-stack text or None if not found
+        """
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.folded"
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def list_profiles(self) -> list[dict[str, object]]:
+        """
+        List saved profiles, newest first.
+
+        Returns:
+            Dictionaries with id, size and created (Unix time)
+        """
+        entries = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append({"id": path.stem, "size": stat.st_size, "created": stat.st_mtime})
+        return sorted(entries, key=lambda entry: entry["created"], reverse=True)
+
+    def _files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob("*.folded"))
+
+    def _prune(self) -> None:
+        """Delete the oldest profiles beyond max_profiles."""
+        for entry in self.list_profiles()[self.max_profiles:]:
+            (self.directory / f"{entry['id']}.folded").unlink(missing_ok=True)
+
+
+def token_matches(offered: Optional[str], expected: Optional[str]) -> bool:
+    """
+    Constant-time token check; always False when profiling is disabled.
+
+    Args:
+        offered: Token sent by the client
+        expected: Configured token (None or empty disables profiling)
+
+    Returns:
+        True if the tokens match
+    """
+    if not expected or not offered:
+        return False
+    return hmac.compare_digest(offered.encode("utf-8"), expected.encode("utf-8"))
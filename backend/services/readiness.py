@@ -0,0 +1,137 @@
+"""
+Readiness Tracker
+
+Records the warm-up state of service components (presentation index,
+search index, renderer) for the readiness endpoint. Failed warm-ups are
+retried with backoff, and components that can fail later (export workers)
+are re-checked periodically, so a transient failure does not leave the
+service unready for the life of the process.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from models.schemas import ComponentState, ComponentStatus, ReadinessResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessTracker:
+    """Per-component readiness state."""
+
+    def __init__(self):
+        """Initialize an empty tracker (reports ready until components are registered)."""
+        self.components: dict[str, ComponentStatus] = {}
+
+    def reset(self, names: list[str]) -> None:
+        """
+        Register components as pending, dropping any previous state.
+
+        Args:
+            names: Component names in warm-up order
+        """
+        self.components = {name: ComponentStatus(state=ComponentState.PENDING) for name in names}
+
+    async def check(self, name: str, warm_up: Awaitable) -> bool:
+        """
+        Run a component warm-up step and record its outcome.
+
+        Args:
+            name: Component name
+            warm_up: Awaitable that completes once the component is usable;
+                a string result is shown as the component's detail
+
+        Returns:
+            True if the step succeeded
+        """
+        started = time.perf_counter()
+        try:
+            result = await warm_up
+        except Exception as e:
+            self.components[name] = ComponentStatus(
+                state=ComponentState.FAILED,
+                detail=str(e).splitlines()[0] if str(e) else type(e).__name__,
+                duration_ms=_elapsed_ms(started)
+            )
+            logger.warning("Warm-up of %s failed: %s", name, e)
+            return False
+
+        self.components[name] = ComponentStatus(
+            state=ComponentState.READY,
+            detail=result if isinstance(result, str) else None,
+            duration_ms=_elapsed_ms(started)
+        )
+        return True
+
+    async def retry(
+        self,
+        name: str,
+        warm_up: Callable[[], Awaitable],
+        delay: float = 5.0,
+        max_delay: float = 300.0,
+    ) -> None:
+        """
+        Run a warm-up step until it succeeds, doubling the pause after each failure.
+
+        The component reports failed between attempts.
+
+        Args:
+            name: Component name
+            warm_up: Factory of the warm-up awaitable (called once per attempt)
+            delay: Pause after the first failure, seconds
+            max_delay: Longest pause between attempts, seconds
+        """
+        while not await self.check(name, warm_up()):
+            logger.info("Retrying warm-up of %s in %.0f s", name, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+    async def watch(self, name: str, probe: Callable[[], Awaitable], interval: float = 10.0) -> None:
+        """
+        Re-check a component forever (until cancelled), recording every outcome.
+
+        Args:
+            name: Component name
+            probe: Factory of the check awaitable
+            interval: Seconds between checks
+        """
+        while True:
+            await self.check(name, probe())
+            await asyncio.sleep(interval)
+
+    def skip(self, name: str, detail: Optional[str] = None) -> None:
+        """
+        Mark a component as intentionally not warmed up.
+
+        Args:
+            name: Component name
+            detail: Reason shown in the readiness report
+        """
+        self.components[name] = ComponentStatus(state=ComponentState.SKIPPED, detail=detail)
+
+    def report(self) -> ReadinessResponse:
+        """
+        Build the readiness report.
+
+        Returns:
+            ReadinessResponse with status "ready", "starting" or "failed"
+        """
+        states = {component.state for component in self.components.values()}
+        if ComponentState.FAILED in states:
+            status = "failed"
+        elif ComponentState.PENDING in states:
+            status = "starting"
+        else:
+            status = "ready"
+        return ReadinessResponse(status=status, components=dict(self.components))
+
+    @property
+    def ready(self) -> bool:
+        """Whether every component is ready or skipped."""
+        return self.report().status == "ready"
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a perf_counter reading."""
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -0,0 +1,162 @@
+"""
+Response Cache
+
+Keeps serialized (and pre-compressed) JSON response bodies for the
+current catalog version and serves them with ETag revalidation.
+"""
+import gzip
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 512
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+@dataclass
+class CachedResponse:
+    """Serialized JSON body with its compressed variants and ETag."""
+
+    body: bytes
+    etag: str
+    gzip_body: Optional[bytes] = None
+    brotli_body: Optional[bytes] = None
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Build a response for a request, honoring If-None-Match and Accept-Encoding.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            304 response if the client copy is current, otherwise the body
+            in the best encoding the client accepts
+        """
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        body = self.body
+        if self.brotli_body is not None and "br" in accepted:
+            body = self.brotli_body
+            headers["Content-Encoding"] = "br"
+        elif self.gzip_body is not None and "gzip" in accepted:
+            body = self.gzip_body
+            headers["Content-Encoding"] = "gzip"
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """LRU cache of serialized responses, invalidated by catalog version."""
+
+    def __init__(self, max_entries: int = 256, compress: bool = True):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            compress: Pre-compress bodies with gzip (and brotli when installed)
+        """
+        self.max_entries = max_entries
+        self.compress = compress
+        self.version: Optional[int] = None
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+
+    def get(self, key: Hashable, version: int) -> Optional[CachedResponse]:
+        """
+        Get a cached response for the given catalog version.
+
+        Args:
+            key: Request key (route and normalized parameters)
+            version: Current catalog version
+
+        Returns:
+            CachedResponse or None on a miss
+        """
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+            return None
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+        return cached
+
+    def put(self, key: Hashable, version: int, payload: Any) -> CachedResponse:
+        """
+        Serialize, compress and store a JSON payload.
+
+        Args:
+            key: Request key (route and normalized parameters)
+            version: Catalog version the payload was built from
+            payload: JSON-compatible data
+
+        Returns:
+            Stored CachedResponse
+        """
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        cached = CachedResponse(
+            body=body,
+            etag=f'"{version}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        )
+
+        if self.compress and len(body) >= MIN_COMPRESS_SIZE:
+            cached.gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            if brotli is not None:
+                cached.brotli_body = brotli.compress(body, quality=BROTLI_QUALITY)
+
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return cached
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison) against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse Accept-Encoding into the set of encodings with non-zero q."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
@@ -0,0 +1,244 @@
+"""
+Search Index
+
+In-memory inverted index over presentation titles, descriptions and
+visible slide text, ranked with BM25 across weighted fields.
+"""
+import asyncio
+import logging
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from models.schemas import Presentation
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import list_html_slides
+from services.slide_text import extract_html_text, extract_tsx_slide_texts, stem_prefix, tokenize
+
+logger = logging.getLogger(__name__)
+
+
+# Field weights applied to term frequencies
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 2.0
+SLIDE_WEIGHT = 1.0
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Prefix matches score lower than exact ones and are capped per query term
+PREFIX_WEIGHT = 0.7
+MIN_PREFIX_LENGTH = 3
+MAX_PREFIX_EXPANSIONS = 50
+
+
+@dataclass
+class SearchHit:
+    """Ranked search hit."""
+
+    presentation: Presentation
+    score: float
+    slide: Optional[int]
+
+
+@dataclass
+class _Document:
+    """Indexed document bookkeeping."""
+
+    presentation: Presentation
+    terms: set[str]
+    length: float
+    # First slide (1-based) each term appears on
+    slide_of: dict[str, int]
+
+
+class SearchIndex:
+    """Inverted index kept in sync with a PresentationIndex."""
+
+    def __init__(self):
+        """Initialize an empty search index."""
+        self.postings: dict[str, dict[str, float]] = {}
+        self.documents: dict[str, _Document] = {}
+        self._total_length = 0.0
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+
+        # Source key -> (fingerprint, document id) of what is indexed
+        self._sources: dict[str, tuple[tuple[int, int], str]] = {}
+        self._lock = asyncio.Lock()
+        self.ready = False
+
+    async def sync(self, index: PresentationIndex) -> None:
+        """
+        Re-index sources whose fingerprint changed since the last sync.
+
+        Args:
+            index: Presentation index providing source fingerprints
+        """
+        async with self._lock:
+            current: dict[str, tuple[tuple[int, int], Presentation, Path]] = {}
+            claimed: set[str] = set()
+
+            # Documents are keyed by id: like the presentation index, the
+            # first source (in key order) with an id wins
+            for key in sorted(index.entries):
+                entry = index.entries[key]
+                if entry.presentation is not None and entry.presentation.id not in claimed:
+                    claimed.add(entry.presentation.id)
+                    path = index.scanner.source_path(key)
+                    current[key] = ((entry.mtime_ns, entry.size), entry.presentation, path)
+
+            for key in set(self._sources) - set(current):
+                _fingerprint, doc_id = self._sources.pop(key)
+                self._remove(doc_id)
+
+            for key, (fingerprint, presentation, path) in current.items():
+                indexed = self._sources.get(key)
+                if indexed and indexed[0] == fingerprint and indexed[1] == presentation.id:
+                    continue
+
+                try:
+                    slide_texts = await asyncio.to_thread(_read_slide_texts, path)
+                except OSError as e:
+                    logger.warning("Error indexing %s: %s", path, e)
+                    continue
+
+                if indexed:
+                    self._remove(indexed[1])
+                self._add(presentation, slide_texts)
+                self._sources[key] = (fingerprint, presentation.id)
+
+            self.ready = True
+
+    def search(self, query: str, limit: int = 20) -> tuple[list[SearchHit], int]:
+        """
+        Find presentations matching all query terms.
+
+        Terms of at least MIN_PREFIX_LENGTH characters also match longer
+        words at a lower weight, which covers search-as-you-type. Russian
+        terms additionally match by their stem, so "презентации" finds
+        "презентация".
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits to return
+
+        Returns:
+            Tuple of (hits ordered by descending score, total matching documents)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.documents:
+            return [], 0
+
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+
+        count = len(self.documents)
+        average_length = self._total_length / count or 1.0
+        scores: Optional[dict[str, float]] = None
+        first_slide: dict[str, int] = {}
+
+        for term in terms:
+            term_scores: dict[str, float] = {}
+            for expansion, weight in self._expand(term):
+                postings = self.postings[expansion]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    length = self.documents[doc_id].length
+                    norm = frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                    term_scores[doc_id] = term_scores.get(doc_id, 0.0) + weight * idf * frequency * (BM25_K1 + 1) / norm
+
+                    slide = self.documents[doc_id].slide_of.get(expansion)
+                    if slide is not None and (doc_id not in first_slide or slide < first_slide[doc_id]):
+                        first_slide[doc_id] = slide
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items() if doc_id in term_scores}
+            if not scores:
+                return [], 0
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        hits = [
+            SearchHit(
+                presentation=self.documents[doc_id].presentation,
+                score=round(score, 4),
+                slide=first_slide.get(doc_id)
+            )
+            for doc_id, score in ranked[:limit]
+        ]
+        return hits, len(ranked)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Return indexed terms matching a query term with their weights."""
+        expansions = []
+        if term in self.postings:
+            expansions.append((term, 1.0))
+
+        prefix = stem_prefix(term)
+        if len(prefix) >= MIN_PREFIX_LENGTH:
+            position = bisect_left(self._vocabulary, prefix)
+            while position < len(self._vocabulary) and len(expansions) < MAX_PREFIX_EXPANSIONS:
+                candidate = self._vocabulary[position]
+                if not candidate.startswith(prefix):
+                    break
+                if candidate != term:
+                    expansions.append((candidate, PREFIX_WEIGHT))
+                position += 1
+
+        return expansions
+
+    def _add(self, presentation: Presentation, slide_texts: list[str]) -> None:
+        """Add a document to the index."""
+        frequencies: dict[str, float] = {}
+        slide_of: dict[str, int] = {}
+
+        fields = [(presentation.title, TITLE_WEIGHT), (presentation.description or "", DESCRIPTION_WEIGHT)]
+        for text, weight in fields:
+            for token in tokenize(text):
+                frequencies[token] = frequencies.get(token, 0.0) + weight
+
+        for number, text in enumerate(slide_texts, start=1):
+            for token in tokenize(text):
+                frequencies[token] = frequencies.get(token, 0.0) + SLIDE_WEIGHT
+                slide_of.setdefault(token, number)
+
+        for token, frequency in frequencies.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                self._vocabulary_dirty = True
+            self.postings[token][presentation.id] = frequency
+
+        length = sum(frequencies.values())
+        self.documents[presentation.id] = _Document(presentation, set(frequencies), length, slide_of)
+        self._total_length += length
+
+    def _remove(self, doc_id: str) -> None:
+        """Remove a document from the index."""
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return
+
+        for token in document.terms:
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[token]
+                self._vocabulary_dirty = True
+
+        self._total_length -= document.length
+
+
+def _read_slide_texts(path: Path) -> list[str]:
+    """Read slide texts from a TSX source or a static HTML deck directory."""
+    if path.is_dir():
+        return [extract_html_text(slide.read_text(encoding="utf-8"))[1] for slide in list_html_slides(path)]
+    return extract_tsx_slide_texts(path.read_text(encoding="utf-8"))
+
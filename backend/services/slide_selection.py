@@ -0,0 +1,82 @@
+"""
+Slide Selection
+
+Parsing and formatting of 1-based slide selections such as ``"1-3,5"``.
+"""
+import re
+from typing import Optional, Union
+
+
+# Highest slide number accepted in a selection
+MAX_SLIDE_NUMBER = 1000
+
+_PART = re.compile(r"^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$")
+
+
+def parse_slide_selection(value: Union[str, list[int], None]) -> Optional[list[int]]:
+    """
+    Parse a slide selection.
+
+    Args:
+        value: Range string (``"1-3,5"``), list of slide numbers, or None
+
+    Returns:
+        Sorted unique 1-based slide numbers, or None for all slides
+
+    Raises:
+        ValueError: If the selection is malformed or out of bounds
+    """
+    if value is None:
+        return None
+
+    numbers: set[int] = set()
+    if isinstance(value, str):
+        if not value.strip():
+            return None
+        for part in value.split(","):
+            match = _PART.match(part)
+            if match is None:
+                raise ValueError(f"Invalid slide range '{part.strip()}', expected e.g. '1-3,5'")
+            first = int(match.group(1))
+            last = int(match.group(2) or first)
+            if first > last:
+                raise ValueError(f"Invalid slide range '{part.strip()}': start is after end")
+            _check_bounds(first)
+            _check_bounds(last)
+            numbers.update(range(first, last + 1))
+    else:
+        for number in value:
+            _check_bounds(number)
+            numbers.add(number)
+
+    if not numbers:
+        return None
+    return sorted(numbers)
+
+
+def format_slide_selection(numbers: list[int]) -> str:
+    """
+    Format slide numbers as a compact range string.
+
+    Args:
+        numbers: Sorted unique slide numbers
+
+    Returns:
+        Range string, e.g. ``"1-3,5"``
+    """
+    parts = []
+    start = previous = numbers[0]
+    for number in numbers[1:] + [None]:
+        if number is not None and number == previous + 1:
+            previous = number
+            continue
+        parts.append(str(start) if start == previous else f"{start}-{previous}")
+        if number is not None:
+            start = previous = number
+    return ",".join(parts)
+
+
+def _check_bounds(number: int) -> None:
+    """Reject slide numbers outside 1..MAX_SLIDE_NUMBER."""
+    if not 1 <= number <= MAX_SLIDE_NUMBER:
+        raise ValueError(f"Slide numbers must be between 1 and {MAX_SLIDE_NUMBER}, got {number}")
@@ -0,0 +1,172 @@
+"""
+Slide Text Extraction
+
+Extracts the visible text of slides from Spectacle TSX sources and
+static HTML slide pages, and tokenizes it for search.
+"""
+import re
+from html.parser import HTMLParser
+
+
+# <Slide ...> ... </Slide> blocks (not <SlideFrame>, <SlideLayout>, ...)
+_SLIDE_BLOCK = re.compile(r'<Slide(?=[\s>]).*?</Slide>', re.DOTALL)
+_JSX_COMMENT = re.compile(r'\{/\*.*?\*/\}', re.DOTALL)
+# String props that are rendered as text by our slide components
+_TEXT_PROP = re.compile(
+    r'\b(?:title|subtitle|description|label|text|caption|alt|placeholder)=(["\'])(.*?)\1',
+    re.DOTALL
+)
+_TAG = re.compile(r'<[^>]*>')
+_WHITESPACE = re.compile(r'\s+')
+_TOKEN = re.compile(r'\w+')
+_CYRILLIC = re.compile(r'[а-я]')
+
+# Common Russian inflectional endings, longest first
+_RUSSIAN_ENDINGS = sorted(
+    "ями ами ого его ому ему ыми ими ость ости ой ей ий ый ая яя ое ее ую юю "
+    "ам ям ах ях ом ем ов ев ы и а я о е у ю ь".split(),
+    key=len,
+    reverse=True
+)
+
+
+def extract_tsx_slide_texts(content: str) -> list[str]:
+    """
+    Extract visible text of every ``<Slide>`` block in a TSX source.
+
+    Args:
+        content: Presentation source code
+
+    Returns:
+        List of slide texts in source order
+    """
+    texts = []
+    for match in _SLIDE_BLOCK.finditer(content):
+        block = _JSX_COMMENT.sub(" ", match.group(0))
+        props = [value for _quote, value in _TEXT_PROP.findall(block)]
+        body = _TAG.sub(" ", _strip_braces(block))
+        texts.append(_WHITESPACE.sub(" ", " ".join([body, *props])).strip())
+    return texts
+
+
+def split_tsx_slides(content: str) -> tuple[str, list[str]]:
+    """
+    Split a TSX source into its ``<Slide>`` blocks and the code shared by them.
+
+    Args:
+        content: Presentation source code
+
+    Returns:
+        Tuple of (source with every slide block removed, slide blocks in source order)
+    """
+    slides = [match.group(0) for match in _SLIDE_BLOCK.finditer(content)]
+    return _SLIDE_BLOCK.sub("", content), slides
+
+
+def extract_html_text(content: str) -> tuple[str, str]:
+    """
+    Extract the document title and visible body text of an HTML page.
+
+    Args:
+        content: HTML source
+
+    Returns:
+        Tuple of (title, visible text)
+    """
+    parser = _VisibleTextParser()
+    parser.feed(content)
+    parser.close()
+    title = _WHITESPACE.sub(" ", " ".join(parser.title)).strip()
+    text = _WHITESPACE.sub(" ", " ".join(parser.text)).strip()
+    return title, text
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into normalized search tokens.
+
+    Case folding is Unicode-aware (Cyrillic included) and ``ё`` is folded
+    to ``е`` as Russian text uses them interchangeably.
+
+    Args:
+        text: Arbitrary text
+
+    Returns:
+        List of tokens in text order
+    """
+    folded = text.casefold().replace("ё", "е")
+    return [
+        token for token in _TOKEN.findall(folded)
+        if len(token) > 1 or token.isdigit()
+    ]
+
+
+def stem_prefix(token: str) -> str:
+    """
+    Strip one inflectional ending from a Russian token.
+
+    This is a deliberately light stemmer for query terms: the result is
+    used as a prefix, so "эффективности" also matches "эффективность".
+
+    Args:
+        token: Normalized token from :func:`tokenize`
+
+    Returns:
+        Token without its ending (unchanged for short or non-Cyrillic tokens)
+    """
+    if not _CYRILLIC.search(token):
+        return token
+
+    for ending in _RUSSIAN_ENDINGS:
+        if token.endswith(ending) and len(token) - len(ending) >= 4:
+            return token[:-len(ending)]
+    return token
+
+
+def _strip_braces(source: str) -> str:
+    """Remove brace-balanced JSX expressions such as ``style={{...}}``."""
+    result = []
+    depth = 0
+    for char in source:
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            result.append(char)
+    return "".join(result)
+
+
+class _VisibleTextParser(HTMLParser):
+    """Collects text outside of script/style and the document title."""
+
+    _HIDDEN = {"script", "style", "noscript", "template", "svg"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: list[str] = []
+        self.text: list[str] = []
+        self._hidden_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in self._HIDDEN:
+            self._hidden_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "img":
+            alt = dict(attrs).get("alt")
+            if alt:
+                self.text.append(alt)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._HIDDEN:
+            self._hidden_depth = max(self._hidden_depth - 1, 0)
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title.append(data)
+        elif self._hidden_depth == 0:
+            self.text.append(data)
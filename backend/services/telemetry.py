@@ -0,0 +1,272 @@
+"""
+Telemetry
+
+Structured (JSON) logging with request and job ids, per-route latency
+statistics and Server-Timing headers.
+"""
+import asyncio
+import json
+import logging
+import math
+import re
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+from services.profiler import ProfileStore, StackSampler, token_matches
+
+
+# Ids attached to every log record emitted while handling a request or job
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+job_id_var: ContextVar[Optional[str]] = ContextVar("job_id", default=None)
+
+# Server-Timing entries collected while handling the current request
+_timings_var: ContextVar[Optional[list[tuple[str, float, Optional[str]]]]] = ContextVar("timings", default=None)
+
+# Latency samples kept per route for percentiles
+ROUTE_SAMPLES = 1024
+
+PROFILE_HEADER = "x-profile-token"
+
+# Client-supplied X-Request-ID values are kept only if they look like ids
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+logger = logging.getLogger(__name__)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with request/job ids and extra fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = request_id_var.get()
+        if request_id:
+            entry["request_id"] = request_id
+        job_id = job_id_var.get()
+        if job_id:
+            entry["job_id"] = job_id
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: str = "INFO", json_format: bool = True) -> None:
+    """
+    Route application logs to stdout.
+
+    Args:
+        level: Log level name
+        json_format: Emit JSON lines (otherwise plain text)
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        JsonFormatter() if json_format
+        else logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level.upper())
+
+
+def add_timing(name: str, duration_ms: float = 0.0, description: Optional[str] = None) -> None:
+    """
+    Add a Server-Timing entry to the current request (no-op outside requests).
+
+    Args:
+        name: Metric name (token, e.g. ``cache``)
+        duration_ms: Duration in milliseconds
+        description: Optional description (e.g. ``hit``)
+    """
+    timings = _timings_var.get()
+    if timings is not None:
+        timings.append((name, duration_ms, description))
+
+
+@contextmanager
+def timed(name: str, description: Optional[str] = None) -> Iterator[None]:
+    """Record the duration of a block as a Server-Timing entry."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_timing(name, (time.perf_counter() - started) * 1000, description)
+
+
+class RouteStats:
+    """Request count, errors and latency percentiles per route."""
+
+    def __init__(self, samples: int = ROUTE_SAMPLES):
+        self.samples = samples
+        self._routes: dict[str, dict[str, Any]] = {}
+
+    def record(self, route: str, duration_ms: float, status_code: int) -> None:
+        """Record one request."""
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                           "recent": deque(maxlen=self.samples)}
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+        stats["recent"].append(duration_ms)
+        if status_code >= 500:
+            stats["errors"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Per-route summary: count, errors, mean, p50/p95/p99 (recent samples) and max."""
+        result = {}
+        for route, stats in sorted(self._routes.items()):
+            recent = sorted(stats["recent"])
+            result[route] = {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                "p50_ms": round(_percentile(recent, 0.50), 3),
+                "p95_ms": round(_percentile(recent, 0.95), 3),
+                "p99_ms": round(_percentile(recent, 0.99), 3),
+                "max_ms": round(stats["max_ms"], 3),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Drop all statistics."""
+        self._routes.clear()
+
+
+class TimingMiddleware:
+    """
+    ASGI middleware: request ids, Server-Timing, route statistics, access
+    logs and token-protected per-request sampling profiles.
+    """
+
+    def __init__(
+        self,
+        app,
+        stats: RouteStats,
+        profile_store: Optional[ProfileStore] = None,
+        profiling_token: Optional[str] = None,
+        sample_interval: float = 0.005,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            stats: Route statistics to record into
+            profile_store: Where request profiles are saved
+            profiling_token: Secret enabling ``X-Profile-Token`` profiling
+                (None disables profiling)
+            sample_interval: Profiler sampling interval, seconds
+        """
+        self.app = app
+        self.stats = stats
+        self.profile_store = profile_store
+        self.profiling_token = profiling_token
+        self.sample_interval = sample_interval
+        self._route_paths: dict[Any, str] = {}
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1")
+        if not _REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex[:16]
+        request_token = request_id_var.set(request_id)
+        timings: list[tuple[str, float, Optional[str]]] = []
+        timings_token = _timings_var.set(timings)
+
+        sampler = None
+        profile_id = None
+        offered = headers.get(PROFILE_HEADER.encode())
+        if offered and self.profile_store is not None and token_matches(offered.decode("latin-1"), self.profiling_token):
+            profile_id = f"request_{request_id}"
+            sampler = StackSampler(interval=self.sample_interval).start()
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.perf_counter() - started) * 1000
+                entries = [f"app;dur={duration_ms:.1f}"]
+                entries.extend(_format_timing(name, dur, desc) for name, dur, desc in timings)
+                extra = [(b"server-timing", ", ".join(entries).encode("latin-1")), (b"x-request-id", request_id.encode("latin-1"))]
+                if profile_id:
+                    extra.append((b"x-profile-id", profile_id.encode("latin-1")))
+                message = {**message, "headers": [*message.get("headers", []), *extra]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            route = self._route_template(scope)
+            self.stats.record(f"{scope['method']} {route}", duration_ms, status_code)
+
+            if sampler is not None:
+                profile = sampler.stop()
+                # File write: keep it off the event loop
+                await asyncio.to_thread(self.profile_store.save, profile_id, profile, {
+                    "kind": "request",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "request_id": request_id,
+                })
+
+            logger.info(
+                "request",
+                extra={"fields": {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 2),
+                }}
+            )
+            _timings_var.reset(timings_token)
+            request_id_var.reset(request_token)
+
+    def _route_template(self, scope) -> str:
+        """Route path template (e.g. ``/api/exports/{job_id}/status``) of a handled request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            path = next(
+                (route.path for route in getattr(scope.get("app"), "routes", []) if getattr(route, "endpoint", None) is endpoint),
+                "unmatched"
+            )
+            self._route_paths[endpoint] = path
+        return path
+
+
+def _format_timing(name: str, duration_ms: float, description: Optional[str]) -> str:
+    """Format one Server-Timing entry."""
+    entry = f"{name};dur={duration_ms:.1f}"
+    if description:
+        entry += f';desc="{description}"'
+    return entry
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not ordered:
+        return 0.0
+    return ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
@@ -10,7 +10,7 @@ function App() {
       <Routes>
         <Route element={<Layout />}>
           <Route path="/" element={<PresentationsList />} />
-          <Route path="/view/:id" element={<PresentationViewer />} />
+          <Route path="/view/*" element={<PresentationViewer />} />
         </Route>
       </Routes>
     </Router>
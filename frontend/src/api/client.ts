@@ -1,6 +1,10 @@
-import type { Presentation } from '../types';
+import type { Presentation, PresentationListParams, PresentationPage } from '../types';
 import { metadata as vedunyaMetadata } from '../presentations/vedunya-product';
 
+// Set VITE_USE_API=true to read presentations from the backend instead of static data
+const USE_API = import.meta.env.VITE_USE_API === 'true';
+const API_BASE = import.meta.env.VITE_API_URL ?? '/api';
+
 // Static presentations data - no backend required
 const PRESENTATIONS: Presentation[] = [
   {
@@ -13,13 +17,65 @@ const PRESENTATIONS: Presentation[] = [
   },
 ];
 
+/**
+ * Apply list params to static data, mirroring the backend query semantics
+ */
+function queryStatic(params: PresentationListParams): PresentationPage {
+  const { limit = 50, cursor, sort = 'updated', order = 'desc', title, description } = params;
+
+  const sortKey = (p: Presentation): string =>
+    sort === 'title' ? p.title.toLowerCase() : sort === 'created' ? p.createdAt : p.updatedAt;
+
+  const matches = PRESENTATIONS
+    .filter(p => !title || p.title.toLowerCase().includes(title.toLowerCase()))
+    .filter(p => !description || (p.description ?? '').toLowerCase().includes(description.toLowerCase()))
+    .sort((a, b) => {
+      const cmp = sortKey(a).localeCompare(sortKey(b)) || a.id.localeCompare(b.id);
+      return order === 'desc' ? -cmp : cmp;
+    });
+
+  // Static cursors are plain offsets
+  const start = cursor ? Number(cursor) : 0;
+  const end = start + limit;
+
+  return {
+    presentations: matches.slice(start, end),
+    total: matches.length,
+    nextCursor: end < matches.length ? String(end) : null,
+  };
+}
+
 class ApiClient {
-  async fetchPresentations(): Promise<Presentation[]> {
-    // Return static data instead of API call
-    return Promise.resolve(PRESENTATIONS);
+  async fetchPresentations(params: PresentationListParams = {}): Promise<PresentationPage> {
+    if (!USE_API) {
+      return Promise.resolve(queryStatic(params));
+    }
+
+    const query = new URLSearchParams();
+    if (params.limit) query.set('limit', String(params.limit));
+    if (params.cursor) query.set('cursor', params.cursor);
+    if (params.sort) query.set('sort', params.sort);
+    if (params.order) query.set('order', params.order);
+    if (params.title) query.set('title', params.title);
+    if (params.description) query.set('description', params.description);
+    if (params.fields?.length) query.set('fields', params.fields.join(','));
+
+    const response = await fetch(`${API_BASE}/presentations?${query}`);
+    if (!response.ok) {
+      throw new Error(`Failed to load presentations (${response.status})`);
+    }
+    return response.json();
   }
 
   async fetchPresentation(id: string): Promise<Presentation> {
+    if (USE_API) {
+      const response = await fetch(`${API_BASE}/presentations/${encodeURIComponent(id)}`);
+      if (!response.ok) {
+        throw new Error(`Presentation '${id}' not found`);
+      }
+      return response.json();
+    }
+
     const presentation = PRESENTATIONS.find(p => p.id === id);
     if (!presentation) {
       throw new Error(`Presentation '${id}' not found`);
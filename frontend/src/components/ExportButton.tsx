@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { exportToPdf } from '../utils/pdfExport';
+import { loadPresentationModule } from '../utils/presentationLoader';
 import type { ExportButtonProps } from '../types';
 import '../styles/export.css';
 
@@ -13,7 +14,7 @@ export function ExportButton({ presentationId, onExportComplete }: ExportButtonP
   useEffect(() => {
     const loadMetadata = async () => {
       try {
-        const module = await import(`../presentations/${presentationId}.tsx`);
+        const module = await loadPresentationModule(presentationId);
         if (module.metadata?.slideCount) {
           setSlideCount(module.metadata.slideCount);
         }
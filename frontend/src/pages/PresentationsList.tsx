@@ -6,13 +6,20 @@ import { ErrorMessage } from '../components/ErrorMessage';
 import { EmptyState } from '../components/EmptyState';
 import { SlidePreview } from '../components/SlidePreview';
 import { Slide1TitlePreview } from '../presentations/vedunya-preview';
-import type { Presentation } from '../types';
+import type { Presentation, PresentationListParams } from '../types';
 import '../styles/presentations-list.css';
 
+// Only request what the cards render
+const PAGE_SIZE = 24;
+const CARD_FIELDS: PresentationListParams['fields'] = ['id', 'title', 'description', 'slideCount', 'updatedAt'];
+
 export function PresentationsList() {
   const navigate = useNavigate();
   const [presentations, setPresentations] = useState<Presentation[]>([]);
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const loadPresentations = async () => {
@@ -20,8 +27,10 @@ export function PresentationsList() {
     setError(null);
 
     try {
-      const data = await apiClient.fetchPresentations();
-      setPresentations(data);
+      const page = await apiClient.fetchPresentations({ limit: PAGE_SIZE, fields: CARD_FIELDS });
+      setPresentations(page.presentations);
+      setTotal(page.total);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to load presentations');
     } finally {
@@ -29,6 +38,26 @@ export function PresentationsList() {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+
+    try {
+      const page = await apiClient.fetchPresentations({
+        limit: PAGE_SIZE,
+        cursor: nextCursor,
+        fields: CARD_FIELDS,
+      });
+      setPresentations(prev => [...prev, ...page.presentations]);
+      setTotal(page.total);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to load presentations');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     loadPresentations();
   }, []);
@@ -72,7 +101,7 @@ export function PresentationsList() {
     <div className="presentations-container">
       <div className="presentations-header">
         <h1>Presentations</h1>
-        <p className="presentations-count">{presentations.length} presentation{presentations.length !== 1 ? 's' : ''}</p>
+        <p className="presentations-count">{total} presentation{total !== 1 ? 's' : ''}</p>
       </div>
 
       <div className="presentations-grid">
@@ -120,6 +149,18 @@ export function PresentationsList() {
           </div>
         ))}
       </div>
+
+      {nextCursor && (
+        <div className="presentations-more">
+          <button
+            className="presentations-more-btn"
+            onClick={loadMore}
+            disabled={loadingMore}
+          >
+            {loadingMore ? 'Loading...' : `Load more (${presentations.length} of ${total})`}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
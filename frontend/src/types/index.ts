@@ -9,6 +9,22 @@ export interface Presentation {
   updatedAt: string;
 }
 
+export interface PresentationPage {
+  presentations: Presentation[];
+  total: number;
+  nextCursor: string | null;
+}
+
+export interface PresentationListParams {
+  limit?: number;
+  cursor?: string | null;
+  sort?: 'updated' | 'created' | 'title';
+  order?: 'asc' | 'desc';
+  title?: string;
+  description?: string;
+  fields?: Array<keyof Presentation>;
+}
+
 export interface PresentationMetadata {
   id: string;
   title: string;
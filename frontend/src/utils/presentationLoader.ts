@@ -0,0 +1,34 @@
+/**
+ * Lazy loaders for presentation modules, keyed by presentation id.
+ * Ids mirror the backend scanner: path under src/presentations without
+ * extension, e.g. "vedunya-product" or "team-a/quarterly".
+ */
+import type { ComponentType } from 'react';
+
+export interface PresentationModule {
+  default: ComponentType;
+  metadata?: {
+    slideCount?: number;
+    [key: string]: unknown;
+  };
+}
+
+const modules = import.meta.glob<PresentationModule>('../presentations/**/*.tsx');
+
+const loaders: Record<string, () => Promise<PresentationModule>> = Object.fromEntries(
+  Object.entries(modules).map(([path, loader]) => [
+    path.replace('../presentations/', '').replace(/\.tsx$/, ''),
+    loader,
+  ])
+);
+
+/**
+ * Load a presentation module by id
+ */
+export function loadPresentationModule(id: string): Promise<PresentationModule> {
+  const loader = loaders[id];
+  if (!loader) {
+    return Promise.reject(new Error(`Presentation "${id}" not found`));
+  }
+  return loader();
+}
@@ -2,10 +2,12 @@ import { useEffect, useState, useCallback, lazy, Suspense } from 'react';
 import { useParams, useSearchParams, useNavigate } from 'react-router-dom';
 import { LoadingSpinner } from '../components/LoadingSpinner';
 import { ErrorMessage } from '../components/ErrorMessage';
+import { loadPresentationModule } from '../utils/presentationLoader';
 import '../styles/viewer.css';
 
 export function PresentationViewer() {
-  const { id } = useParams<{ id: string }>();
+  // Splat route: namespaced ids such as "team-a/quarterly" contain slashes
+  const { '*': id } = useParams();
   const [searchParams] = useSearchParams();
   const navigate = useNavigate();
   const printMode = searchParams.get('print') === 'true';
@@ -27,12 +29,7 @@ export function PresentationViewer() {
 
         // Lazy load presentation component
         // This improves initial page load time
-        const LazyPresentation = lazy(() =>
-          import(`../presentations/${id}.tsx`)
-            .catch(() => {
-              throw new Error(`Presentation "${id}" not found`);
-            })
-        );
+        const LazyPresentation = lazy(() => loadPresentationModule(id));
 
         setPresentationComponent(() => LazyPresentation);
       } catch (err) {
@@ -0,0 +1,8 @@
+"""
+Shared pytest configuration for backend tests.
+"""
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
@@ -0,0 +1,130 @@
+"""
+Helpers shared by backend tests: synthetic decks and PDFs, export services
+and an in-process API client.
+"""
+import asyncio
+import io
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from playwright.async_api import async_playwright
+from pypdf import PdfWriter
+
+from models.schemas import ExportJob, ExportJobStatus
+from routes.exports import router as exports_router, set_export_service
+from services.export_service import ExportService
+
+
+DECK_TEMPLATE = """import {{ Deck, Slide }} from 'spectacle';
+
+export const metadata = {{
+  id: '{id}',
+  title: '{title}',
+  description: '{description}',
+  createdAt: '{created}',
+  updatedAt: '{updated}',
+}};
+
+export default function Presentation() {{
+  return (
+    <Deck>
+{slides}
+    </Deck>
+  );
+}}
+"""
+
+
+def write_deck(
+    directory: Path,
+    index: int,
+    title: str = "Deck",
+    description: str = "Demo",
+    slides: int = 2,
+    name: str | None = None,
+    slide_text: str = "Text",
+) -> Path:
+    """Write a minimal Spectacle presentation file and return its path."""
+    stem = name or f"deck-{index}"
+    content = DECK_TEMPLATE.format(
+        id=stem,
+        title=title,
+        description=description,
+        created=f"2025-01-{index + 1:02d}",
+        updated=f"2025-02-{index + 1:02d}",
+        slides="\n".join(f"      <Slide>{slide_text} {n + 1}</Slide>" for n in range(slides)),
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    file_path = directory / f"{stem}.tsx"
+    file_path.write_text(content, encoding="utf-8")
+    return file_path
+
+
+def blank_pdf(pages: int, width: float = 1440, height: float = 810) -> bytes:
+    """Build a PDF with blank pages (1920x1080 px = 1440x810 pt)."""
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=width, height=height)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def chromium_available() -> bool:
+    """Whether Playwright's Chromium can be launched (tests that render skip otherwise)."""
+    async def launch() -> None:
+        async with async_playwright() as playwright:
+            await (await playwright.chromium.launch()).close()
+
+    try:
+        asyncio.run(launch())
+    except Exception:
+        return False
+    return True
+
+
+def make_export_service(exports_dir: Path, service_class: type = ExportService, **kwargs) -> ExportService:
+    """Create an export service against a local viewer URL (kwargs go to the constructor)."""
+    return service_class("http://localhost:5173", str(exports_dir), **kwargs)
+
+
+def make_exports_app(service: ExportService, **kwargs) -> FastAPI:
+    """Create an application serving the exports API (kwargs go to set_export_service)."""
+    app = FastAPI()
+    app.include_router(exports_router)
+    set_export_service(service, **kwargs)
+    return app
+
+
+def run_export(service: ExportService, presentation_id: str, **kwargs) -> ExportJob:
+    """Enqueue an export and poll its status until the job finishes."""
+    async def export() -> ExportJob:
+        job = await service.create_export_job(presentation_id, **kwargs)
+        while job.status in (ExportJobStatus.PENDING, ExportJobStatus.PROCESSING):
+            await asyncio.sleep(0.01)
+            job = await service.get_job_status(job.job_id)
+        return job
+
+    return asyncio.run(export())
+
+
+class ApiClient:
+    """Minimal synchronous wrapper around an in-process ASGI client."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async def _request() -> httpx.Response:
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.request(method, url, **kwargs)
+
+        return asyncio.run(_request())
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
@@ -0,0 +1,76 @@
+"""
+Test admission of export requests: id validation, rate limits and load limits.
+"""
+import time
+
+from helpers import ApiClient, make_export_service, make_exports_app, write_deck
+from models.schemas import ExportJobStatus
+from services.admission import AdmissionPolicy, RateLimiter, TokenBucket
+from services.job_history import JobRecord
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+
+
+def make_client(tmp_path, rate_limiter=None, trust_proxy=False) -> ApiClient:
+    write_deck(tmp_path / "decks", 0)
+    service = make_export_service(tmp_path / "exports")
+    # One job already waiting: every request that gets past validation is
+    # rejected by admission, so no test starts a browser
+    service.jobs.add(JobRecord("export_queued", "deck-0", created_at=time.time(), status=ExportJobStatus.PENDING))
+    app = make_exports_app(
+        service,
+        index=PresentationIndex(PresentationScanner(str(tmp_path / "decks")), reconcile_interval=0),
+        rate_limiter=rate_limiter,
+        admission=AdmissionPolicy(max_queued=1, retry_after=7),
+        trust_proxy=trust_proxy,
+    )
+    return ApiClient(app)
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(rate=1.0, capacity=2, now=0.0)
+
+    assert bucket.take(0.0) == 0
+    assert bucket.take(0.0) == 0
+    assert bucket.take(0.0) == 1.0
+    assert bucket.take(0.5) == 0.5
+    assert bucket.take(1.0) == 0
+
+
+def test_rate_limiter_tracks_clients_separately():
+    limiter = RateLimiter(per_minute=60, burst=1, max_clients=2)
+
+    assert limiter.check("a", now=0.0) == 0
+    assert limiter.check("a", now=0.0) > 0
+    assert limiter.check("b", now=0.0) == 0
+    assert limiter.check("a", now=1.0) == 0
+
+    # Oldest client forgotten beyond max_clients: starts with a full bucket
+    limiter.check("c", now=1.0)
+    assert limiter.check("b", now=1.0) == 0
+
+
+def test_unknown_presentation_is_rejected(tmp_path):
+    client = make_client(tmp_path)
+
+    response = client.post("/api/exports/missing/export")
+    assert response.status_code == 404
+    assert "missing" in response.json()["detail"]
+
+
+def test_export_is_rejected_when_queue_is_full(tmp_path):
+    response = make_client(tmp_path).post("/api/exports/deck-0/export")
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "7"
+    assert "queue is full" in response.json()["detail"]
+
+
+def test_clients_are_rate_limited(tmp_path):
+    client = make_client(tmp_path, RateLimiter(per_minute=6, burst=1), trust_proxy=True)
+
+    assert client.post("/api/exports/missing/export", headers={"X-Real-IP": "10.0.0.1"}).status_code == 404
+    limited = client.post("/api/exports/missing/export", headers={"X-Real-IP": "10.0.0.1"})
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "10"
+    assert client.post("/api/exports/missing/export", headers={"X-Real-IP": "10.0.0.2"}).status_code == 404
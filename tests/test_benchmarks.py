@@ -0,0 +1,134 @@
+"""
+Test the offline benchmark suite: synthetic decks, stub viewer and result comparison.
+"""
+import asyncio
+import json
+import urllib.request
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from benchmarks.loadtest import format_steps, main as run_loadtest
+from benchmarks.processes import PROC, sample_tree
+from benchmarks.results import build_results, compare_results, metric
+from benchmarks.run import export_pdf, main as run_benchmarks
+from benchmarks.stats import percentile, summarize
+from benchmarks.stub_viewer import StubViewer
+from benchmarks.synthetic import generate_decks
+from services.presentation_scanner import PresentationScanner
+
+
+def test_synthetic_decks_feed_scanner(tmp_path):
+    generate_decks(tmp_path, files=6, slides=3, subdirs=2, html_decks=1)
+
+    presentations = asyncio.run(PresentationScanner(str(tmp_path)).scan_all())
+
+    assert len(presentations) == 7
+    assert all(p.slide_count == 3 for p in presentations)
+    assert {p.id for p in presentations} >= {"team-00/deck-00000", "team-01/deck-00001", "html-deck-000"}
+
+
+def test_stub_viewer_serves_slides_and_assets():
+    with StubViewer(slides=4, asset_kb=8, slides_for={"team-00/big": 12}) as viewer:
+        page = urllib.request.urlopen(f"{viewer.url}/view/team-00/big?print=true").read().decode()
+        bundle = urllib.request.urlopen(f"{viewer.url}/assets/bundle.js").read()
+
+    assert "spectacle-v7-slide" in page
+    assert "n <= 12" in page
+    assert len(bundle) == 8 * 1024
+    assert viewer.requests == 2
+
+
+def test_percentiles():
+    samples = [float(n) for n in range(1, 101)]
+
+    assert percentile(samples, 0.5) == 50
+    assert percentile(samples, 0.99) == 99
+    assert summarize(samples)["p95_ms"] == 95
+    assert summarize([])["p50_ms"] == 0.0
+
+
+def test_compare_flags_regressions():
+    baseline = build_results({
+        "api.list.p95_ms": metric(10, "ms"),
+        "api.list.rps": metric(1000, "rps"),
+        "api.list.errors": metric(0, "count"),
+        "index.snapshot_load_ms": metric(20, "ms"),
+    }, {})
+    current = build_results({
+        "api.list.p95_ms": metric(11, "ms"),
+        "api.list.rps": metric(700, "rps"),
+        "api.list.errors": metric(3, "count"),
+        "index.snapshot_load_ms": metric(10, "ms"),
+        "search.build_ms": metric(5, "ms"),
+    }, {})
+
+    rows = {row["metric"]: row for row in compare_results(baseline, current, tolerance=0.15)}
+
+    assert not rows["api.list.p95_ms"]["regression"]
+    assert rows["api.list.rps"]["regression"]
+    assert rows["api.list.errors"]["regression"]
+    assert not rows["index.snapshot_load_ms"]["regression"]
+    assert "search.build_ms" not in rows
+
+
+def test_scanner_and_api_suites_write_results(tmp_path):
+    output = tmp_path / "results.json"
+    args = [
+        "--suite", "scanner", "api",
+        "--files", "8", "--slides", "2", "--requests", "10", "--concurrency", "2",
+        "--workdir", str(tmp_path / "work"), "--output", str(output),
+    ]
+
+    assert run_benchmarks(args) == 0
+    results = json.loads(output.read_text())
+    assert results["meta"]["parameters"]["files"] == 8
+    assert results["metrics"]["scanner.scan_all_ms"]["better"] == "lower"
+    assert results["metrics"]["api.list.rps"]["better"] == "higher"
+    assert results["metrics"]["api.list_revalidate.errors"]["value"] == 0
+    assert results["metrics"]["api.detail.errors"]["value"] == 0
+
+    # Comparing a run with itself finds no regressions
+    assert run_benchmarks([*args, "--suite", "scanner", "--compare", str(output), "--tolerance", "100"]) == 0
+
+
+@pytest.mark.skipif(not PROC.is_dir(), reason="needs /proc")
+def test_process_tree_is_sampled():
+    sample = sample_tree()
+
+    assert sample.processes >= 1
+    assert sample.rss_bytes > 0
+    assert sample_tree(root_pid=2 ** 22 + 1).rss_bytes == 0
+
+
+def test_loadtest_reports_each_step(tmp_path):
+    output = tmp_path / "loadtest.json"
+    args = [
+        "--steps", "1", "2", "--jobs-per-worker", "1", "--presentations", "2", "--slides", "2",
+        "--asset-kb", "1", "--render-delay-ms", "0", "--workdir", str(tmp_path / "work"), "--output", str(output),
+    ]
+
+    exit_code = run_loadtest(args)
+
+    results = json.loads(output.read_text())
+    steps = results["steps"]
+    # Without Chromium every export fails and the ramp stops after the first step
+    assert exit_code == (0 if steps[0]["ok"] else 1)
+    assert all(step["ok"] + step["errors"] == step["jobs"] for step in steps)
+    assert steps[0]["rejected"] == 0
+    assert results["metrics"]["loadtest.c1.per_s"]["better"] == "higher"
+    assert results["metrics"]["loadtest.c1.p95_ms"]["better"] == "lower"
+    assert format_steps(steps).splitlines()[1].split()[0] == "1"
+
+
+def test_stuck_export_times_out():
+    app = FastAPI()
+    app.post("/api/exports/{presentation_id}/export", status_code=201)(lambda presentation_id: {"jobId": "export_a"})
+    app.get("/api/exports/{job_id}/status")(lambda job_id: {"job": {"status": "pending"}})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await export_pdf(client, "deck", timeout=0.1)
+
+    assert asyncio.run(run()) == "timed out after 0.1 s (pending)"
@@ -0,0 +1,97 @@
+"""
+Test capture and retrieval of diagnostics of failed or slow exports.
+"""
+import asyncio
+import json
+
+from fastapi import FastAPI
+
+from helpers import ApiClient, blank_pdf, make_export_service, run_export, write_deck
+from models.schemas import ExportJobStatus
+from routes.debug import router as debug_router, set_debug_state
+from services.diagnostics import DiagnosticsStore
+from services.export_service import SPECTACLE_RENDER_SETTINGS, ExportService
+from services.page_cache import PageCache, spectacle_page_keys
+from services.pdf_tools import split_pdf_pages
+from services.presentation_scanner import PresentationScanner
+from services.profiler import ProfileStore
+from services.telemetry import RouteStats
+
+
+TOKEN = "secret"
+
+
+class FailingExportService(ExportService):
+    """Fails every render after a named phase, without a browser."""
+
+    async def _export_spectacle(self, job, pdf_path, source=None) -> None:
+        with self._phase(job, "navigation"):
+            await asyncio.sleep(0.01)
+        raise RuntimeError("Timeout 30000ms exceeded waiting for networkidle")
+
+
+def test_failed_export_is_captured_and_served(tmp_path):
+    diagnostics = DiagnosticsStore(str(tmp_path / "diagnostics"))
+    service = make_export_service(tmp_path / "exports", FailingExportService, diagnostics=diagnostics)
+    app = FastAPI()
+    app.include_router(debug_router)
+    set_debug_state(RouteStats(), ProfileStore(str(tmp_path / "profiles")), TOKEN, service, diagnostics)
+    client = ApiClient(app)
+    headers = {"X-Profile-Token": TOKEN}
+
+    job = run_export(service, "deck")
+    assert job.status == ExportJobStatus.FAILED
+
+    listed = client.get("/api/debug/exports", headers=headers).json()["exports"]
+    assert [(entry["job_id"], entry["reason"]) for entry in listed] == [(job.job_id, "failed")]
+
+    capture = client.get(f"/api/debug/exports/{job.job_id}", headers=headers).json()
+    assert capture["status"] == "failed"
+    assert "networkidle" in capture["error"]
+    assert [phase["name"] for phase in capture["phases"]] == ["navigation"]
+    assert set(capture["files"]) == {"timings.json", "console.log"}
+
+    timings = client.get(f"/api/debug/exports/{job.job_id}/timings.json", headers=headers)
+    assert json.loads(timings.content)["job_id"] == job.job_id
+    assert client.get(f"/api/debug/exports/{job.job_id}/trace.zip", headers=headers).status_code == 404
+    assert client.get(f"/api/debug/exports/{job.job_id}/jobs.sqlite3", headers=headers).status_code == 404
+    assert client.get(f"/api/debug/exports/{job.job_id}").status_code == 403
+
+
+def test_fast_exports_are_discarded_and_captures_bounded(tmp_path):
+    decks = tmp_path / "decks"
+    write_deck(decks, 0)
+    diagnostics = DiagnosticsStore(str(tmp_path / "diagnostics"), max_jobs=2)
+
+    # Fully cached deck: succeeds quickly, nothing is kept
+    cache = PageCache(str(tmp_path / "cache"))
+    page = split_pdf_pages(blank_pdf(1))[0]
+    for key in spectacle_page_keys(decks / "deck-0.tsx", SPECTACLE_RENDER_SETTINGS):
+        cache.put(key, page)
+    service = ExportService(
+        "http://localhost:5173", str(tmp_path / "exports"),
+        scanner=PresentationScanner(str(decks)), page_cache=cache, diagnostics=diagnostics
+    )
+    assert run_export(service, "deck-0").status == ExportJobStatus.COMPLETED
+    assert diagnostics.list_captures() == []
+    assert not any((tmp_path / "diagnostics" / ".staging").iterdir())
+
+    failing = make_export_service(tmp_path / "exports", FailingExportService, diagnostics=diagnostics)
+    job_ids = [run_export(failing, "deck").job_id for _ in range(3)]
+    assert [entry["job_id"] for entry in diagnostics.list_captures()] == job_ids[:0:-1]
+
+
+def test_unsampled_exports_keep_console_and_timings(tmp_path):
+    diagnostics = DiagnosticsStore(str(tmp_path / "diagnostics"), sample_rate=0)
+    service = make_export_service(tmp_path / "exports", FailingExportService, diagnostics=diagnostics)
+
+    job = run_export(service, "deck")
+    assert job.status == ExportJobStatus.FAILED
+    capture = diagnostics.get(job.job_id)
+    assert capture["recorded"] is False
+    assert [phase["name"] for phase in capture["phases"]] == ["navigation"]
+    assert set(capture["files"]) == {"timings.json", "console.log"}
+
+    unsampled = diagnostics.begin("export_a")
+    assert not unsampled.record and not unsampled.snapshots
+    assert unsampled.context_options() == {}
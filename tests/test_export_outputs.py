@@ -0,0 +1,129 @@
+"""
+Test additional export outputs: request validation, persistence, downloads
+and rendering from one page load.
+"""
+import asyncio
+import time
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+from pypdf import PdfReader
+
+from benchmarks.stub_viewer import StubViewer
+from helpers import ApiClient, chromium_available, make_export_service, make_exports_app
+from models.schemas import ExportJob, ExportJobStatus, ExportOutput, ExportOutputFormat
+from services.export_outputs import output_filename, write_image_archive
+from services.export_service import ExportService, remove_job_files
+from services.job_history import JobRecord
+from services.job_store import JobStore
+
+
+OUTPUTS = [
+    ExportOutput(name="720p", width=1280, height=720),
+    ExportOutput(name="thumbs", format=ExportOutputFormat.PNG, scale=0.25),
+]
+
+
+def make_client(tmp_path) -> tuple[ApiClient, ExportService]:
+    service = make_export_service(tmp_path)
+    record = JobRecord(
+        "export_done", "deck", created_at=time.time(), status=ExportJobStatus.COMPLETED, outputs=OUTPUTS
+    )
+    service.jobs.add(record)
+    (tmp_path / "export_done.pdf").write_bytes(b"%PDF-1.4\n")
+    (tmp_path / output_filename("export_done", OUTPUTS[0])).write_bytes(b"%PDF-1.4\n720p")
+    write_image_archive([(2, b"png-2"), (3, b"png-3")], OUTPUTS[1], tmp_path / output_filename("export_done", OUTPUTS[1]))
+
+    return ApiClient(make_exports_app(service)), service
+
+
+def test_outputs_are_downloadable(tmp_path):
+    client, _service = make_client(tmp_path)
+
+    job = client.get("/api/exports/export_done/status").json()["job"]
+    assert [output["name"] for output in job["outputs"]] == ["720p", "thumbs"]
+
+    pdf = client.get("/api/exports/export_done/download/720p")
+    assert pdf.status_code == 200
+    assert pdf.content == b"%PDF-1.4\n720p"
+    assert 'filename="deck_720p.pdf"' in pdf.headers["content-disposition"]
+
+    images = client.get("/api/exports/export_done/download/thumbs")
+    assert images.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(tmp_path / "export_done.thumbs.zip")
+    assert archive.namelist() == ["slide-02.png", "slide-03.png"]
+
+    assert client.get("/api/exports/export_done/download/print").status_code == 404
+
+    remove_job_files(tmp_path, "export_done")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_output_requests_are_validated(tmp_path):
+    client, _service = make_client(tmp_path)
+
+    duplicate = {"outputs": [{"name": "a"}, {"name": "a", "format": "png"}]}
+    assert client.post("/api/exports/deck/export", json=duplicate).status_code == 400
+    assert client.post("/api/exports/deck/export", json={"outputs": [{"name": "../x"}]}).status_code == 422
+    assert client.post("/api/exports/deck/export", json={"outputs": [{"name": "a", "scale": 8}]}).status_code == 422
+    # PDFs are vector: a scale factor would silently change nothing
+    assert client.post("/api/exports/deck/export", json={"outputs": [{"name": "a", "scale": 2}]}).status_code == 422
+    assert client.post("/api/exports/deck/export", json={"outputs": [{"name": "a", "format": "gif"}]}).status_code == 422
+    # Images are capped at 8K: 7680x4320 at scale 2 would be a 15360 px wide screenshot
+    too_large = {"outputs": [{"name": "a", "format": "png", "width": 7680, "height": 4320, "scale": 2}]}
+    response = client.post("/api/exports/deck/export", json=too_large)
+    assert response.status_code == 422
+    assert "exceeds 7680x4320" in response.text
+    assert ExportOutput(name="a", format=ExportOutputFormat.PNG, scale=4, width=1920, height=1080)
+
+
+def test_outputs_survive_the_job_store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.enqueue(ExportJob(
+        job_id="export_a",
+        presentation_id="deck",
+        status=ExportJobStatus.PENDING,
+        created_at=datetime.now(timezone.utc),
+        outputs=OUTPUTS,
+    ))
+
+    claimed = store.claim("w1")
+    assert claimed.outputs == OUTPUTS
+    assert JobRecord.from_job(claimed).to_job().outputs == OUTPUTS
+
+
+@pytest.mark.skipif(not chromium_available(), reason="needs playwright install chromium")
+def test_outputs_are_rendered_from_one_page_load(tmp_path):
+    outputs = [
+        ExportOutput(name="720p", width=1280, height=720),
+        ExportOutput(name="thumbs", format=ExportOutputFormat.PNG, scale=0.25),
+    ]
+
+    async def run():
+        with StubViewer(slides=3) as viewer:
+            service = ExportService(viewer.url, str(tmp_path))
+            try:
+                job = await service.create_export_job("deck", outputs=outputs)
+                while job.status in (ExportJobStatus.PENDING, ExportJobStatus.PROCESSING):
+                    await asyncio.sleep(0.05)
+                    job = await service.get_job_status(job.job_id)
+            finally:
+                await service.close()
+        return job
+
+    job = asyncio.run(run())
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+
+    main = PdfReader(tmp_path / f"{job.job_id}.pdf")
+    small = PdfReader(tmp_path / output_filename(job.job_id, outputs[0]))
+    assert len(small.pages) == len(main.pages)
+    # CSS px are 0.75 pt
+    assert (float(small.pages[0].mediabox.width), float(small.pages[0].mediabox.height)) == (960, 540)
+    assert float(main.pages[0].mediabox.width) == 1440
+
+    archive = zipfile.ZipFile(tmp_path / output_filename(job.job_id, outputs[1]))
+    assert archive.namelist() == ["slide-01.png", "slide-02.png", "slide-03.png"]
+    png = archive.read("slide-01.png")
+    # PNG IHDR: width and height at bytes 16-24
+    assert (int.from_bytes(png[16:20], "big"), int.from_bytes(png[20:24], "big")) == (480, 270)
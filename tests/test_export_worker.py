@@ -0,0 +1,117 @@
+"""
+Test the shared export queue and out-of-process export workers.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from helpers import ApiClient, make_export_service, make_exports_app
+from models.schemas import ExportJob, ExportJobStatus
+from services.export_service import ExportService
+from services.export_worker import ExportWorker
+from services.job_history import JobRecord
+from services.job_store import JobStore
+
+
+def make_job(job_id: str, created: float) -> ExportJob:
+    return ExportJob(
+        job_id=job_id,
+        presentation_id="deck",
+        status=ExportJobStatus.PENDING,
+        progress=0,
+        created_at=datetime.fromtimestamp(created, timezone.utc),
+    )
+
+
+class InstantExportService(ExportService):
+    """Renders a placeholder PDF without a browser."""
+
+    async def process_job(self, job: JobRecord) -> None:
+        job.status = ExportJobStatus.PROCESSING
+        await asyncio.sleep(0.01)
+        (self.exports_dir / f"{job.job_id}.pdf").write_bytes(b"%PDF-1.4\n")
+        job.status = ExportJobStatus.COMPLETED
+        job.progress = 100
+        job.completed_at = time.time()
+
+
+def test_claim_is_fifo_and_exclusive(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.enqueue(make_job("export_b", 200))
+    store.enqueue(make_job("export_a", 100))
+
+    first = store.claim("w1")
+    second = store.claim("w2")
+
+    assert first.job_id == "export_a"
+    assert second.job_id == "export_b"
+    assert store.claim("w3") is None
+    assert store.get("export_a").status == ExportJobStatus.PROCESSING
+    assert store.count(ExportJobStatus.PENDING) == 0
+
+
+def test_stale_jobs_are_requeued(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.enqueue(make_job("export_a", 100))
+    store.claim("crashed-worker")
+
+    assert store.requeue_stale(max_silence=60) == 0
+    time.sleep(0.02)
+    assert store.requeue_stale(max_silence=0.01) == 1
+    assert store.claim("w2").job_id == "export_a"
+
+
+def test_api_only_enqueues_and_worker_renders(tmp_path):
+    store = JobStore(str(tmp_path / "exports" / "jobs.sqlite3"))
+    api_service = make_export_service(tmp_path / "exports", job_store=store)
+    client = ApiClient(make_exports_app(api_service))
+
+    created = client.post("/api/exports/team-a/deck/export").json()
+    job_id = created["jobId"]
+    assert client.get(f"/api/exports/{job_id}/status").json()["job"]["status"] == "pending"
+    assert len(api_service.jobs) == 0
+
+    worker = ExportWorker(
+        InstantExportService("http://localhost:5173", str(tmp_path / "exports")),
+        store,
+        concurrency=2,
+        poll_interval=0.01,
+        heartbeat_interval=0.01,
+    )
+
+    async def run_until_done() -> None:
+        stop = asyncio.Event()
+        runner = asyncio.create_task(worker.run(stop))
+        while store.get(job_id).status != ExportJobStatus.COMPLETED:
+            await asyncio.sleep(0.01)
+        assert store.live_workers(max_silence=60) == 1
+        stop.set()
+        await runner
+
+    asyncio.run(asyncio.wait_for(run_until_done(), timeout=10))
+    # A stopped worker no longer counts for readiness
+    assert store.live_workers(max_silence=60) == 0
+
+    job = client.get(f"/api/exports/{job_id}/status").json()["job"]
+    assert job["status"] == "completed"
+    assert job["progress"] == 100
+    assert job["presentationId"] == "team-a/deck"
+    download = client.get(f"/api/exports/{job_id}/download")
+    assert download.status_code == 200
+    assert download.content.startswith(b"%PDF")
+
+
+def test_worker_removes_expired_jobs(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    service = InstantExportService("http://localhost:5173", str(tmp_path))
+    job = make_job("export_old", 100)
+    store.enqueue(job)
+    record = JobRecord.from_job(job)
+    asyncio.run(service.process_job(record))
+    record.completed_at = 100
+    store.update(record.to_job())
+
+    asyncio.run(ExportWorker(service, store)._maintain())
+
+    assert store.get("export_old") is None
+    assert not (tmp_path / "export_old.pdf").exists()
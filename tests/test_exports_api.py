@@ -0,0 +1,95 @@
+"""
+Test export downloads and bulk / long-poll status queries.
+"""
+import asyncio
+import time
+
+import httpx
+
+from helpers import ApiClient, make_export_service, make_exports_app
+from models.schemas import ExportJobStatus
+from services.export_service import ExportService
+from services.job_history import JobRecord
+
+
+def make_service(tmp_path) -> ExportService:
+    service = make_export_service(tmp_path)
+    for job_id, status in (("export_done", ExportJobStatus.COMPLETED), ("export_busy", ExportJobStatus.PROCESSING)):
+        service.jobs.add(JobRecord(job_id, "team-a/deck", created_at=time.time(), status=status))
+    (tmp_path / "export_done.pdf").write_bytes(b"%PDF-1.4\n")
+    return service
+
+
+def make_client(tmp_path, accel_redirect_prefix=None) -> ApiClient:
+    return ApiClient(make_exports_app(make_service(tmp_path), accel_redirect_prefix=accel_redirect_prefix))
+
+
+def test_download_streams_file_by_default(tmp_path):
+    response = make_client(tmp_path).get("/api/exports/export_done/download")
+
+    assert response.status_code == 200
+    assert response.content == b"%PDF-1.4\n"
+    assert response.headers["content-disposition"] == 'attachment; filename="team-a_deck.pdf"'
+    assert "x-accel-redirect" not in response.headers
+
+
+def test_download_delegates_to_nginx(tmp_path):
+    client = make_client(tmp_path, accel_redirect_prefix="/internal/exports/")
+
+    response = client.get("/api/exports/export_done/download")
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/internal/exports/export_done.pdf"
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == 'attachment; filename="team-a_deck.pdf"'
+    assert response.content == b""
+
+    assert client.get("/api/exports/export_busy/download").status_code == 400
+    assert client.get("/api/exports/missing/download").status_code == 404
+
+
+def test_bulk_status(tmp_path):
+    client = make_client(tmp_path)
+
+    body = client.get("/api/exports/status", params={"ids": "export_busy,missing,export_done"}).json()
+    assert [job["jobId"] for job in body["jobs"]] == ["export_busy", "export_done"]
+    assert body["missing"] == ["missing"]
+
+    # Nothing changed: waiting returns the same version after the timeout
+    started = time.perf_counter()
+    again = client.get("/api/exports/status", params={"ids": "export_busy", "since": "x", "wait": "1s"}).json()
+    unchanged = client.get(
+        "/api/exports/status", params={"ids": "export_busy", "since": again["version"], "wait": "0.2s"}
+    ).json()
+    assert unchanged["version"] == again["version"]
+    assert time.perf_counter() - started >= 0.2
+
+    assert client.get("/api/exports/status", params={"ids": ""}).status_code == 400
+    assert client.get("/api/exports/status", params={"ids": "a", "wait": "soon"}).status_code == 400
+
+
+def test_long_poll_returns_on_change(tmp_path):
+    service = make_service(tmp_path)
+    app = make_exports_app(service)
+
+    async def scenario() -> tuple[dict, float]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            params = {"ids": "export_busy"}
+            version = (await client.get("/api/exports/status", params=params)).json()["version"]
+
+            async def finish() -> None:
+                await asyncio.sleep(0.1)
+                job = service.jobs.get("export_busy")
+                job.status = ExportJobStatus.COMPLETED
+                job.progress = 100
+                service._notify_change()
+
+            started = time.perf_counter()
+            changer = asyncio.create_task(finish())
+            response = await client.get("/api/exports/status", params={**params, "since": version, "wait": "30s"})
+            await changer
+            return response.json(), time.perf_counter() - started
+
+    body, elapsed = asyncio.run(scenario())
+    assert body["jobs"][0]["status"] == "completed"
+    assert elapsed < 5
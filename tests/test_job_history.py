@@ -0,0 +1,66 @@
+"""
+Test compact job records and the bounded history of finished jobs.
+"""
+import asyncio
+import time
+
+from helpers import make_export_service, run_export
+from models.schemas import ExportJobStatus
+from services.job_history import MAX_ERROR_LENGTH, JobHistory, JobRecord
+
+
+def test_record_converts_to_api_model():
+    record = JobRecord("export_a", "team-a/deck", created_at=100.0, slides="1-2")
+    assert not hasattr(record, "__dict__")
+
+    pending = record.to_job()
+    assert pending.status == ExportJobStatus.PENDING
+    assert pending.download_url is None
+    assert pending.created_at.timestamp() == 100.0
+
+    record.status = ExportJobStatus.COMPLETED
+    record.completed_at = 160.0
+    completed = record.to_job()
+    assert completed.download_url == "/api/exports/export_a/download"
+    assert completed.completed_at.timestamp() == 160.0
+
+    again = JobRecord.from_job(completed)
+    assert (again.status, again.completed_at, again.slides) == (ExportJobStatus.COMPLETED, 160.0, "1-2")
+
+    record.fail("x" * 10_000, 170.0)
+    assert record.status == ExportJobStatus.FAILED
+    assert len(record.error) == MAX_ERROR_LENGTH
+
+
+def test_history_keeps_active_and_recent_finished_jobs():
+    history = JobHistory(max_finished=2)
+    records = [JobRecord(f"export_{n}", "deck", created_at=n) for n in range(4)]
+    for record in records:
+        history.add(record)
+
+    dropped = []
+    for record in records[:3]:
+        record.status = ExportJobStatus.COMPLETED
+        dropped += history.finish(record.job_id)
+
+    assert [record.job_id for record in dropped] == ["export_0"]
+    assert "export_0" not in history
+    assert history.get("export_3") is records[3]  # still running: never dropped
+
+    usage = history.memory_usage()
+    assert (usage["active"], usage["finished"], usage["evicted"]) == (1, 2, 1)
+    assert usage["bytes"] > 0
+
+
+def test_service_drops_pdfs_of_forgotten_jobs(tmp_path):
+    service = make_export_service(tmp_path, history_size=1)
+
+    first = run_export(service, "missing-deck").job_id
+    (tmp_path / f"{first}.pdf").write_bytes(b"%PDF-1.4\n")
+    second = run_export(service, "missing-deck").job_id
+
+    assert asyncio.run(service.get_job_status(first)) is None
+    assert not (tmp_path / f"{first}.pdf").exists()
+    assert asyncio.run(service.get_job_status(second)).status == ExportJobStatus.FAILED
+    assert service.memory_usage()["finished"] == 1
+    assert time.time() - asyncio.run(service.get_job_status(second)).completed_at.timestamp() < 60
@@ -0,0 +1,247 @@
+"""
+Test slide page keys, the page cache and incremental export assembly.
+"""
+import asyncio
+import os
+
+import pytest
+from playwright.async_api import async_playwright
+from pypdf import PdfReader
+
+from helpers import blank_pdf, chromium_available, make_export_service, run_export, write_deck
+from models.schemas import ExportJobStatus
+from services.export_service import (
+    HTML_RENDER_SETTINGS,
+    SPECTACLE_RENDER_SETTINGS,
+    ExportService,
+    _printed_layout,
+    _printed_page_ranges,
+)
+from services.page_cache import PageCache, html_page_keys, spectacle_page_keys
+from services.pdf_tools import split_pdf_pages
+from services.presentation_scanner import PresentationScanner, list_html_slides
+from services.slide_selection import parse_slide_selection
+
+
+THEMED_DECK = """import { Deck, Slide } from 'spectacle';
+import { accent } from './theme';
+
+const brandColors = { mint: '#00FF9D' };
+
+export default function Presentation() {
+  return (
+    <Deck>
+      <Slide backgroundColor={brandColors.mint}>One</Slide>
+      <Slide>Two</Slide>
+      <Slide>Three</Slide>
+    </Deck>
+  );
+}
+"""
+
+
+def test_spectacle_keys_track_slides_and_shared_code(tmp_path):
+    source = tmp_path / "deck.tsx"
+    theme = tmp_path / "theme.ts"
+    theme.write_text("export const accent = '#fff';", encoding="utf-8")
+    source.write_text(THEMED_DECK, encoding="utf-8")
+    original = spectacle_page_keys(source, "a")
+    assert len(original) == 3
+
+    source.write_text(THEMED_DECK.replace("Two", "Two, edited"), encoding="utf-8")
+    edited = spectacle_page_keys(source, "a")
+    assert [old == new for old, new in zip(original, edited)] == [True, False, True]
+
+    source.write_text(THEMED_DECK.replace("'#00FF9D'", "'#00FF00'"), encoding="utf-8")
+    assert not set(spectacle_page_keys(source, "a")) & set(original)
+
+    source.write_text(THEMED_DECK, encoding="utf-8")
+    theme.write_text("export const accent = '#000';", encoding="utf-8")
+    assert not set(spectacle_page_keys(source, "a")) & set(original)
+
+    theme.write_text("export const accent = '#fff';", encoding="utf-8")
+    assert spectacle_page_keys(source, "a") == original
+    assert not set(spectacle_page_keys(source, "b")) & set(original)
+
+
+def test_html_keys_track_slides_and_assets(tmp_path):
+    deck = tmp_path / "deck"
+    deck.mkdir()
+    for n in (1, 2):
+        (deck / f"slide{n}.html").write_text(f"<p>Slide {n}</p>", encoding="utf-8")
+    style = deck / "style.css"
+    style.write_text("p {}", encoding="utf-8")
+    original = html_page_keys(deck, list_html_slides(deck), "a")
+
+    (deck / "slide2.html").write_text("<p>Edited</p>", encoding="utf-8")
+    edited = html_page_keys(deck, list_html_slides(deck), "a")
+    assert edited[0] == original[0] and edited[1] != original[1]
+
+    style.write_text("p { color: red }", encoding="utf-8")
+    assert not set(html_page_keys(deck, list_html_slides(deck), "a")) & set(edited)
+
+
+def test_cache_keeps_recently_used_pages(tmp_path):
+    cache = PageCache(str(tmp_path), max_pages=2)
+    keys = [f"{n:064x}" for n in range(3)]
+    for age, key in enumerate(keys):
+        cache.put(key, b"%PDF")
+        os.utime(tmp_path / f"{key}.pdf", (1000 + age, 1000 + age))
+
+    assert cache.get(keys[0]) == b"%PDF"  # now the most recently used
+    assert cache.prune() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+    assert cache.get("../etc/passwd") is None
+
+
+def test_fully_cached_decks_export_without_browser(tmp_path):
+    decks = tmp_path / "decks"
+    source = write_deck(decks, 0, slides=3)
+    html_deck = decks / "static"
+    html_deck.mkdir()
+    for n in (1, 2):
+        (html_deck / f"slide{n}.html").write_text(f"<p>Slide {n}</p>", encoding="utf-8")
+
+    cache = PageCache(str(tmp_path / "cache"))
+    page = split_pdf_pages(blank_pdf(1))[0]
+    for key in spectacle_page_keys(source, SPECTACLE_RENDER_SETTINGS):
+        cache.put(key, page)
+    for key in html_page_keys(html_deck, list_html_slides(html_deck), HTML_RENDER_SETTINGS):
+        cache.put(key, page)
+
+    # Chromium is never started: every page comes from the cache
+    service = ExportService(
+        "http://localhost:5173", str(tmp_path / "exports"),
+        scanner=PresentationScanner(str(decks)), page_cache=cache
+    )
+    for presentation_id, pages in (("deck-0", 3), ("static", 2)):
+        job = run_export(service, presentation_id)
+        assert job.status == ExportJobStatus.COMPLETED, job.error
+        assert len(PdfReader(service.get_pdf_path(job.job_id)).pages) == pages
+
+
+class PrintedDeck:
+    """Viewer page stand-in printing a deck whose slides span the given page counts."""
+
+    def __init__(self, spans: list[int]):
+        self.spans = spans
+        self.prints: list[dict] = []
+
+    async def new_page(self):
+        return self
+
+    async def close(self) -> None:
+        pass
+
+    async def goto(self, url, **kwargs) -> None:
+        pass
+
+    async def wait_for_selector(self, selector, **kwargs) -> None:
+        pass
+
+    async def emulate_media(self, **kwargs) -> None:
+        pass
+
+    async def evaluate(self, script, args=None):
+        return {"spans": self.spans, "pages": sum(self.spans)}
+
+    async def pdf(self, **options) -> bytes:
+        self.prints.append(options)
+        ranges = options.get("page_ranges")
+        return blank_pdf(len(parse_slide_selection(ranges)) if ranges else sum(self.spans))
+
+
+class PrintedDeckExportService(ExportService):
+    """Renders through a PrintedDeck instead of Chromium."""
+
+    def __init__(self, *args, deck: PrintedDeck, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deck = deck
+
+    async def _new_context(self, job, **options):
+        return self.deck
+
+
+def test_overflowing_deck_is_printed_once(tmp_path):
+    decks = tmp_path / "decks"
+    source = write_deck(decks, 0, slides=3)
+    cache = PageCache(str(tmp_path / "cache"))
+    deck = PrintedDeck([1, 2, 1])
+    service = make_export_service(
+        tmp_path / "exports", PrintedDeckExportService,
+        deck=deck, scanner=PresentationScanner(str(decks)), page_cache=cache
+    )
+
+    # Nothing cached: the full print does not split per slide, so it is written as is
+    job = run_export(service, "deck-0")
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+    assert len(deck.prints) == 1
+    assert len(PdfReader(service.get_pdf_path(job.job_id)).pages) == 4
+
+    # Partly cached: the layout check already rules the cache out
+    page = split_pdf_pages(blank_pdf(1))[0]
+    cache.put(spectacle_page_keys(source, SPECTACLE_RENDER_SETTINGS)[0], page)
+    deck.prints.clear()
+    job = run_export(service, "deck-0")
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+    assert len(deck.prints) == 1
+    assert len(PdfReader(service.get_pdf_path(job.job_id)).pages) == 4
+
+    # Slides 2-3 print to pages 2-4 (slide 2 spans two pages)
+    deck.prints.clear()
+    job = run_export(service, "deck-0", slides="2-3")
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+    assert [options.get("page_ranges") for options in deck.prints] == ["2-4"]
+
+
+def test_slide_selection_maps_to_printed_pages():
+    assert _printed_page_ranges([2, 3], [1, 1, 1], 3) == "2-3"
+    assert _printed_page_ranges([1, 3], [1, 2, 1], 4) == "1,4"
+    with pytest.raises(ValueError, match="does not exist"):
+        _printed_page_ranges([4], [1, 2, 1], 4)
+    with pytest.raises(ValueError, match="outside its slides"):
+        _printed_page_ranges([1], [1, 1], 3)
+
+
+def test_viewer_build_changes_page_keys(tmp_path, monkeypatch):
+    source = write_deck(tmp_path / "decks", 0)
+    builds = iter([b'<script src="/assets/index-a1.js">', b'<script src="/assets/index-b2.js">'])
+    monkeypatch.setattr("services.export_service._fetch", lambda url: next(builds))
+    service = make_export_service(tmp_path / "exports", fingerprint_viewer=True)
+
+    asyncio.run(service._refresh_render_version())
+    first = service._source_key(source)
+    asyncio.run(service._refresh_render_version())
+    assert service._source_key(source) == first
+
+    # After the TTL the redeployed viewer is fingerprinted again
+    service._fingerprinted_at = float("-inf")
+    asyncio.run(service._refresh_render_version())
+    assert service._source_key(source) != first
+
+    pinned = make_export_service(tmp_path / "exports", render_version="v1")
+    asyncio.run(pinned._refresh_render_version())
+    assert pinned.render_version == "v1"
+    assert pinned._source_key(source) not in (first, service._source_key(source))
+
+
+@pytest.mark.skipif(not chromium_available(), reason="needs playwright install chromium")
+def test_overflowing_slide_is_detected_before_partial_print():
+    slide = '<div class="spectacle-v7-slide" style="height: {}px; break-after: page"></div>'
+
+    async def layout(heights: list[int]) -> tuple[list[int], int]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            page = await browser.new_page(viewport={"width": 1920, "height": 1080})
+            await page.set_content(
+                "<style>body { margin: 0 }</style>" + "".join(slide.format(height) for height in heights)
+            )
+            try:
+                return await _printed_layout(page)
+            finally:
+                await browser.close()
+
+    assert asyncio.run(layout([1080, 1080, 1080])) == ([1, 1, 1], 3)
+    # An edited slide spilling onto a second page shifts every later page
+    assert asyncio.run(layout([1080, 1500, 1080])) == ([1, 2, 1], 4)
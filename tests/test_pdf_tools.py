@@ -0,0 +1,35 @@
+"""
+Test PDF stitching of per-slide renders.
+"""
+import io
+
+from pypdf import PdfReader
+
+from helpers import blank_pdf
+from services.pdf_tools import merge_pdf_pages, split_pdf_pages
+
+
+def test_merge_keeps_first_page_of_each_slide(tmp_path):
+    output = tmp_path / "deck.pdf"
+
+    count = merge_pdf_pages([blank_pdf(1), blank_pdf(2), blank_pdf(1)], output)
+
+    reader = PdfReader(output)
+    assert count == 3
+    assert len(reader.pages) == 3
+    assert float(reader.pages[0].mediabox.width) == 1440
+    assert not (tmp_path / "deck.tmp").exists()
+
+
+def test_merge_all_pages(tmp_path):
+    output = tmp_path / "deck.pdf"
+
+    assert merge_pdf_pages([blank_pdf(2), blank_pdf(3)], output, first_page_only=False) == 5
+
+
+def test_split_into_single_pages(tmp_path):
+    pages = split_pdf_pages(blank_pdf(3))
+
+    assert len(pages) == 3
+    assert all(len(PdfReader(io.BytesIO(page)).pages) == 1 for page in pages)
+    assert merge_pdf_pages(pages, tmp_path / "deck.pdf") == 3
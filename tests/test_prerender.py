@@ -0,0 +1,103 @@
+"""
+Test reuse of identical exports, speculative pre-rendering and queue priorities.
+"""
+import asyncio
+import os
+from datetime import datetime, timezone
+
+from helpers import ApiClient, blank_pdf, make_export_service, make_exports_app, run_export, write_deck
+from models.schemas import ExportJob, ExportJobStatus
+from services.export_service import ExportService
+from services.job_store import BACKGROUND_PRIORITY, JobStore
+from services.prerender import Prerenderer
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+
+
+class RecordingExportService(ExportService):
+    """Writes a placeholder PDF instead of rendering and records renders."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.renders: list[str] = []
+
+    async def _export_spectacle(self, job, pdf_path, source=None) -> None:
+        self.renders.append(job.presentation_id)
+        pdf_path.write_bytes(blank_pdf(1))
+
+
+def make_service(tmp_path, **kwargs) -> RecordingExportService:
+    return make_export_service(
+        tmp_path / "exports",
+        RecordingExportService,
+        scanner=PresentationScanner(str(tmp_path / "decks")),
+        reuse_exports=True,
+        **kwargs
+    )
+
+
+def edit(path, text: str) -> None:
+    path.write_text(path.read_text(encoding="utf-8").replace("Text 1", text), encoding="utf-8")
+    # Filesystems with coarse mtimes: make the change visible to fingerprints
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_export_of_unchanged_sources_is_reused(tmp_path):
+    source = write_deck(tmp_path / "decks", 0)
+    service = make_service(tmp_path)
+    client = ApiClient(make_exports_app(service))
+
+    first = run_export(service, "deck-0")
+    second = run_export(service, "deck-0")
+    assert first.status == second.status == ExportJobStatus.COMPLETED
+    assert service.renders == ["deck-0"]
+    assert service.get_pdf_path(second.job_id) is not None
+
+    response = client.get(f"/api/exports/{second.job_id}/status").json()["job"]
+    assert response["status"] == "completed"
+    assert "sourceKey" not in response and "source_key" not in response
+
+    edit(source, "Edited")
+    assert run_export(service, "deck-0").status == ExportJobStatus.COMPLETED
+    assert service.renders == ["deck-0", "deck-0"]
+
+
+def test_prerender_is_debounced(tmp_path):
+    source = write_deck(tmp_path / "decks", 0)
+    write_deck(tmp_path / "decks", 1)
+    service = make_service(tmp_path)
+    index = PresentationIndex(service.scanner, reconcile_interval=0)
+    prerenderer = Prerenderer(service, debounce=0.2, poll_interval=0.01)
+    index.add_listener(prerenderer.sync)
+
+    async def scenario() -> ExportJob:
+        await index.reconcile()  # baseline: nothing is pre-rendered
+        for text in ("First save", "Second save"):
+            edit(source, text)
+            await index.reconcile()
+            await asyncio.sleep(0.05)
+        while not prerenderer.rendered:
+            await asyncio.sleep(0.01)
+        job = await service.create_export_job("deck-0")
+        await prerenderer.stop()
+        return job
+
+    job = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+
+    assert service.renders == ["deck-0"]
+    assert job.status == ExportJobStatus.COMPLETED
+
+
+def test_background_jobs_are_claimed_last(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    for job_id, created, priority in (("prerender", 100, BACKGROUND_PRIORITY), ("user", 200, 0)):
+        store.enqueue(ExportJob(
+            job_id=job_id,
+            presentation_id="deck",
+            status=ExportJobStatus.PENDING,
+            created_at=datetime.fromtimestamp(created, timezone.utc),
+        ), priority)
+
+    assert store.claim("w1").job_id == "user"
+    assert store.claim("w1").job_id == "prerender"
@@ -0,0 +1,100 @@
+"""
+Test the persistent presentation metadata index.
+"""
+import asyncio
+import os
+
+from helpers import write_deck
+from services import presentation_index
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+
+
+def test_snapshot_round_trip_serves_without_rescan(tmp_path):
+    decks = tmp_path / "decks"
+    snapshot = tmp_path / "data" / "index.json"
+    write_deck(decks, 0, "First", name="first")
+    write_deck(decks / "team-a", 1, "Second", name="second")
+
+    first = PresentationIndex(PresentationScanner(str(decks)), str(snapshot))
+    asyncio.run(first.reconcile())
+    assert snapshot.exists()
+
+    async def restart():
+        index = PresentationIndex(PresentationScanner(str(decks)), str(snapshot), reconcile_interval=0)
+        await index.start()
+        ready_after_load = index.ready
+        presentations = await index.list_presentations()
+        await index.stop()
+        return ready_after_load, presentations
+
+    ready_after_load, presentations = asyncio.run(restart())
+
+    assert ready_after_load is True
+    assert sorted(p.id for p in presentations) == ["first", "team-a/second"]
+
+
+def test_reconcile_reparses_only_changed_files(tmp_path, monkeypatch):
+    first_path = write_deck(tmp_path, 0, "First", name="first")
+    write_deck(tmp_path, 1, "Second", name="second")
+    scanner = PresentationScanner(str(tmp_path))
+    index = PresentationIndex(scanner)
+    asyncio.run(index.reconcile())
+
+    parsed = []
+    original_parse = scanner.parse_file
+
+    async def tracking_parse(file_path):
+        parsed.append(file_path.name)
+        return await original_parse(file_path)
+
+    monkeypatch.setattr(scanner, "parse_file", tracking_parse)
+
+    assert asyncio.run(index.reconcile()) is False
+    assert parsed == []
+
+    write_deck(tmp_path, 0, "First (edited)", name="first")
+    stat = first_path.stat()
+    os.utime(first_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    version = index.version
+
+    assert asyncio.run(index.reconcile()) is True
+    assert parsed == ["first.tsx"]
+    assert index.version == version + 1
+    assert asyncio.run(index.get("first")).title == "First (edited)"
+
+
+def test_reconcile_drops_deleted_files(tmp_path):
+    write_deck(tmp_path, 0, name="first")
+    second = write_deck(tmp_path, 1, name="second")
+    index = PresentationIndex(PresentationScanner(str(tmp_path)))
+    asyncio.run(index.reconcile())
+
+    second.unlink()
+    asyncio.run(index.reconcile())
+
+    assert [p.id for p in asyncio.run(index.list_presentations())] == ["first"]
+
+
+def test_snapshot_for_other_root_is_ignored(tmp_path):
+    snapshot = tmp_path / "index.json"
+    write_deck(tmp_path / "a", 0, name="first")
+    (tmp_path / "b").mkdir()
+
+    asyncio.run(PresentationIndex(PresentationScanner(str(tmp_path / "a")), str(snapshot)).reconcile())
+
+    assert PresentationIndex(PresentationScanner(str(tmp_path / "b")), str(snapshot)).load() is False
+
+
+def test_lookup_of_new_files_respects_patterns(tmp_path, monkeypatch):
+    monkeypatch.setattr(presentation_index, "MISS_RECONCILE_INTERVAL", 0)
+    write_deck(tmp_path, 0, name="first")
+    index = PresentationIndex(PresentationScanner(str(tmp_path), exclude=["draft-*"]), reconcile_interval=0)
+    asyncio.run(index.reconcile())
+
+    write_deck(tmp_path, 1, name="second")
+    write_deck(tmp_path, 2, name="draft-third")
+
+    assert asyncio.run(index.get("second")).id == "second"
+    assert asyncio.run(index.get("draft-third")) is None
+    assert asyncio.run(index.scanner.get_by_id("draft-third")) is not None
@@ -0,0 +1,104 @@
+"""
+Test recursive, sharded presentation scanning.
+"""
+import asyncio
+
+from helpers import write_deck
+from models.schemas import DeckType
+from services.presentation_scanner import PresentationScanner
+
+
+def test_recursive_scan_namespaces_ids(tmp_path):
+    write_deck(tmp_path, 0, name="welcome")
+    write_deck(tmp_path / "team-a", 1, name="quarterly")
+    write_deck(tmp_path / "team-a" / "archive", 2, name="old")
+
+    scanner = PresentationScanner(str(tmp_path))
+    presentations = asyncio.run(scanner.scan_all())
+
+    assert sorted(p.id for p in presentations) == ["team-a/archive/old", "team-a/quarterly", "welcome"]
+    quarterly = next(p for p in presentations if p.id == "team-a/quarterly")
+    assert quarterly.file_path == "presentations/team-a/quarterly.tsx"
+
+
+def test_get_by_id_resolves_namespaced_ids(tmp_path):
+    write_deck(tmp_path / "team-a", 0, name="quarterly")
+    scanner = PresentationScanner(str(tmp_path))
+
+    assert asyncio.run(scanner.get_by_id("team-a/quarterly")).id == "team-a/quarterly"
+    assert asyncio.run(scanner.get_by_id("../quarterly")) is None
+    assert asyncio.run(scanner.get_by_id("quarterly")) is None
+
+
+def test_non_recursive_scan_only_reads_top_level(tmp_path):
+    write_deck(tmp_path, 0, name="welcome")
+    write_deck(tmp_path / "team-a", 1, name="quarterly")
+
+    scanner = PresentationScanner(str(tmp_path), recursive=False)
+
+    assert [p.id for p in asyncio.run(scanner.scan_all())] == ["welcome"]
+
+
+def test_include_and_exclude_patterns(tmp_path):
+    write_deck(tmp_path / "team-a", 0, name="quarterly")
+    write_deck(tmp_path / "team-b", 1, name="roadmap")
+    write_deck(tmp_path / "node_modules" / "pkg", 2, name="vendored")
+
+    included = PresentationScanner(str(tmp_path), include=["team-a/*"])
+    excluded = PresentationScanner(str(tmp_path), exclude=["team-b", "node_modules"])
+
+    assert [p.id for p in asyncio.run(included.scan_all())] == ["team-a/quarterly"]
+    assert [p.id for p in asyncio.run(excluded.scan_all())] == ["team-a/quarterly"]
+
+
+def test_scan_shards_yields_per_directory(tmp_path):
+    write_deck(tmp_path, 0, name="welcome")
+    write_deck(tmp_path / "team-a", 1, name="quarterly")
+    write_deck(tmp_path / "team-a", 2, name="roadmap")
+
+    async def collect():
+        return [(shard, sorted(p.id for p in items)) async for shard, items in scanner.scan_shards()]
+
+    scanner = PresentationScanner(str(tmp_path))
+
+    assert asyncio.run(collect()) == [
+        ("", ["welcome"]),
+        ("team-a", ["team-a/quarterly", "team-a/roadmap"]),
+    ]
+
+
+def write_html_deck(directory, slides=3, title="Статичная презентация"):
+    """Write a static slideN.html deck with an images/ folder."""
+    (directory / "images").mkdir(parents=True)
+    (directory / "images" / "logo.png").write_bytes(b"png")
+    for n in range(1, slides + 1):
+        (directory / f"slide{n}.html").write_text(f"<title>{title}</title><p>Слайд {n}</p>", encoding="utf-8")
+
+
+def test_html_decks_are_found_in_tree_and_static_dir(tmp_path):
+    write_deck(tmp_path / "decks", 0, name="welcome")
+    write_html_deck(tmp_path / "decks" / "team-a" / "launch", slides=2)
+    write_html_deck(tmp_path / "public" / "Vedunya_presentation", slides=7)
+
+    scanner = PresentationScanner(str(tmp_path / "decks"), static_decks_dir=str(tmp_path / "public"))
+    presentations = {p.id: p for p in asyncio.run(scanner.scan_all())}
+
+    assert sorted(presentations) == ["Vedunya_presentation", "team-a/launch", "welcome"]
+    static = presentations["Vedunya_presentation"]
+    assert static.deck_type == DeckType.HTML
+    assert static.slide_count == 7
+    assert static.title == "Статичная презентация"
+    assert presentations["welcome"].deck_type == DeckType.SPECTACLE
+    assert scanner.get_file_path("Vedunya_presentation") == tmp_path / "public" / "Vedunya_presentation"
+    assert scanner.get_file_path("team-a/launch") == tmp_path / "decks" / "team-a" / "launch"
+
+
+def test_html_deck_fingerprint_tracks_slide_edits(tmp_path):
+    deck_dir = tmp_path / "deck"
+    write_html_deck(deck_dir, slides=2)
+    scanner = PresentationScanner(str(tmp_path))
+    before = scanner.fingerprint(deck_dir)
+
+    (deck_dir / "slide2.html").write_text("<p>Изменённый слайд с большим текстом</p>", encoding="utf-8")
+
+    assert scanner.fingerprint(deck_dir) != before
@@ -0,0 +1,143 @@
+"""
+Test presentations listing API: pagination, filters, sorting and projection.
+"""
+import asyncio
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from helpers import ApiClient, write_deck
+from routes.presentations import get_index, router as presentations_router, set_index, set_scanner
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+
+
+def make_client(presentations_dir: Path) -> ApiClient:
+    """Create a test client with the presentations router."""
+    app = FastAPI()
+    app.include_router(presentations_router)
+    scanner = PresentationScanner(str(presentations_dir))
+    set_scanner(scanner)
+    set_index(PresentationIndex(scanner))
+    return ApiClient(app)
+
+
+def test_cursor_pagination_walks_all_pages(tmp_path):
+    for i in range(5):
+        write_deck(tmp_path, i, f"Deck {i}", "Demo")
+    client = make_client(tmp_path)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "sort": "created", "order": "asc"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/presentations", params=params).json()
+        assert body["total"] == 5
+        seen.extend(p["id"] for p in body["presentations"])
+        cursor = body["nextCursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"deck-{i}" for i in range(5)]
+
+
+def test_default_sort_is_updated_descending(tmp_path):
+    for i in range(3):
+        write_deck(tmp_path, i, f"Deck {i}", "Demo")
+    client = make_client(tmp_path)
+
+    body = client.get("/api/presentations").json()
+
+    assert [p["id"] for p in body["presentations"]] == ["deck-2", "deck-1", "deck-0"]
+    assert body["nextCursor"] is None
+
+
+def test_filters_are_case_insensitive(tmp_path):
+    write_deck(tmp_path, 0, "Ведунья — Корпоративный ИИ", "Обзор продукта")
+    write_deck(tmp_path, 1, "Quarterly report", "Finance numbers")
+    client = make_client(tmp_path)
+
+    by_title = client.get("/api/presentations", params={"title": "ведунья"}).json()
+    by_description = client.get("/api/presentations", params={"description": "FINANCE"}).json()
+
+    assert [p["id"] for p in by_title["presentations"]] == ["deck-0"]
+    assert by_title["total"] == 1
+    assert [p["id"] for p in by_description["presentations"]] == ["deck-1"]
+
+
+def test_fields_projection(tmp_path):
+    write_deck(tmp_path, 0, "Deck", "Demo", slides=3)
+    client = make_client(tmp_path)
+
+    body = client.get("/api/presentations", params={"fields": "title,slideCount"}).json()
+
+    assert body["presentations"] == [{"id": "deck-0", "title": "Deck", "slideCount": 3}]
+
+
+def test_invalid_fields_and_cursor_return_400(tmp_path):
+    write_deck(tmp_path, 0, "Deck", "Demo")
+    client = make_client(tmp_path)
+
+    assert client.get("/api/presentations", params={"fields": "nope"}).status_code == 400
+    assert client.get("/api/presentations", params={"cursor": "garbage"}).status_code == 400
+
+
+def test_stream_and_detail_for_namespaced_presentations(tmp_path):
+    write_deck(tmp_path, 0, "Welcome", name="welcome")
+    write_deck(tmp_path / "team-a", 1, "Quarterly", name="quarterly")
+    client = make_client(tmp_path)
+
+    stream = client.get("/api/presentations/stream")
+    lines = [line for line in stream.text.splitlines() if line]
+    detail = client.get("/api/presentations/team-a/quarterly")
+
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    assert len(lines) == 2
+    assert detail.status_code == 200
+    assert detail.json()["title"] == "Quarterly"
+
+
+def test_list_supports_etag_revalidation(tmp_path):
+    write_deck(tmp_path, 0, "Deck", "Demo")
+    client = make_client(tmp_path)
+
+    first = client.get("/api/presentations")
+    etag = first.headers["etag"]
+    second = client.get("/api/presentations", headers={"If-None-Match": etag})
+    detail = client.get("/api/presentations/deck-0")
+    detail_revalidated = client.get("/api/presentations/deck-0", headers={"If-None-Match": detail.headers["etag"]})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert detail_revalidated.status_code == 304
+
+
+def test_large_list_is_served_gzip_compressed(tmp_path):
+    for i in range(20):
+        write_deck(tmp_path, i, f"Deck {i}", "A fairly long description to make the body compressible")
+    client = make_client(tmp_path)
+
+    response = client.get("/api/presentations", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/api/presentations", headers={"Accept-Encoding": "identity"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["total"] == 20
+    assert "content-encoding" not in identity.headers
+    assert identity.json() == response.json()
+
+
+def test_etag_changes_when_catalog_changes(tmp_path):
+    write_deck(tmp_path, 0, "Deck", "Demo")
+    client = make_client(tmp_path)
+    etag = client.get("/api/presentations").headers["etag"]
+
+    write_deck(tmp_path, 1, "Another", "Demo")
+    asyncio.run(get_index().reconcile())
+    response = client.get("/api/presentations", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+    assert response.headers["etag"] != etag
@@ -0,0 +1,103 @@
+"""
+Test component readiness tracking, startup warm-up and the readiness endpoint.
+"""
+import asyncio
+
+import config
+import main
+from helpers import ApiClient, write_deck
+from models.schemas import ComponentState
+from services.export_service import ExportService
+from services.job_store import JobStore
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+from services.readiness import ReadinessTracker
+from services.search_index import SearchIndex
+
+
+async def fail() -> None:
+    raise RuntimeError("Executable doesn't exist\nmore details")
+
+
+def test_tracker_states():
+    tracker = ReadinessTracker()
+    tracker.reset(["index", "renderer"])
+    assert tracker.report().status == "starting"
+
+    assert asyncio.run(tracker.check("index", asyncio.sleep(0)))
+    tracker.skip("renderer", "disabled")
+    report = tracker.report()
+    assert report.status == "ready"
+    assert report.components["index"].duration_ms is not None
+    assert report.components["renderer"].state == ComponentState.SKIPPED
+
+    assert not asyncio.run(tracker.check("renderer", fail()))
+    report = tracker.report()
+    assert report.status == "failed"
+    assert report.components["renderer"].detail == "Executable doesn't exist"
+
+
+def test_warm_up_primes_indexes(tmp_path, monkeypatch):
+    write_deck(tmp_path / "decks", 0, title="Quarterly", slide_text="выручка")
+    index = PresentationIndex(PresentationScanner(str(tmp_path / "decks")))
+    search = SearchIndex()
+    export_service = ExportService("http://localhost:5173", str(tmp_path / "exports"))
+    monkeypatch.setattr(config, "EXPORT_WARMUP", False)
+
+    main.readiness.reset(["index", "search", "renderer"])
+    asyncio.run(main.warm_up(index, search, export_service))
+
+    assert main.readiness.ready
+    assert index.ready
+    assert search.search("выручка")[1] == 1
+
+
+def test_ready_endpoint_reports_components():
+    client = ApiClient(main.app)
+
+    main.readiness.reset(["index", "renderer"])
+    response = client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.json()["components"]["renderer"] == {"state": "pending", "detail": None, "durationMs": None}
+
+    asyncio.run(main.readiness.check("index", asyncio.sleep(0)))
+    main.readiness.skip("renderer")
+    response = client.get("/api/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    # Liveness is independent of warm-up
+    assert client.get("/api/health").status_code == 200
+
+
+def test_failed_warm_up_is_retried():
+    tracker = ReadinessTracker()
+    tracker.reset(["renderer"])
+    attempts = []
+
+    async def flaky() -> None:
+        attempts.append(tracker.report().status)
+        if len(attempts) < 3:
+            raise RuntimeError("Browser closed")
+
+    asyncio.run(tracker.retry("renderer", flaky, delay=0.01))
+
+    assert attempts == ["starting", "failed", "failed"]
+    assert tracker.ready
+
+
+def test_external_queue_readiness_follows_worker_heartbeats(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    tracker = ReadinessTracker()
+    tracker.reset(["renderer"])
+
+    assert not asyncio.run(tracker.check("renderer", main.check_export_workers(store)))
+    assert "No export worker" in tracker.report().components["renderer"].detail
+
+    store.worker_heartbeat("host:1", concurrency=2)
+    assert asyncio.run(tracker.check("renderer", main.check_export_workers(store)))
+    assert tracker.report().components["renderer"].detail == "1 export worker(s) alive"
+    assert store.live_workers(max_silence=-1) == 0
+
+    store.remove_worker("host:1")
+    assert store.live_workers(max_silence=60) == 0
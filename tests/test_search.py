@@ -0,0 +1,150 @@
+"""
+Test full-text search: tokenization, ranking, updates and the search API.
+"""
+import asyncio
+import os
+
+from fastapi import FastAPI
+
+from helpers import ApiClient, write_deck
+from routes.search import router as search_router, set_search_index
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+from services.search_index import SearchIndex
+from services.slide_text import extract_html_text, extract_tsx_slide_texts, tokenize
+
+
+def build(tmp_path, static_dir=None):
+    """Build a presentation index and a synced search index."""
+    scanner = PresentationScanner(str(tmp_path / "decks"), static_decks_dir=str(static_dir) if static_dir else None)
+    index = PresentationIndex(scanner)
+    search = SearchIndex()
+    index.add_listener(search.sync)
+    asyncio.run(index.reconcile())
+    return index, search
+
+
+def test_tokenize_folds_cyrillic_case_and_yo():
+    assert tokenize("ЁЛКА Ведунья — ИИ, ФЗ-152") == ["елка", "ведунья", "ии", "фз", "152"]
+
+
+def test_tsx_slide_text_skips_code_and_keeps_text_props():
+    source = """
+    const Intro = () => (
+      <Slide backgroundColor={colors.dark}>
+        {/* hidden comment */}
+        <h1 style={{ fontSize: 48 }}>Безопасность данных</h1>
+        <FeatureCard title="Контроль доступа" icon={<LockIcon size={20} />} />
+      </Slide>
+    );
+    """
+
+    assert extract_tsx_slide_texts(source) == ["Безопасность данных Контроль доступа"]
+
+
+def test_html_text_ignores_scripts_and_styles():
+    title, text = extract_html_text(
+        "<html><head><title>Ведунья</title><style>body{}</style></head>"
+        "<body><script>var x = 1;</script><h1>Привет</h1></body></html>"
+    )
+
+    assert title == "Ведунья"
+    assert text == "Привет"
+
+
+def test_ranks_title_matches_above_slide_matches(tmp_path):
+    write_deck(tmp_path / "decks", 0, "Отчёт по безопасности", name="title-hit")
+    write_deck(tmp_path / "decks", 1, "Квартальный обзор", name="slide-hit", slide_text="безопасность")
+    _index, search = build(tmp_path)
+
+    hits, total = search.search("БЕЗОПАСНОСТ")
+
+    assert total == 2
+    assert [hit.presentation.id for hit in hits] == ["title-hit", "slide-hit"]
+    assert hits[1].slide == 1
+
+
+def test_all_terms_must_match(tmp_path):
+    write_deck(tmp_path / "decks", 0, "Ведунья продукт", name="a")
+    write_deck(tmp_path / "decks", 1, "Ведунья финансы", name="b")
+    _index, search = build(tmp_path)
+
+    hits, total = search.search("ведунья финансы")
+
+    assert total == 1
+    assert hits[0].presentation.id == "b"
+
+
+def test_index_updates_when_files_change(tmp_path):
+    deck = write_deck(tmp_path / "decks", 0, "Старое название", name="deck")
+    index, search = build(tmp_path)
+
+    write_deck(tmp_path / "decks", 0, "Новое название", name="deck")
+    stat = deck.stat()
+    os.utime(deck, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    asyncio.run(index.reconcile())
+
+    assert search.search("старое")[1] == 0
+    assert search.search("новое")[1] == 1
+
+    deck.unlink()
+    asyncio.run(index.reconcile())
+
+    assert search.search("название")[1] == 0
+
+
+def test_duplicate_ids_index_the_first_source(tmp_path):
+    write_deck(tmp_path / "decks", 0, "First", name="a", slide_text="alpha")
+    duplicate = write_deck(tmp_path / "decks", 1, "Second", name="b", slide_text="beta")
+    duplicate.write_text(duplicate.read_text(encoding="utf-8").replace("id: 'b'", "id: 'a'"), encoding="utf-8")
+    index, search = build(tmp_path)
+
+    assert search.search("beta")[1] == 0
+    assert search.search("alpha")[0][0].presentation.title == "First"
+
+    duplicate.unlink()
+    asyncio.run(index.reconcile())
+
+    assert [p.id for p in asyncio.run(index.list_presentations())] == ["a"]
+    assert search.search("alpha")[1] == 1
+    assert search._total_length == search.documents["a"].length
+
+
+def test_static_html_decks_are_indexed(tmp_path):
+    (tmp_path / "decks").mkdir()
+    deck_dir = tmp_path / "public" / "static-deck"
+    deck_dir.mkdir(parents=True)
+    (deck_dir / "slide1.html").write_text("<title>Статичная</title><p>Первый</p>", encoding="utf-8")
+    (deck_dir / "slide2.html").write_text("<title>Статичная</title><p>Облачные модели</p>", encoding="utf-8")
+    _index, search = build(tmp_path, static_dir=tmp_path / "public")
+
+    hits, _total = search.search("облачные")
+
+    assert hits[0].presentation.id == "static-deck"
+    assert hits[0].presentation.title == "Статичная"
+    assert hits[0].slide == 2
+
+
+def test_search_endpoint(tmp_path):
+    write_deck(tmp_path / "decks", 0, "Ведунья — Корпоративный ИИ", name="vedunya")
+    index = PresentationIndex(PresentationScanner(str(tmp_path / "decks")))
+    search = SearchIndex()
+    index.add_listener(search.sync)
+    set_search_index(search, index)
+    app = FastAPI()
+    app.include_router(search_router)
+    client = ApiClient(app)
+
+    body = client.get("/api/search", params={"q": "корпоративный"}).json()
+
+    assert body["total"] == 1
+    assert body["results"][0]["presentation"]["id"] == "vedunya"
+    assert client.get("/api/search").status_code == 422
+
+
+def test_russian_inflections_match_by_stem(tmp_path):
+    write_deck(tmp_path / "decks", 0, "Рост эффективности", name="deck", slide_text="презентация")
+    _index, search = build(tmp_path)
+
+    assert search.search("эффективность")[1] == 1
+    assert search.search("презентации")[1] == 1
@@ -0,0 +1,77 @@
+"""
+Test slide selection parsing and partial exports.
+"""
+import asyncio
+
+import pytest
+from pypdf import PdfReader
+
+from helpers import ApiClient, blank_pdf, make_export_service, make_exports_app, run_export, write_deck
+from models.schemas import ExportJobStatus
+from services.export_service import SPECTACLE_RENDER_SETTINGS, ExportService
+from services.page_cache import PageCache, spectacle_page_keys
+from services.pdf_tools import split_pdf_pages
+from services.presentation_index import PresentationIndex
+from services.presentation_scanner import PresentationScanner
+from services.slide_selection import format_slide_selection, parse_slide_selection
+
+
+def test_parse_and_format_selection():
+    assert parse_slide_selection(None) is None
+    assert parse_slide_selection(" ") is None
+    assert parse_slide_selection("5, 1-3,2") == [1, 2, 3, 5]
+    assert parse_slide_selection([3, 1, 3]) == [1, 3]
+    assert format_slide_selection([1, 2, 3, 5, 7, 8]) == "1-3,5,7-8"
+
+    for invalid in ("0", "3-1", "1-", "a", "1,,2", "1-5000"):
+        with pytest.raises(ValueError):
+            parse_slide_selection(invalid)
+
+
+def make_service(tmp_path, slides: int = 3) -> ExportService:
+    decks = tmp_path / "decks"
+    source = write_deck(decks, 0, slides=slides)
+    cache = PageCache(str(tmp_path / "cache"))
+    page = split_pdf_pages(blank_pdf(1))[0]
+    # Only slides 2 and 3 are cached: exporting them needs no browser
+    for key in spectacle_page_keys(source, SPECTACLE_RENDER_SETTINGS)[1:]:
+        cache.put(key, page)
+
+    return make_export_service(tmp_path / "exports", scanner=PresentationScanner(str(decks)), page_cache=cache)
+
+
+def test_partial_export_uses_cached_pages(tmp_path):
+    service = make_service(tmp_path)
+
+    job = run_export(service, "deck-0", slides="2-3")
+    assert job.status == ExportJobStatus.COMPLETED, job.error
+    reader = PdfReader(service.get_pdf_path(job.job_id))
+    assert len(reader.pages) == 2
+    assert reader.metadata.title == "deck-0 (slides 2-3)"
+
+    job = run_export(service, "deck-0", slides="4")
+    assert job.status == ExportJobStatus.FAILED
+    assert "does not exist" in job.error
+
+
+def test_export_api_validates_and_marks_selection(tmp_path):
+    service = make_service(tmp_path)
+    index = PresentationIndex(PresentationScanner(str(tmp_path / "decks")), reconcile_interval=0)
+    app = make_exports_app(service, index=index)
+    client = ApiClient(app)
+
+    assert client.post("/api/exports/deck-0/export", json={"slides": "3-1"}).status_code == 400
+    out_of_range = client.post("/api/exports/deck-0/export", json={"slides": "2-4"})
+    assert out_of_range.status_code == 422
+    assert "has 3 slides" in out_of_range.json()["detail"]
+    assert len(service.jobs) == 0
+
+    response = client.post("/api/exports/deck-0/export", json={"slides": [3, 2]})
+    assert response.status_code == 201
+    job_id = response.json()["jobId"]
+    assert response.json()["slides"] == "2-3"
+
+    asyncio.run(service.process_job(service.jobs.get(job_id)))
+    download = client.get(f"/api/exports/{job_id}/download")
+    assert download.status_code == 200
+    assert 'filename="deck-0_slides-2-3.pdf"' in download.headers["content-disposition"]
@@ -0,0 +1,119 @@
+"""
+Test request timing, route statistics, structured logs and on-demand profiling.
+"""
+import asyncio
+import json
+import logging
+import time
+
+from fastapi import FastAPI
+
+from helpers import ApiClient, make_export_service, make_exports_app
+from routes.debug import router as debug_router, set_debug_state
+from services.job_store import JobStore
+from services.profiler import ProfileStore, StackSampler
+from services.telemetry import JsonFormatter, RouteStats, TimingMiddleware, job_id_var, timed
+
+
+def make_app(tmp_path, token=None) -> tuple[FastAPI, RouteStats, ProfileStore]:
+    stats = RouteStats()
+    profiles = ProfileStore(str(tmp_path / "profiles"))
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}")
+    async def get_item(item_id: str) -> dict:
+        with timed("lookup"):
+            time.sleep(0.02)
+        return {"id": item_id}
+
+    app.include_router(debug_router)
+    app.add_middleware(TimingMiddleware, stats=stats, profile_store=profiles, profiling_token=token)
+    set_debug_state(stats, profiles, token)
+    return app, stats, profiles
+
+
+def test_server_timing_and_route_stats(tmp_path):
+    app, stats, _ = make_app(tmp_path)
+    client = ApiClient(app)
+
+    response = client.get("/api/items/a", headers={"X-Request-ID": "req-1"})
+    client.get("/api/items/b")
+    client.get("/missing")
+
+    assert response.headers["x-request-id"] == "req-1"
+    timing = response.headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    assert "lookup;dur=" in timing
+    assert "x-profile-id" not in response.headers
+
+    snapshot = stats.snapshot()
+    assert snapshot["GET /api/items/{item_id}"]["count"] == 2
+    assert snapshot["GET /api/items/{item_id}"]["p50_ms"] >= 20
+    assert snapshot["GET unmatched"]["count"] == 1
+
+
+def test_debug_endpoints_require_token(tmp_path):
+    disabled = ApiClient(make_app(tmp_path)[0])
+    assert disabled.get("/api/debug/timings").status_code == 404
+
+    client = ApiClient(make_app(tmp_path, token="secret")[0])
+    assert client.get("/api/debug/timings").status_code == 403
+    assert client.get("/api/debug/timings", headers={"X-Profile-Token": "wrong"}).status_code == 403
+    assert client.get("/api/debug/timings", headers={"X-Profile-Token": "secret"}).status_code == 200
+
+
+def test_request_profile_is_captured(tmp_path):
+    app, _, profiles = make_app(tmp_path, token="secret")
+    client = ApiClient(app)
+
+    ignored = client.get("/api/items/a", headers={"X-Profile-Token": "wrong"})
+    assert "x-profile-id" not in ignored.headers
+
+    response = client.get("/api/items/a", headers={"X-Profile-Token": "secret", "X-Request-ID": "abc"})
+    assert response.headers["x-profile-id"] == "request_abc"
+
+    listed = client.get("/api/debug/profiles", headers={"X-Profile-Token": "secret"}).json()["profiles"]
+    assert [entry["id"] for entry in listed] == ["request_abc"]
+    folded = client.get("/api/debug/profiles/request_abc", headers={"X-Profile-Token": "secret"}).text
+    assert "# path: /api/items/a" in folded
+    assert "get_item" in folded
+
+
+def test_profile_store_keeps_newest(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=2)
+    sampler = StackSampler(interval=0.001).start()
+    time.sleep(0.01)
+    profile = sampler.stop()
+
+    for n in range(3):
+        store.save(f"p{n}", profile, {"kind": "test"})
+        time.sleep(0.01)
+
+    assert {entry["id"] for entry in store.list_profiles()} == {"p1", "p2"}
+    assert store.get("../p1") is None
+
+
+def test_profiled_export_requires_token(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    service = make_export_service(tmp_path, job_store=store)
+    client = ApiClient(make_exports_app(service, profiling_token="secret"))
+
+    assert client.post("/api/exports/deck/export", json={"profile": True}).status_code == 403
+
+    created = client.post("/api/exports/deck/export", json={"profile": True}, headers={"X-Profile-Token": "secret"})
+    assert created.status_code == 201
+    assert store.get(created.json()["jobId"]).profiled
+
+
+def test_json_log_lines_carry_job_id():
+    record = logging.LogRecord("services.export_service", logging.INFO, __file__, 1, "export finished", None, None)
+    record.fields = {"status": "completed"}
+
+    async def format_in_job() -> str:
+        job_id_var.set("export_abc")
+        return JsonFormatter().format(record)
+
+    entry = json.loads(asyncio.run(format_in_job()))
+    assert entry["msg"] == "export finished"
+    assert entry["job_id"] == "export_abc"
+    assert entry["status"] == "completed"